@@ -1,5 +1,8 @@
 """CLI entry point for combat simulator with batch simulation support."""
 
+import heapq
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -7,34 +10,78 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.cli.batch_args import parse_batch_args
-from src.io.creature_loader import CreatureLoader
-from src.simulation.simulator import run_combat
-from src.simulation.monte_carlo import MonteCarloSimulator
-from src.simulation.batch_runner import BatchRunner
+from src.simulation.simulator import format_side_shape, run_combat
 from src.agents.heuristic import HeuristicAgent
 from src.analysis.difficulty import calculate_difficulty_rating
 from src.simulation.victory import get_winner
 
 
-def _single_combat_difficulty_and_notes(final_state, creatures):
+def _team_names(creatures):
+    """Split creature names into (party, enemies) in a single pass."""
+    party, enemies = [], []
+    for c in creatures.values():
+        if c.team == "party":
+            party.append(c.name)
+        elif c.team == "enemy":
+            enemies.append(c.name)
+    return party, enemies
+
+
+@dataclass
+class _CombatSummary:
+    """End-of-combat view of both sides, collected in one sweep of the final state."""
+
+    winner: str | None
+    rounds: int
+    party: list  # sorted by name
+    enemies: list  # sorted by name
+    party_alive: int
+    enemies_alive: int
+    party_fallen: list[str]  # in creature load order
+    enemy_fallen: list[str]
+
+
+def _summarize(final_state) -> _CombatSummary:
+    """Walk the frozen final creature snapshot once and collect everything the report needs."""
+    sides = {"party": ([], []), "enemy": ([], [])}
+    for c in final_state.freeze():
+        side = sides.get(c.team)
+        if side is None:
+            continue
+        members, fallen = side
+        members.append(c)
+        if c.current_hp <= 0:
+            fallen.append(c.name)
+    (party, party_fallen), (enemies, enemy_fallen) = sides["party"], sides["enemy"]
+    party.sort(key=lambda c: c.name)
+    enemies.sort(key=lambda c: c.name)
+    party_alive = len(party) - len(party_fallen)
+    enemies_alive = len(enemies) - len(enemy_fallen)
+    return _CombatSummary(
+        winner=get_winner(final_state),
+        rounds=final_state.round,
+        party=party,
+        enemies=enemies,
+        party_alive=party_alive,
+        enemies_alive=enemies_alive,
+        party_fallen=party_fallen,
+        enemy_fallen=enemy_fallen,
+    )
+
+
+def _single_combat_difficulty_and_notes(summary: _CombatSummary):
     """Compute difficulty rating and short notes for a single combat.
 
     Args:
-        final_state: CombatState at end of combat
-        creatures: Original creature dict (for names/teams)
+        summary: End-of-combat summary from _summarize
 
     Returns:
         Tuple of (difficulty_str, notes_str)
     """
-    winner = get_winner(final_state)
-    rounds = final_state.round
-    party = [c for c in final_state.creatures.values() if c.team == "party"]
-    enemies = [c for c in final_state.creatures.values() if c.team == "enemy"]
-    party_size = len(party)
-    party_alive = sum(1 for c in party if c.current_hp > 0)
-    party_down = party_size - party_alive
-    enemies_alive = sum(1 for c in enemies if c.current_hp > 0)
-    tpk = party_alive == 0
+    winner = summary.winner
+    rounds = summary.rounds
+    party_size = len(summary.party)
+    tpk = not summary.party_alive
     win_rate = 1.0 if winner == "party" else 0.0
     tpk_risk = 1.0 if tpk else 0.0
 
@@ -54,9 +101,11 @@ def _single_combat_difficulty_and_notes(final_state, creatures):
     else:
         outcome = "No clear winner"
     notes = [f"{outcome} in {rounds} round(s)."]
-    if party_down > 0:
-        notes.append(f"Party: {party_down} down, {party_alive} standing.")
-    if enemies_alive == 0 and enemies:
+    if summary.party_fallen:
+        party_alive = summary.party_alive
+        notes.append(f"Party: {party_size - party_alive} down, {party_alive} standing.")
+    enemies_alive = summary.enemies_alive
+    if enemies_alive == 0 and summary.enemies:
         notes.append("All enemies defeated.")
     elif enemies_alive > 0:
         notes.append(f"Enemies: {enemies_alive} still standing.")
@@ -64,64 +113,40 @@ def _single_combat_difficulty_and_notes(final_state, creatures):
     return difficulty, notes_str
 
 
-def _format_final_shape(final_state) -> str:
+def _format_final_shape(summary: _CombatSummary) -> str:
     """Return final shape of party and enemies (name, HP, AC, position) for end-of-combat stats."""
-    party = sorted(
-        [c for c in final_state.creatures.values() if c.team == "party"],
-        key=lambda c: c.name,
-    )
-    enemies = sorted(
-        [c for c in final_state.creatures.values() if c.team == "enemy"],
-        key=lambda c: c.name,
-    )
     lines = []
-    if party:
-        parts = [f"{c.name} {c.current_hp}/{c.hp_max} HP AC {c.ac} {c.position}" for c in party]
-        lines.append("  Party: " + " | ".join(parts))
-    if enemies:
-        parts = [f"{c.name} {c.current_hp}/{c.hp_max} HP AC {c.ac} {c.position}" for c in enemies]
-        lines.append("  Enemies: " + " | ".join(parts))
+    if summary.party:
+        lines.append("  Party: " + format_side_shape(summary.party))
+    if summary.enemies:
+        lines.append("  Enemies: " + format_side_shape(summary.enemies))
     return "\n".join(lines) if lines else ""
 
 
-def _format_fallen(final_state) -> str:
+def _format_fallen(summary: _CombatSummary) -> str:
     """Return a Fallen report: who died (0 HP) by party and enemies."""
-    party_fallen = [c.name for c in final_state.creatures.values() if c.team == "party" and c.current_hp <= 0]
-    enemy_fallen = [c.name for c in final_state.creatures.values() if c.team == "enemy" and c.current_hp <= 0]
     lines = []
-    if party_fallen:
-        lines.append(f"  Party: {', '.join(party_fallen)}")
+    if summary.party_fallen:
+        lines.append(f"  Party: {', '.join(summary.party_fallen)}")
     else:
         lines.append("  Party: none")
-    if enemy_fallen:
-        lines.append(f"  Enemies: {', '.join(enemy_fallen)}")
+    if summary.enemy_fallen:
+        lines.append(f"  Enemies: {', '.join(summary.enemy_fallen)}")
     else:
         lines.append("  Enemies: none")
     return "\n".join(lines)
 
 
-def _format_combat_stats(logger, final_state) -> str:
+def _format_combat_stats(logger) -> str:
     """Build Damage Dealt summary: by side, then by weapon/spell/special attack (hits and damage)."""
-    stats = logger.get_combat_stats()
-    if not stats:
+    totals = logger.get_aggregated_stats()
+    if not totals:
         return ""
 
-    # Map creature name -> team from final state (names are stable)
-    name_to_team = {}
-    for c in final_state.creatures.values():
-        name_to_team[c.name] = c.team
-
-    # Aggregate by team then by (attack_name, is_aoe): count and total damage
-    by_team = {}  # team -> (attack_name, is_aoe) -> (count, damage)
-    for s in stats:
-        team = name_to_team.get(s["attacker_name"], "?")
-        if team not in by_team:
-            by_team[team] = {}
-        key = (s["attack_name"], s["is_aoe"])
-        if key not in by_team[team]:
-            by_team[team][key] = {"count": 0, "damage": 0}
-        by_team[team][key]["count"] += 1
-        by_team[team][key]["damage"] += s["damage"]
+    # Group the logger's running totals by team: (attack_name, is_aoe) -> (count, damage)
+    by_team = defaultdict(dict)
+    for (team, attack_name, is_aoe), agg in totals.items():
+        by_team[team][(attack_name, is_aoe)] = agg
 
     lines = []
     for team_label, team_key in [("Party", "party"), ("Enemies", "enemy")]:
@@ -129,8 +154,7 @@ def _format_combat_stats(logger, final_state) -> str:
             continue
         entries = []
         total_damage = 0
-        for (attack_name, is_aoe), agg in sorted(by_team[team_key].items(), key=lambda x: -x[1]["damage"]):
-            count, damage = agg["count"], agg["damage"]
+        for (attack_name, is_aoe), (count, damage) in sorted(by_team[team_key].items(), key=lambda x: -x[1][1]):
             total_damage += damage
             if is_aoe:
                 entries.append(f"{attack_name}: {count} cast(s), {damage} total damage")
@@ -148,29 +172,21 @@ def _format_deaths_by_element(logger) -> str:
 
     # Each record: (victim_name, victim_team, damage_type, killer_name, killer_team)
     # Group by killer side, then by killer name, then count kills and by damage type
-    by_side: dict[str, dict[str, dict[str, int]]] = {}  # killer_team -> killer_name -> damage_type -> count
+    by_side: dict[str, dict[str, Counter]] = defaultdict(lambda: defaultdict(Counter))  # killer_team -> killer_name -> damage_type -> count
     for _victim, _v_team, dtype, killer_name, killer_team in deaths:
         dtype = (dtype or "unknown").strip().lower() or "unknown"
-        k_team = killer_team or "?"
-        k_name = killer_name or "?"
-        if k_team not in by_side:
-            by_side[k_team] = {}
-        if k_name not in by_side[k_team]:
-            by_side[k_team][k_name] = {}
-        by_side[k_team][k_name][dtype] = by_side[k_team][k_name].get(dtype, 0) + 1
+        by_side[killer_team or "?"][killer_name or "?"][dtype] += 1
 
     lines = []
     for team_label, team_key in [("Party", "party"), ("Enemies", "enemy")]:
-        if team_key not in by_side or not by_side[team_key]:
+        if team_key not in by_side:
             continue
-        total_kills = sum(
-            sum(by_side[team_key][k].values())
-            for k in by_side[team_key]
-        )
+        kills_by_killer = {k: by_type.total() for k, by_type in by_side[team_key].items()}
+        total_kills = sum(kills_by_killer.values())
         entries = []
-        for killer_name in sorted(by_side[team_key].keys(), key=lambda k: -sum(by_side[team_key][k].values())):
+        for killer_name in sorted(kills_by_killer, key=lambda k: -kills_by_killer[k]):
             by_type = by_side[team_key][killer_name]
-            kills = sum(by_type.values())
+            kills = kills_by_killer[killer_name]
             type_parts = [f"{dt.capitalize()} {n}" for dt, n in sorted(by_type.items(), key=lambda x: -x[1])]
             kill_str = "kill" if kills == 1 else "kills"
             entries.append(f"{killer_name}: {kills} {kill_str} ({'; '.join(type_parts)})")
@@ -214,9 +230,10 @@ def run_single_combat(creatures, agent, seed=None, terrain=None, lang="en", paus
         lang: Language for strategy evolution and round labels ("en", "it")
         pause_between_rounds: If True, show round shape summary and wait for Enter each round (e.g. LLM mode)
     """
+    party_names, enemy_names = _team_names(creatures)
     print("Running single combat simulation...")
-    print(f"Party: {[c.name for c in creatures.values() if c.team == 'party']}")
-    print(f"Enemies: {[c.name for c in creatures.values() if c.team == 'enemy']}")
+    print(f"Party: {party_names}")
+    print(f"Enemies: {enemy_names}")
     if terrain:
         print(f"Terrain: {terrain.name}")
     print()
@@ -232,17 +249,18 @@ def run_single_combat(creatures, agent, seed=None, terrain=None, lang="en", paus
     )
 
     # Difficulty, notes, and how each side fought
-    difficulty, notes = _single_combat_difficulty_and_notes(final_state, creatures)
-    combat_stats_str = _format_combat_stats(logger, final_state)
+    summary = _summarize(final_state)
+    difficulty, notes = _single_combat_difficulty_and_notes(summary)
+    combat_stats_str = _format_combat_stats(logger)
     print("\n" + "="*60)
     print("Combat Complete!")
     print("="*60)
     print(f"\nMatch level: {difficulty}")
     print(f"Notes: {notes}")
     print("\nFinal shape:")
-    print(_format_final_shape(final_state))
+    print(_format_final_shape(summary))
     print("\nFallen:")
-    print(_format_fallen(final_state))
+    print(_format_fallen(summary))
     if combat_stats_str:
         print("\nDamage Dealt:")
         print(combat_stats_str)
@@ -252,7 +270,7 @@ def run_single_combat(creatures, agent, seed=None, terrain=None, lang="en", paus
         print(deaths_by_character)
 
 
-def run_batch_simulation(creatures, agent, runs, seed=None, verbose=True, terrain=None, lang="en"):
+def run_batch_simulation(creatures, agent, runs, seed=None, verbose=True, terrain=None, lang="en", jobs=1, precision=None, threads=False):
     """Run batch simulation with Monte Carlo engine.
 
     Args:
@@ -262,24 +280,45 @@ def run_batch_simulation(creatures, agent, runs, seed=None, verbose=True, terrai
         seed: Random seed for reproducibility
         verbose: Whether to print progress updates
         terrain: Optional Terrain for cover
+        jobs: Number of worker processes (1 = sequential)
+        precision: Target CI half-width; if set, stop early once reached (runs is then the maximum)
+        threads: Run the jobs as threads in this process (for I/O-bound LLM agents)
     """
+    # Batch-only machinery (statistics, NumPy) is imported here so single combats start faster
+    from src.simulation.monte_carlo import MonteCarloSimulator
+    from src.simulation.batch_runner import BatchRunner
+
+    party_names, enemy_names = _team_names(creatures)
     print("="*60)
     print("Batch Simulation")
     print("="*60)
-    print(f"Party: {[c.name for c in creatures.values() if c.team == 'party']}")
-    print(f"Enemies: {[c.name for c in creatures.values() if c.team == 'enemy']}")
-    print(f"Runs: {runs}")
+    print(f"Party: {party_names}")
+    print(f"Enemies: {enemy_names}")
+    if precision is None:
+        print(f"Runs: {runs}")
+    else:
+        print(f"Runs: up to {runs} (stop at ±{precision:.1%})")
     if seed is not None:
         print(f"Seed: {seed}")
+    if jobs > 1:
+        print(f"Jobs: {jobs}" + (" (threads)" if threads else ""))
     print()
 
-    # Initialize Monte Carlo simulator with specified runs
-    # Override adaptive sampling to run exactly the specified number
+    # Initialize Monte Carlo simulator. Without a precision target, override
+    # adaptive sampling to run exactly the specified number.
+    if precision is None:
+        min_runs = runs
+        target_precision = 0.01  # Will hit max_runs before this
+    else:
+        min_runs = min(runs, max(200, runs // 10))
+        target_precision = precision
     simulator = MonteCarloSimulator(
-        min_runs=runs,
+        min_runs=min_runs,
         max_runs=runs,
-        target_precision=0.01,  # Will hit max_runs before this
-        check_interval=100
+        target_precision=target_precision,
+        check_interval=100,
+        jobs=jobs,
+        threads=threads,
     )
 
     # Initialize batch runner
@@ -302,7 +341,7 @@ def run_batch_simulation(creatures, agent, runs, seed=None, verbose=True, terrai
     print(f"  TPK Rate: {results.tpk_count/results.total_runs:.1%} ({results.tpk_count} total)")
 
     # Calculate difficulty rating
-    party_size = sum(1 for c in creatures.values() if c.team == "party")
+    party_size = len(party_names)
     # Use average of wins and losses for avg_duration
     avg_duration = (results.avg_combat_duration_wins + results.avg_combat_duration_losses) / 2
     rating = calculate_difficulty_rating(
@@ -322,12 +361,10 @@ def run_batch_simulation(creatures, agent, runs, seed=None, verbose=True, terrai
     print(f"  Total: {results.damage_breakdown.total_damage}")
     if results.damage_breakdown.by_creature:
         print(f"  Top damage dealers:")
-        sorted_creatures = sorted(
-            results.damage_breakdown.by_creature.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
-        for name, damage in sorted_creatures:
+        top_creatures = heapq.nlargest(
+            5, results.damage_breakdown.by_creature.items(), key=lambda x: x[1]
+        )
+        for name, damage in top_creatures:
             print(f"    {name}: {damage}")
 
 
@@ -336,7 +373,9 @@ def main():
     # Parse arguments
     args = parse_batch_args()
 
-    # Initialize creature loader
+    # Initialize creature loader (imported after argument validation)
+    from src.io.creature_loader import CreatureLoader
+
     loader = CreatureLoader(
         cache_dir="data/creatures",
         srd_cache_dir="data/srd-cache"
@@ -394,7 +433,14 @@ def main():
                 "openrouter": "qwen/qwen-2.5-7b-instruct",
             }[args.provider]
 
-        agent = LLMAgent(provider=provider, model=model, role=args.role)
+        agent = LLMAgent(
+            provider=provider,
+            model=model,
+            role=args.role,
+            trivial_hp_threshold=args.trivial_hp,
+            deterministic=args.llm_deterministic,
+            verbose_prompts=not args.compact_prompts,
+        )
         print(f"Using LLM agent: {args.provider}/{model} (role: {args.role})")
     else:
         agent = HeuristicAgent()
@@ -435,6 +481,9 @@ def main():
             verbose=args.verbose,
             terrain=terrain,
             lang=args.lang,
+            jobs=args.jobs,
+            precision=args.precision,
+            threads=args.threads,
         )
 
     return 0
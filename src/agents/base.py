@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Protocol, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentAction:
     action_type: str
     attack_name: Optional[str] = None
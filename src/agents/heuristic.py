@@ -1,22 +1,87 @@
 """Heuristic combat agent with survival-oriented tactics."""
 
+from dataclasses import dataclass
+
 from .base import AgentAction
 from src.domain.distance import (
-    manhattan_distance,
+    parse_coordinate,
     move_toward,
     move_away_from,
-    distance_in_feet,
 )
 
 
-def _is_ranged_attack(atk) -> bool:
-    """True if attack is ranged (range in feet > typical melee reach)."""
-    return atk.range is not None and atk.range_feet > 10
+# From this many living enemies on, nearest-enemy search starts from the spatial grid
+_SPATIAL_SEARCH_MIN_ENEMIES = 12
+
+# Fixed turns shared by every creature (AgentAction is frozen, so one instance each is enough)
+_DEATH_SAVE = AgentAction(action_type="death_save", description="Death save", strategy_summary="Death save.")
+_STABLE = AgentAction(action_type="dodge", description="Stable", strategy_summary="Stable at 0 HP.")
+_NO_ENEMIES = AgentAction(action_type="dodge", description="No enemies", strategy_summary="No enemies; dodge.")
+_NO_ACTIONS = AgentAction(action_type="dodge", description="No actions", strategy_summary="No actions available; dodge.")
+_NO_ATTACKS = AgentAction(action_type="dodge", description="No attacks", strategy_summary="No usable attacks; dodge.")
+
 
+@dataclass(frozen=True, slots=True)
+class _AttackProfile:
+    """Per-creature attack metadata derived once from its actions list.
 
-def _is_melee_attack(atk) -> bool:
-    """True if attack is melee (has reach)."""
-    return atk.reach is not None
+    Attributes:
+        actions: The actions list this profile was built from (identity-checked on reuse)
+        has_melee: Any action has a melee attack
+        aoe_actions: AoE actions, in action order
+        best_action: First Multiattack, else first action with attacks (None if none)
+        ranged_only_action: First action whose attacks are all ranged
+        best_action_ranges: (range_feet, attack) for each attack of best_action
+        ranged_only_ranges: (range_feet, attack) for each attack of ranged_only_action
+        ranged_attack_ranges: (range_feet, attack) for best_action's ranged attacks
+        max_range_feet: Longest attack range (5 if no attacks)
+    """
+    actions: list
+    has_melee: bool
+    aoe_actions: tuple
+    best_action: object
+    ranged_only_action: object
+    best_action_ranges: tuple
+    ranged_only_ranges: tuple
+    ranged_attack_ranges: tuple
+    max_range_feet: int
+
+
+def _longest_in_range(ranges, dist: int):
+    """Return (range_feet, attack) with the longest range that reaches dist (first on ties), or (0, None)."""
+    best_range, best_attack = 0, None
+    for range_feet, atk in ranges:
+        if range_feet >= dist and (best_attack is None or range_feet > best_range):
+            best_range, best_attack = range_feet, atk
+    return best_range, best_attack
+
+
+def _build_attack_profile(actions: list) -> _AttackProfile:
+    """Scan a creature's actions once for everything choose_action needs."""
+    attack_actions = [a for a in actions if a.attacks]
+    best_action = next((a for a in attack_actions if a.is_multiattack), None)
+    if best_action is None and attack_actions:
+        best_action = attack_actions[0]
+    ranged_only_action = next(
+        (a for a in attack_actions if all(atk.is_ranged for atk in a.attacks)),
+        None,
+    )
+    best_attacks = best_action.attacks if best_action else []
+    return _AttackProfile(
+        actions=actions,
+        has_melee=any(atk.is_melee for act in actions for atk in act.attacks),
+        aoe_actions=tuple(a for a in actions if a.is_aoe),
+        best_action=best_action,
+        ranged_only_action=ranged_only_action,
+        best_action_ranges=tuple((atk.range_feet, atk) for atk in best_attacks),
+        ranged_only_ranges=tuple(
+            (atk.range_feet, atk) for atk in ranged_only_action.attacks
+        ) if ranged_only_action else (),
+        ranged_attack_ranges=tuple(
+            (atk.range_feet, atk) for atk in best_attacks if atk.is_ranged
+        ),
+        max_range_feet=max((atk.range_feet for act in actions for atk in act.attacks), default=5),
+    )
 
 
 class HeuristicAgent:
@@ -32,8 +97,38 @@ class HeuristicAgent:
       prefers ranged, kiting, or moving away.
     - Equipment: uses bow/ranged when fragile or out of melee; uses sword/melee
       when in reach and healthy. Prefers staying at range when low HP.
+
+    Attack metadata (best action, ranged-only action, ...) is computed once per
+    creature and reused while its actions list is unchanged.
     """
 
+    def __init__(self):
+        # creature_id -> profile; rebuilt when the creature's actions list is a different object
+        self._profiles: dict[str, _AttackProfile] = {}
+
+    def _attack_profile(self, creature_id: str, creature) -> _AttackProfile:
+        """Return the cached attack profile for a creature, rebuilding it if its actions changed."""
+        profile = self._profiles.get(creature_id)
+        if profile is None or profile.actions is not creature.actions:
+            profile = _build_attack_profile(creature.actions)
+            self._profiles[creature_id] = profile
+        return profile
+
+    @staticmethod
+    def _enemies_in_reach(state, creature, enemies, max_range_feet: int) -> list:
+        """Return the living enemies within one move plus the longest attack range.
+
+        Uses the state's spatial grid instead of measuring every enemy. If any
+        enemy is in reach, the nearest enemy overall is among them.
+        """
+        reach_squares = creature.speed_squares + max_range_feet // 5
+        enemy_by_id = dict(enemies)
+        return [
+            (cid, enemy_by_id[cid])
+            for cid in state.spatial.within(creature.position, reach_squares)
+            if cid in enemy_by_id
+        ]
+
     def choose_action(self, state, creature_id: str) -> AgentAction:
         """Choose action for a creature.
 
@@ -49,72 +144,60 @@ class HeuristicAgent:
         # If at 0 HP, handle death saves or stable state
         if creature.current_hp <= 0:
             if not creature.death_saves.stable:
-                return AgentAction(
-                    action_type="death_save",
-                    description="Death save",
-                    strategy_summary="Death save.",
-                )
-            return AgentAction(
-                action_type="dodge",
-                description="Stable",
-                strategy_summary="Stable at 0 HP.",
-            )
-
-        # Find living enemies and allies
-        enemies = [
-            (cid, c)
-            for cid, c in state.creatures.items()
-            if c.team != creature.team and c.current_hp > 0
-        ]
-        allies = [
-            (cid, c)
-            for cid, c in state.creatures.items()
-            if c.team == creature.team and c.current_hp > 0
-        ]
-
-        if not enemies:
-            return AgentAction(
-                action_type="dodge",
-                description="No enemies",
-                strategy_summary="No enemies; dodge.",
-            )
+                return _DEATH_SAVE
+            return _STABLE
+
+        # Living enemy/ally counts and HP come straight from the state's per-team index;
+        # the enemy list itself is only materialized for the nearest-enemy search
+        own_team = creature.team
+        living_ids = state.living_ids
+        enemy_teams = [team for team in living_ids if team != own_team]
+        enemy_count = sum(len(living_ids[team]) for team in enemy_teams)
+        enemy_hp_total = sum(state.living_hp[team] for team in enemy_teams)
+        ally_count = len(living_ids.get(own_team, ()))
+        ally_hp_total = state.living_hp.get(own_team, 0)
+
+        if not enemy_count:
+            return _NO_ENEMIES
 
         # Threat assessment for survival
-        enemy_hp_total = sum(c.current_hp for _, c in enemies)
-        ally_hp_total = sum(c.current_hp for _, c in allies)
-        outnumbered = len(enemies) > len(allies)
-        low_hp = creature.current_hp <= creature.hp_max // 4  # 25% or less
+        outnumbered = enemy_count > ally_count
+        low_hp = creature.current_hp <= creature.hp_quarter  # 25% or less
         outmatched_hp = ally_hp_total < enemy_hp_total * 0.6  # we're significantly behind
         prefer_survival = low_hp or (outnumbered and outmatched_hp)
 
-        # Find nearest enemy (primary target)
-        target_id, target = sorted(
-            enemies,
-            key=lambda e: (
-                manhattan_distance(creature.position, e[1].position),
-                e[1].current_hp,
-            ),
-        )[0]
-
-        # Determine attack profile (melee vs ranged) for this creature
-        has_melee_attacks = any(
-            _is_melee_attack(atk)
-            for act in creature.actions
-            for atk in (act.attacks or [])
-        )
+        # Find nearest enemy (primary target), lowest HP on ties; first seen wins full ties
+        profile = self._attack_profile(creature_id, creature)
+        enemies = [e for team in enemy_teams for e in state.living_members(team)]
+        candidates = enemies
+        if enemy_count >= _SPATIAL_SEARCH_MIN_ENEMIES:
+            candidates = (
+                self._enemies_in_reach(state, creature, enemies, profile.max_range_feet)
+                or enemies
+            )
+        coords = state.spatial.coords
+        px, py = coords[creature_id]
+        best_d = best_hp = None
+        for cid, c in candidates:
+            ex, ey = coords[cid]
+            d = abs(px - ex) + abs(py - ey)
+            if best_d is None or d < best_d or (d == best_d and c.current_hp < best_hp):
+                best_d, best_hp = d, c.current_hp
+                target_id, target = cid, c
+                tx, ty = ex, ey
 
         # Pure casters / archers with no melee should strongly prefer staying at range
-        if not has_melee_attacks:
+        if not profile.has_melee:
             prefer_survival = True
 
         # AoE: if creature has an AoE action and 2+ enemies, use it with center at first enemy,
         # but avoid blatantly suicidal centers (don't include self in blast if we can help it).
-        for act in creature.actions:
-            if getattr(act, "is_aoe", False) and len(enemies) >= 2:
+        for act in profile.aoe_actions:
+            if enemy_count >= 2:
                 center = target.position
                 # Skip AoE if we are inside the blast radius
                 if act.radius_squares is not None:
-                    if manhattan_distance(creature.position, center) <= act.radius_squares:
+                    if best_d <= act.radius_squares:
                         continue
                 return AgentAction(
                     action_type="aoe",
@@ -126,79 +209,41 @@ class HeuristicAgent:
         # Choose best action - prefer Multiattack over single attacks,
         # but ignore actions that have no attacks (e.g. pure AoE like Fireball).
         if not creature.actions:
-            return AgentAction(
-                action_type="dodge",
-                description="No actions",
-                strategy_summary="No actions available; dodge.",
-            )
+            return _NO_ACTIONS
 
-        attack_actions = [a for a in creature.actions if a.attacks]
+        best_action = profile.best_action
 
         # If there are no attack-based actions but there is an AoE, fall back to AoE
         # (still respecting the "don't hit self" safety).
-        if not attack_actions:
-            for act in creature.actions:
-                if getattr(act, "is_aoe", False):
-                    center = target.position
-                    if act.radius_squares is not None:
-                        if manhattan_distance(creature.position, center) <= act.radius_squares:
-                            continue
-                    return AgentAction(
-                        action_type="aoe",
-                        attack_name=act.name,
-                        target_position=center,
-                        strategy_summary=f"AoE {act.name} at {center} (no other attacks available).",
-                    )
-            return AgentAction(
-                action_type="dodge",
-                description="No attacks",
-                strategy_summary="No usable attacks; dodge.",
-            )
-
-        best_action = None
-        for action in attack_actions:
-            if action.is_multiattack:
-                best_action = action
-                break
         if best_action is None:
-            best_action = attack_actions[0]
-
-        dist = distance_in_feet(creature.position, target.position)
-        speed_squares = creature.speed // 5
-
-        # Build options: find a ranged-only action if any (for survival mode)
-        def action_has_ranged_only(act) -> bool:
-            if not act.attacks:
-                return False
-            return all(_is_ranged_attack(atk) for atk in act.attacks)
+            for act in profile.aoe_actions:
+                center = target.position
+                if act.radius_squares is not None:
+                    if best_d <= act.radius_squares:
+                        continue
+                return AgentAction(
+                    action_type="aoe",
+                    attack_name=act.name,
+                    target_position=center,
+                    strategy_summary=f"AoE {act.name} at {center} (no other attacks available).",
+                )
+            return _NO_ATTACKS
 
-        ranged_only_action = None
-        for action in creature.actions:
-            if action_has_ranged_only(action):
-                ranged_only_action = action
-                break
+        # Manhattan distance to the target was measured by the nearest-enemy scan
+        dist = best_d * 5
+        speed_squares = creature.speed_squares
 
-        melee_attacks = [atk for atk in best_action.attacks if _is_melee_attack(atk)]
-        ranged_attacks = [atk for atk in best_action.attacks if _is_ranged_attack(atk)]
+        ranged_only_action = profile.ranged_only_action
 
         # Survival mode: prefer ranged and kiting; consider moving away when badly outmatched
-        if prefer_survival and (ranged_attacks or ranged_only_action):
+        if prefer_survival and (profile.ranged_attack_ranges or ranged_only_action):
             # Prefer a ranged-only action (e.g. Shortbow) so we don't close into melee
             action_to_use = best_action
-            best_attack = None
-            if ranged_only_action:
-                for atk in ranged_only_action.attacks:
-                    if atk.range_feet >= dist and (
-                        best_attack is None or atk.range_feet > best_attack.range_feet
-                    ):
-                        best_attack = atk
-                        action_to_use = ranged_only_action
-            if best_attack is None:
-                for atk in ranged_attacks:
-                    if atk.range_feet >= dist and (
-                        best_attack is None or atk.range_feet > best_attack.range_feet
-                    ):
-                        best_attack = atk
+            best_range, best_attack = _longest_in_range(profile.ranged_only_ranges, dist)
+            if best_attack is not None:
+                action_to_use = ranged_only_action
+            else:
+                best_range, best_attack = _longest_in_range(profile.ranged_attack_ranges, dist)
             # If we are in (or very near) melee, try to kite FIRST
             if best_attack and dist <= 10 and speed_squares >= 1:
                 new_pos = move_away_from(creature.position, target.position, speed_squares)
@@ -209,7 +254,7 @@ class HeuristicAgent:
                         strategy_summary="Survival mode: move away from melee to kite next turn.",
                     )
             # Otherwise, use ranged attacks from distance
-            if best_attack and dist <= best_attack.range_feet:
+            if best_attack and dist <= best_range:
                 return AgentAction(
                     action_type="attack",
                     attack_name=action_to_use.name,
@@ -218,12 +263,13 @@ class HeuristicAgent:
                 )
             # Can't get in ranged range this turn: move toward max range
             if best_attack:
-                if dist > best_attack.range_feet:
+                if dist > best_range:
                     new_pos = move_toward(
                         creature.position, target.position, speed_squares
                     )
-                    dist2 = distance_in_feet(new_pos, target.position)
-                    if dist2 <= best_attack.range_feet:
+                    nx, ny = parse_coordinate(new_pos)
+                    dist2 = (abs(nx - tx) + abs(ny - ty)) * 5
+                    if dist2 <= best_range:
                         return AgentAction(
                             action_type="move_and_attack",
                             attack_name=action_to_use.name,
@@ -238,15 +284,9 @@ class HeuristicAgent:
                     )
 
         # Default: best attack for current distance (prefer ranged when out of melee)
-        best_attack = None
-        for atk in best_action.attacks:
-            if atk.range_feet >= dist:
-                if best_attack is None or atk.range_feet > best_attack.range_feet:
-                    best_attack = atk
+        rng, best_attack = _longest_in_range(profile.best_action_ranges, dist)
         if best_attack is None:
-            best_attack = best_action.attacks[0]
-
-        rng = best_attack.range_feet
+            rng, best_attack = profile.best_action_ranges[0]
 
         target_name = state.creatures[target_id].name if target_id else "?"
         if dist <= rng:
@@ -259,7 +299,8 @@ class HeuristicAgent:
 
         # Move into range
         new_pos = move_toward(creature.position, target.position, speed_squares)
-        dist2 = distance_in_feet(new_pos, target.position)
+        nx, ny = parse_coordinate(new_pos)
+        dist2 = (abs(nx - tx) + abs(ny - ty)) * 5
 
         if dist2 <= rng:
             return AgentAction(
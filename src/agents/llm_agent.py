@@ -1,17 +1,26 @@
 """LLM Agent orchestrator with circuit breaker and heuristic fallback."""
 
 import logging
-from tenacity import RetryError, retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import time
 from src.agents.base import BaseAgent
 from src.agents.heuristic import HeuristicAgent
 from src.agents.llm_parser import parse_llm_output
-from src.agents.llm_validator import validate_move, to_agent_action
+from src.agents.llm_validator import validate_and_resolve, to_agent_action
 from src.agents.llm_providers import LLMProvider
-from src.agents.llm_prompt import build_prompt
+from src.agents.llm_prompt import ANSWER_END, build_prompt
 from src.domain.combat_state import CombatState
 
 logger = logging.getLogger("dnd_sim.llm_agent")
 
+# Stop decoding once the model closes its answer
+_STOP_SEQUENCES = [f"\n{ANSWER_END}"]
+
+# Provider errors worth retrying (network hiccups, timeouts)
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, OSError)
+
+# Entries kept in the reply cache before it is cleared (bounds memory on long sweeps)
+_CACHE_MAX = 4096
+
 
 class LLMAgent(BaseAgent):
     """LLM-powered agent with circuit breaker and heuristic fallback.
@@ -20,6 +29,16 @@ class LLMAgent(BaseAgent):
     and returns an AgentAction. If any step fails, it falls back to the
     HeuristicAgent. After 3 consecutive failures, the circuit breaker opens
     and the agent uses the heuristic for the rest of the combat.
+
+    Trivial turns (a single living enemy already within attack range while the
+    creature is above the HP threshold) skip the LLM and go straight to the
+    heuristic, which plays them the same way an LLM would: attack that enemy.
+
+    In deterministic mode the LLM is sampled at temperature 0 and its replies
+    are cached per model and rendered prompt text, so any turn whose prompt
+    repeats (e.g. the opening round of every rerun of the same fight) costs a
+    dict lookup. The cache is cleared once it reaches _CACHE_MAX entries, or
+    explicitly with clear_caches().
     """
     
     def __init__(
@@ -29,6 +48,9 @@ class LLMAgent(BaseAgent):
         role: str = "default",
         max_retries: int = 2,
         circuit_breaker_threshold: int = 3,
+        trivial_hp_threshold: float | None = None,
+        deterministic: bool = False,
+        verbose_prompts: bool = True,
     ):
         """Initialize LLMAgent.
         
@@ -38,7 +60,15 @@ class LLMAgent(BaseAgent):
             role: Creature role archetype for prompt (tank/striker/controller/support/default)
             max_retries: Maximum retries per LLM call for transient errors
             circuit_breaker_threshold: Consecutive failures before disabling LLM
+            trivial_hp_threshold: HP fraction above which a lone in-range enemy is
+                handled by the heuristic without calling the LLM (None, the default,
+                always calls it)
+            deterministic: Sample at temperature 0 and reuse replies for repeated states
+            verbose_prompts: Use the full system prompt; False sends the compact
+                rules with one-line reasoning (see build_prompt)
         """
+        if trivial_hp_threshold is not None and not 0 <= trivial_hp_threshold <= 1:
+            raise ValueError(f"trivial_hp_threshold must be between 0 and 1, got {trivial_hp_threshold}")
         self.provider = provider
         self.fallback = HeuristicAgent()
         self.model = model
@@ -47,25 +77,79 @@ class LLMAgent(BaseAgent):
         self.circuit_breaker_threshold = circuit_breaker_threshold
         self._consecutive_failures = 0
         self._circuit_open = False
+        self.trivial_hp_threshold = trivial_hp_threshold
+        self.deterministic = deterministic
+        self.verbose_prompts = verbose_prompts
+        # (model, message contents) -> raw reply; only filled in deterministic mode
+        self._response_cache: dict[tuple, str] = {}
     
+    def __copy__(self) -> "LLMAgent":
+        """Return an agent for another worker thread.
+
+        The copy shares the provider and the reply cache, but has its
+        own circuit breaker and heuristic fallback, so concurrent combats do
+        not reset or trip each other's breaker.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.fallback = HeuristicAgent()
+        clone._consecutive_failures = 0
+        clone._circuit_open = False
+        return clone
+
     def reset_circuit_breaker(self):
         """Reset circuit breaker between combat runs."""
         self._consecutive_failures = 0
         self._circuit_open = False
+
+    def clear_caches(self):
+        """Drop cached replies (they persist across combats otherwise)."""
+        self._response_cache.clear()
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError))
-    )
-    def _call_provider(self, messages):
-        """Call LLM provider with retry logic."""
-        return self.provider.chat_completion(
-            messages=messages,
-            model=self.model,
-            temperature=0.7,
-            max_tokens=600
-        )
+    def _call_provider(self, messages: list[dict]) -> str:
+        """Call LLM provider, retrying transient errors with exponential backoff (1s, 2s, ... up to 5s)."""
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.provider.chat_completion(
+                    messages,
+                    model=self.model,
+                    temperature=0.0 if self.deterministic else 0.7,
+                    max_tokens=600,
+                    stop=_STOP_SEQUENCES,
+                )
+            except _TRANSIENT_ERRORS:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 5.0)
+
+    def _is_trivial(self, state: CombatState, creature_id: str) -> bool:
+        """Return True if the turn is obvious enough to skip the LLM.
+
+        A turn is trivial when exactly one enemy is alive, it is already within
+        the creature's longest attack range, and the creature's HP is above
+        trivial_hp_threshold of its maximum.
+        """
+        if self.trivial_hp_threshold is None:
+            return False
+        creature = state.creatures[creature_id]
+        if creature.current_hp <= self.trivial_hp_threshold * creature.hp_max:
+            return False
+
+        enemy_ids = [
+            cid
+            for team, ids in state.living_ids.items()
+            if team != creature.team
+            for cid in ids
+        ]
+        if len(enemy_ids) != 1:
+            return False
+
+        profile = self.fallback._attack_profile(creature_id, creature)
+        if profile.best_action is None:
+            return False
+        return state.distance(creature_id, enemy_ids[0]) <= profile.max_range_feet
     
     def choose_action(self, state: CombatState, creature_id: str) -> "AgentAction":
         """Choose action using LLM or fallback to heuristic.
@@ -77,64 +161,94 @@ class LLMAgent(BaseAgent):
         Returns:
             AgentAction with the chosen action
         """
+        action = self._shortcut_action(state, creature_id)
+        if action is not None:
+            return action
+
+        try:
+            # Build prompt
+            messages = build_prompt(state, creature_id, self.role, self.verbose_prompts)
+
+            # Call LLM with retry (deterministic replies are reused for repeated prompts)
+            response_text = self._cached_reply(messages)
+            if response_text is None:
+                logger.info(f"Calling LLM for {creature_id} with role {self.role}")
+                response_text = self._call_provider(messages)
+                self._store_reply(messages, response_text)
+            return self._action_from_reply(state, creature_id, response_text)
+
+        except Exception as e:
+            return self._fallback_after_failure(state, creature_id, e)
+
+    def _cached_reply(self, messages: list[dict]) -> str | None:
+        """Return the reply cached for these messages in deterministic mode, else None."""
+        if not self.deterministic:
+            return None
+        return self._response_cache.get((self.model, tuple([m["content"] for m in messages])))
+
+    def _store_reply(self, messages: list[dict], response_text: str):
+        """Remember a reply for these messages (deterministic mode only)."""
+        if not self.deterministic:
+            return
+        if len(self._response_cache) >= _CACHE_MAX:
+            self._response_cache.clear()
+        self._response_cache[(self.model, tuple([m["content"] for m in messages]))] = response_text
+
+    def _shortcut_action(self, state: CombatState, creature_id: str):
+        """Return the heuristic's action when the LLM is not needed this turn, else None."""
         # Circuit breaker check
         if self._circuit_open:
             logger.warning("Circuit breaker open, using heuristic fallback")
             return self.fallback.choose_action(state, creature_id)
-        
+
         # Death save shortcut
         if state.creatures[creature_id].current_hp <= 0:
             return self.fallback.choose_action(state, creature_id)
-        
-        try:
-            # Build prompt
-            messages = build_prompt(state, creature_id, self.role)
-            logger.info(f"Calling LLM for {creature_id} with role {self.role}")
-            
-            # Call LLM with retry
-            response_text = self._call_provider(messages)
-            logger.debug(f"LLM response: {response_text[:200]}...")
-            
-            # Parse response
-            parsed_response = parse_llm_output(response_text)
-            logger.debug(f"Parsed response: {parsed_response}")
-            
-            # Validate move
-            valid, error = validate_move(parsed_response, state, creature_id)
-            if not valid:
-                logger.warning(f"Invalid move: {error}")
-                raise ValueError(f"Invalid move: {error}")
-            
-            # Convert to action
-            action = to_agent_action(parsed_response, state, creature_id)
-            self._consecutive_failures = 0  # Reset on success
-            logger.info(f"LLM action chosen: {action}")
-            return action
-            
-        except Exception as e:
-            msg = _format_llm_error(e)
-            logger.warning(f"LLM agent failed: {msg}")
-            self._consecutive_failures += 1
-
-            if self._consecutive_failures >= self.circuit_breaker_threshold:
-                self._circuit_open = True
-                logger.warning("Circuit breaker opened: falling back to heuristic for remaining combat")
 
+        if self._is_trivial(state, creature_id):
+            logger.debug(f"Trivial turn for {creature_id}, using heuristic")
             return self.fallback.choose_action(state, creature_id)
+        return None
+
+    def _action_from_reply(self, state: CombatState, creature_id: str, response_text: str) -> "AgentAction":
+        """Parse, validate and convert an LLM reply (raises ValueError on an unusable reply)."""
+        logger.debug(f"LLM response: {response_text[:200]}...")
+
+        # Parse response
+        parsed_response = parse_llm_output(response_text)
+        logger.debug(f"Parsed response: {parsed_response}")
+
+        # Validate move
+        resolved = validate_and_resolve(parsed_response, state, creature_id)
+        if not resolved.valid:
+            logger.warning(f"Invalid move: {resolved.error}")
+            raise ValueError(f"Invalid move: {resolved.error}")
+
+        # Convert to action (reusing the resolution above)
+        action = to_agent_action(parsed_response, state, creature_id, resolved)
+        self._consecutive_failures = 0  # Reset on success
+        logger.info(f"LLM action chosen: {action}")
+        return action
+
+    def _fallback_after_failure(self, state: CombatState, creature_id: str, e: Exception) -> "AgentAction":
+        """Count a failed LLM turn (opening the circuit breaker if needed) and use the heuristic."""
+        msg = _format_llm_error(e)
+        logger.warning(f"LLM agent failed: {msg}")
+        self._consecutive_failures += 1
+
+        if self._consecutive_failures >= self.circuit_breaker_threshold:
+            self._circuit_open = True
+            logger.warning("Circuit breaker opened: falling back to heuristic for remaining combat")
+
+        return self.fallback.choose_action(state, creature_id)
+
 
 
 def _format_llm_error(e: Exception) -> str:
     """Turn LLM/provider errors into a short, actionable message."""
-    if isinstance(e, RetryError) and e.last_attempt is not None:
-        try:
-            exc = e.last_attempt.exception()
-        except Exception:
-            exc = None
-        if exc is not None:
-            e = exc
     text = str(e)
     if not text or text.strip() == "":
         text = type(e).__name__
     if isinstance(e, (ConnectionError, OSError)):
         return f"{text}. Is the LLM service running? (Ollama: ollama serve; then ollama pull <model>)"
-    return text
\ No newline at end of file
+    return text
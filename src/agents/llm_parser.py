@@ -5,11 +5,26 @@ from pydantic import BaseModel, field_validator
 from typing import Optional
 
 
+# Compiled once at import; parse_llm_output runs on every LLM turn
+_THINKING_RE = re.compile(r'<thinking>\s*(.*?)(?:</thinking>|$)', re.DOTALL | re.IGNORECASE)
+_FIELD_KEYS = frozenset({'THOUGHT', 'ACTION', 'TARGET', 'MOVEMENT', 'BONUS', 'REACTION'})
+_NULL_VALUES = frozenset({'none', 'stay', 'n/a', '-', ''})
+
+
+def _normalize_optional(v):
+    """Strip a string value and map null-like values ("none", "stay", "n/a", "-", "") to None."""
+    if isinstance(v, str):
+        v = v.strip()
+        if v.lower() in _NULL_VALUES:
+            return None
+    return v
+
+
 class LLMResponse(BaseModel):
     """Structured representation of LLM tactical decision output.
 
     Fields:
-        thinking: Content from <thinking> tags (reasoning about the decision)
+        thinking: Content from <thinking> tags or a THOUGHT line (reasoning about the decision)
         action: The main action to take (e.g., "Attack with Scimitar", "Dodge")
         target: Optional target creature (e.g., "Fighter (D4)")
         movement: Optional movement destination (e.g., "from E5 to D5", "D5", "stay")
@@ -27,43 +42,34 @@ class LLMResponse(BaseModel):
     @field_validator('target', 'movement', 'bonus', 'reaction', mode='before')
     @classmethod
     def normalize_none_values(cls, v):
-        """Convert various null representations to None."""
-        if v is None:
-            return None
+        """Strip whitespace and convert various null representations to None."""
+        return _normalize_optional(v)
 
-        # Strip whitespace
-        if isinstance(v, str):
-            v = v.strip()
-
-        # Check for null-like values
-        null_values = {'none', 'stay', 'n/a', '-', ''}
-        if isinstance(v, str) and v.lower() in null_values:
-            return None
-
-        return v
-
-    @field_validator('thinking', 'action', 'target', 'movement', 'bonus', 'reaction', mode='before')
+    @field_validator('thinking', 'action', mode='before')
     @classmethod
     def strip_whitespace(cls, v):
-        """Strip leading/trailing whitespace from all string fields."""
+        """Strip leading/trailing whitespace from required string fields."""
         if isinstance(v, str):
             return v.strip()
         return v
 
 
-def parse_llm_output(text: str) -> LLMResponse:
+def parse_llm_output(text: str, validated: bool = False) -> LLMResponse:
     """Parse raw LLM output text into structured LLMResponse.
 
     Handles:
     - Clean formatted output with all fields
     - Missing optional fields (TARGET, MOVEMENT, BONUS, REACTION)
     - Malformed thinking tags (missing close tag)
+    - One-line THOUGHT reasoning (compact prompts) in place of <thinking> tags
     - Extra preamble or markdown wrapping
     - Case-insensitive key matching
     - Various null value representations
 
     Args:
         text: Raw LLM output text
+        validated: Build the response through the validating constructor
+            (the default skips validation, since fields are already normalized)
 
     Returns:
         LLMResponse with parsed fields
@@ -74,35 +80,36 @@ def parse_llm_output(text: str) -> LLMResponse:
 
     # Extract thinking content (handle missing closing tag)
     thinking = ""
-    thinking_match = re.search(
-        r'<thinking>\s*(.*?)(?:</thinking>|$)',
-        text,
-        re.DOTALL | re.IGNORECASE
-    )
+    thinking_match = _THINKING_RE.search(text)
     if thinking_match:
         thinking = thinking_match.group(1).strip()
 
-    # Extract key-value pairs (case-insensitive)
-    def extract_field(key: str) -> Optional[str]:
-        """Extract a field value from the text."""
-        pattern = rf'^\s*{key}\s*:\s*(.+?)(?:\n|$)'
-        match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return None
-
-    # Extract all fields
-    action = extract_field('ACTION')
-    target = extract_field('TARGET')
-    movement = extract_field('MOVEMENT')
-    bonus = extract_field('BONUS')
-    reaction = extract_field('REACTION')
+    # Extract KEY: value lines (case-insensitive) in one pass; first occurrence wins
+    fields = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        key = key.strip().upper()
+        value = value.strip()
+        if key in _FIELD_KEYS and value:
+            fields.setdefault(key, value)
+
+    if not thinking:
+        thinking = fields.get('THOUGHT', '')
+    action = fields.get('ACTION')
+    target = _normalize_optional(fields.get('TARGET'))
+    movement = _normalize_optional(fields.get('MOVEMENT'))
+    bonus = _normalize_optional(fields.get('BONUS'))
+    reaction = _normalize_optional(fields.get('REACTION'))
 
     # ACTION is required - raise error if missing
     if not action:
         raise ValueError("No ACTION found in LLM output")
 
-    return LLMResponse(
+    # Values are already stripped and normalized strings, so skip re-validation
+    build = LLMResponse if validated else LLMResponse.model_construct
+    return build(
         thinking=thinking,
         action=action,
         target=target,
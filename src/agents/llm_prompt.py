@@ -1,7 +1,7 @@
 """Combat prompt builder for LLM agents with role archetypes."""
 
 from src.domain.combat_state import CombatState
-from src.domain.distance import distance_in_feet
+from src.domain.identity_cache import identity_cache
 
 
 # Role-based system prompts for tactical archetypes (AGENT-06)
@@ -13,28 +13,11 @@ ROLE_PROMPTS = {
     "default": "You are a tactical monster agent. Maximize your side's chance of victory.",
 }
 
+# Last line of the output format; providers stop generating once it is written
+ANSWER_END = "END"
 
-def build_prompt(
-    state: CombatState, creature_id: str, role: str = "default"
-) -> list[dict]:
-    """Build LLM prompt messages from combat state.
-
-    Args:
-        state: Current combat state
-        creature_id: ID of the creature taking its turn
-        role: Role archetype (tank/striker/controller/support/default)
-
-    Returns:
-        List of message dicts: [system_message, user_message]
-    """
-    creature = state.creatures[creature_id]
-
-    # Build system prompt with role archetype + rules + output format
-    role_instruction = ROLE_PROMPTS.get(role, ROLE_PROMPTS["default"])
-
-    system_prompt = f"""{role_instruction}
-
-Decide ONLY from your current shape (never the ideal):
+# Rules and output format shared by every role
+_SYSTEM_RULES = """Decide ONLY from your current shape (never the ideal):
 - Your current shape is: the HP, position, and actions listed for you this turn—nothing else. Do not assume full HP, a different position, or abilities you do not have. Parties and enemies must take strategic decisions according to this current shape, not an ideal or past state.
 - Reconsider strategy every round from scratch. Tactics must align with what you are right now (e.g. low HP → survive/kite; wounded enemies → focus fire). If your shape or the situation changed, adapt immediately.
 
@@ -63,7 +46,47 @@ ACTION:     [action name]
 TARGET:     [target creature name, or for AoE the center cell e.g. D4]
 MOVEMENT:   [new position or "stay"]
 BONUS:      [bonus action or "none"]
-REACTION:   [reaction setup or "none"]"""
+REACTION:   [reaction setup or "none"]
+""" + ANSWER_END
+
+# Compact rules: same constraints in about a third of the tokens, one-line reasoning
+_COMPACT_RULES = """Rules:
+- Decide from this turn's state only: your listed HP, position and actions (never assume full HP or abilities you lack). Re-plan every round.
+- Aim to survive and win: compare both sides' HP and numbers; focus wounded or dangerous enemies; kite with ranged when fragile, close to melee when tougher; Disengage/Dash/cover is valid when outmatched. Let any character bio shape your choices.
+- Use only actions in your stat block; respect reach, range and remaining movement; do not invent abilities.
+
+Output ONLY these lines:
+THOUGHT:    [one short sentence]
+ACTION:     [action name]
+TARGET:     [target creature name, or for AoE the center cell e.g. D4]
+MOVEMENT:   [new position or "stay"]
+BONUS:      [bonus action or "none"]
+REACTION:   [reaction setup or "none"]
+""" + ANSWER_END
+
+# Fully rendered system prompt per role (verbose and compact variants)
+SYSTEM_PROMPTS = {role: f"{instruction}\n\n{_SYSTEM_RULES}" for role, instruction in ROLE_PROMPTS.items()}
+COMPACT_SYSTEM_PROMPTS = {role: f"{instruction}\n\n{_COMPACT_RULES}" for role, instruction in ROLE_PROMPTS.items()}
+
+
+def build_prompt(
+    state: CombatState, creature_id: str, role: str = "default", verbose: bool = True
+) -> list[dict]:
+    """Build LLM prompt messages from combat state.
+
+    Args:
+        state: Current combat state
+        creature_id: ID of the creature taking its turn
+        role: Role archetype (tank/striker/controller/support/default)
+        verbose: Use the full system prompt with <thinking> reasoning; False uses
+            the compact rules with a single THOUGHT line (fewer prompt and reply tokens)
+
+    Returns:
+        List of message dicts: [system_message, user_message]
+    """
+    # System prompt: role archetype + rules + output format (rendered once at import)
+    prompts = SYSTEM_PROMPTS if verbose else COMPACT_SYSTEM_PROMPTS
+    system_prompt = prompts.get(role, prompts["default"])
 
     # Build user prompt with combat state
     user_prompt = _build_turn_prompt(state, creature_id)
@@ -86,97 +109,46 @@ def _build_turn_prompt(state: CombatState, creature_id: str) -> str:
     """
     creature = state.creatures[creature_id]
 
-    # Separate creatures by team
-    enemies = []
-    allies = []
-    for cid, c in state.creatures.items():
-        if c.current_hp <= 0:
-            continue  # Skip dead creatures
-        if c.team != creature.team:
-            enemies.append((cid, c))
-        else:
-            allies.append((cid, c))
-
-    # Build enemy team section
+    # Per-team HP totals come from the state's living index
+    own_team = creature.team
+    living_hp = state.living_hp
+    ally_hp_total = living_hp.get(own_team, 0)
+    enemy_hp_total = sum(hp for team, hp in living_hp.items() if team != own_team)
+
+    # Team sections and distances straight from the living index (dead creatures never visited)
+    creatures = state.creatures
+    living_ids = state.living_ids
+    enemy_ids = [cid for team, ids in living_ids.items() if team != own_team for cid in ids]
+    if len(living_ids) > 2:
+        # Several enemy teams: list them in creature order, as one side
+        enemy_ids.sort(key=state.spatial.order.__getitem__)
     enemy_lines = []
-    for cid, enemy in enemies:
-        enemy_lines.append(
-            f"- {enemy.name}  HP {enemy.current_hp}/{enemy.hp_max}  AC {enemy.ac}  Pos: {enemy.position}"
-        )
-    enemy_section = "\n".join(enemy_lines) if enemy_lines else "- None"
-
-    # Build ally team section (mark current creature with "You")
+    tactical_lines = []
+    for cid in enemy_ids:
+        c = creatures[cid]
+        enemy_lines.append(f"- {c.name}  HP {c.current_hp}/{c.hp_max}  AC {c.ac}  Pos: {c.position}")
+        tactical_lines.append(f"- Distance to {c.name}: {state.distance(creature_id, cid)}ft")
     ally_lines = []
-    for cid, ally in allies:
-        if cid == creature_id:
-            ally_lines.append(
-                f"- You ({ally.name})  HP {ally.current_hp}/{ally.hp_max}  AC {ally.ac}  Pos: {ally.position}"
-            )
-        else:
-            ally_lines.append(
-                f"- {ally.name}  HP {ally.current_hp}/{ally.hp_max}  AC {ally.ac}  Pos: {ally.position}"
-            )
+    for cid in living_ids.get(own_team, ()):
+        c = creatures[cid]
+        stats = f"HP {c.current_hp}/{c.hp_max}  AC {c.ac}  Pos: {c.position}"
+        # Mark the current creature with "You"
+        ally_lines.append(f"- You ({c.name})  {stats}" if cid == creature_id else f"- {c.name}  {stats}")
+    enemy_section = "\n".join(enemy_lines) if enemy_lines else "- None"
     ally_section = "\n".join(ally_lines) if ally_lines else "- None"
-
-    # Build available actions section
-    action_lines = []
-    for action in creature.actions:
-        if getattr(action, "is_aoe", False):
-            d = action.damage
-            dmg_str = f"{d.dice} {d.damage_type}" if d else "—"
-            action_lines.append(
-                f"- {action.name}: AoE {action.area_shape} radius {action.radius_squares} squares, "
-                f"{action.save_ability or 'DEX'} save DC {action.save_dc}, {dmg_str}. TARGET = center cell (e.g. D4)."
-            )
-        elif action.attacks:
-            # Show attack details
-            attack_details = []
-            for attack in action.attacks:
-                attack_details.append(
-                    f"{attack.name} +{attack.attack_bonus}, {attack.damage.dice} {attack.damage.damage_type}, "
-                    f"{'reach' if attack.reach else 'range'} {attack.range_feet}ft"
-                )
-            action_lines.append(f"- {action.name}: {'; '.join(attack_details)}")
-        else:
-            # Non-attack action
-            action_lines.append(f"- {action.name}")
-    actions_section = (
-        "\n".join(action_lines) if action_lines else "- No actions available"
-    )
-
-    # Build tactical notes (distances to enemies)
-    tactical_lines = []
-    for cid, enemy in enemies:
-        dist = distance_in_feet(creature.position, enemy.position)
-        tactical_lines.append(f"- Distance to {enemy.name}: {dist}ft")
     tactical_section = (
         "\n".join(tactical_lines) if tactical_lines else "- No enemies in range"
     )
 
+    # Available actions and equipment summary (rendered once per actions list)
+    actions_section, equipment_note = _actions_text(creature.actions)
+
     # Strategy context: strength comparison and equipment summary for survival reasoning
-    enemy_hp_total = sum(e.current_hp for _, e in enemies)
-    ally_hp_total = sum(a.current_hp for _, a in allies)
-    melee_attacks = []
-    ranged_attacks = []
-    for a in creature.actions:
-        for atk in a.attacks or []:
-            if atk.reach is not None:
-                melee_attacks.append(f"{atk.name} ({atk.range_feet}ft)")
-            elif atk.range is not None:
-                ranged_attacks.append(f"{atk.name} ({atk.range_feet}ft)")
-    equipment_note = "Melee: " + (", ".join(melee_attacks) if melee_attacks else "none")
-    equipment_note += ". Ranged: " + (", ".join(ranged_attacks) if ranged_attacks else "none")
-    strategy_note = f"Total HP: your side {ally_hp_total}, enemies {enemy_hp_total}. Numbers: {len(allies)} vs {len(enemies)}. {equipment_note}."
-
-    # Class/race/level line for identity (e.g. "Dragonborn Paladin, level 5")
-    identity_parts = []
-    if getattr(creature, "race", None) and creature.race.strip():
-        identity_parts.append(creature.race.strip())
-    if getattr(creature, "character_class", None) and creature.character_class.strip():
-        identity_parts.append(creature.character_class.strip())
-    if getattr(creature, "level", None) is not None and creature.level >= 1:
-        identity_parts.append(f"level {creature.level}")
-    identity_line = f" ({', '.join(identity_parts)})" if identity_parts else ""
+    strategy_note = f"Total HP: your side {ally_hp_total}, enemies {enemy_hp_total}. Numbers: {len(ally_lines)} vs {len(enemy_lines)}. {equipment_note}."
+
+    # Class/race/level line for identity (e.g. "Dragonborn, Paladin, level 5")
+    identity_label = creature.identity_label
+    identity_line = f" ({identity_label})" if identity_label else ""
 
     # Current shape: explicit so strategy is tied to this form this turn (no ideal state)
     current_shape_note = (
@@ -214,3 +186,41 @@ Tactical notes:
 {tactical_section}"""
 
     return prompt
+
+
+@identity_cache()
+def _actions_text(actions: list) -> tuple[str, str]:
+    """Return (actions_section, equipment_note) for an actions list.
+
+    A creature's actions are fixed for a whole combat, so the text is rendered
+    on its first turn and reused.
+    """
+    actions_section = "\n".join([_action_line(action) for action in actions]) or "- No actions available"
+    attacks = [atk for a in actions for atk in a.attacks]
+    melee = ", ".join([f"{atk.name} ({atk.range_feet}ft)" for atk in attacks if atk.reach is not None])
+    ranged = ", ".join(
+        [f"{atk.name} ({atk.range_feet}ft)" for atk in attacks if atk.reach is None and atk.range is not None]
+    )
+    equipment_note = f"Melee: {melee or 'none'}. Ranged: {ranged or 'none'}"
+    return actions_section, equipment_note
+
+
+def _action_line(action) -> str:
+    """Render one action of the acting creature for the prompt's action list."""
+    if action.is_aoe:
+        d = action.damage
+        dmg_str = f"{d.dice} {d.damage_type}" if d else "—"
+        return (
+            f"- {action.name}: AoE {action.area_shape} radius {action.radius_squares} squares, "
+            f"{action.save_ability or 'DEX'} save DC {action.save_dc}, {dmg_str}. TARGET = center cell (e.g. D4)."
+        )
+    if action.attacks:
+        # Show attack details
+        attack_details = "; ".join([
+            f"{attack.name} +{attack.attack_bonus}, {attack.damage.dice} {attack.damage.damage_type}, "
+            f"{'reach' if attack.reach else 'range'} {attack.range_feet}ft"
+            for attack in action.attacks
+        ])
+        return f"- {action.name}: {attack_details}"
+    # Non-attack action
+    return f"- {action.name}"
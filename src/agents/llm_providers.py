@@ -4,9 +4,63 @@ from abc import ABC, abstractmethod
 import ollama
 import openai
 
+# Model name prefixes of providers that honor cache_control breakpoints (Anthropic via OpenRouter etc.)
+_PROMPT_CACHE_MODEL_PREFIXES = ("anthropic/", "claude")
+
+
+def _with_prompt_caching(messages: list[dict], model: str) -> list[dict]:
+    """Mark the system prompt as cacheable for models that support prompt caching.
+
+    The system prompt is identical on every turn, so compatible providers can
+    serve it from their prompt cache instead of prefilling it again. Other
+    models get the messages unchanged.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content' keys
+        model: Model identifier string
+
+    Returns:
+        Messages with the system content as a cache_control text block
+    """
+    if not model.startswith(_PROMPT_CACHE_MODEL_PREFIXES):
+        return messages
+    return [
+        {
+            "role": "system",
+            "content": [{"type": "text", "text": m["content"], "cache_control": {"type": "ephemeral"}}],
+        }
+        if m["role"] == "system" and isinstance(m["content"], str)
+        else m
+        for m in messages
+    ]
+
 
 class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+
+    HTTP-backed providers build their SDK client once (_create_client) and
+    reuse it, so the connection pool stays warm between turns. The client is
+    dropped when the provider is pickled (e.g. sent to a worker process) and
+    rebuilt on first use there.
+    """
+
+    _client = None
+
+    @abstractmethod
+    def _create_client(self):
+        """Return a new SDK client for this provider."""
+        ...
+
+    def _get_client(self):
+        """Return the provider's client, creating it on first use."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_client", None)
+        return state
 
     @abstractmethod
     def chat_completion(
@@ -15,6 +69,7 @@ class LLMProvider(ABC):
         model: str,
         temperature: float = 0.7,
         max_tokens: int = 300,
+        stop: list[str] | None = None,
     ) -> str:
         """Send messages to LLM and return text response.
 
@@ -23,6 +78,7 @@ class LLMProvider(ABC):
             model: Model identifier string
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation early (not included in the reply)
 
         Returns:
             Response text from the LLM
@@ -44,12 +100,16 @@ class OllamaProvider(LLMProvider):
         """
         self.host = host
 
+    def _create_client(self):
+        return ollama.Client(host=self.host)
+
     def chat_completion(
         self,
         messages: list[dict],
         model: str,
         temperature: float = 0.7,
         max_tokens: int = 300,
+        stop: list[str] | None = None,
     ) -> str:
         """Send messages to Ollama and return text response.
 
@@ -58,6 +118,7 @@ class OllamaProvider(LLMProvider):
             model: Model name (e.g., "qwen2.5:7b-instruct")
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation early
 
         Returns:
             Response text from Ollama
@@ -66,11 +127,13 @@ class OllamaProvider(LLMProvider):
             ollama.ResponseError: API errors
             requests.RequestException: Network errors
         """
-        client = ollama.Client(host=self.host)
-        response = client.chat(
+        options = {"temperature": temperature, "num_predict": max_tokens}
+        if stop:
+            options["stop"] = stop
+        response = self._get_client().chat(
             model=model,
             messages=messages,
-            options={"temperature": temperature, "num_predict": max_tokens},
+            options=options,
         )
         return response["message"]["content"]
 
@@ -90,38 +153,8 @@ class OpenAIProvider(LLMProvider):
         self.api_key = api_key
         self.base_url = base_url
 
-    def chat_completion(
-        self,
-        messages: list[dict],
-        model: str,
-        temperature: float = 0.7,
-        max_tokens: int = 300,
-    ) -> str:
-        """Send messages to OpenAI (or compatible API) and return text response."""
-        client = openai.OpenAI(base_url=self.base_url, api_key=self.api_key)
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        return response.choices[0].message.content
-
-
-class OpenRouterProvider(LLMProvider):
-    """Synchronous OpenRouter provider for cloud LLM inference."""
-
-    def __init__(
-        self, api_key: str, base_url: str = "https://openrouter.ai/api/v1"
-    ):
-        """Initialize OpenRouter provider.
-
-        Args:
-            api_key: OpenRouter API key
-            base_url: OpenRouter API base URL
-        """
-        self.api_key = api_key
-        self.base_url = base_url
+    def _create_client(self):
+        return openai.OpenAI(base_url=self.base_url, api_key=self.api_key)
 
     def chat_completion(
         self,
@@ -129,27 +162,45 @@ class OpenRouterProvider(LLMProvider):
         model: str,
         temperature: float = 0.7,
         max_tokens: int = 300,
+        stop: list[str] | None = None,
     ) -> str:
-        """Send messages to OpenRouter and return text response.
+        """Send messages to OpenAI (or compatible API) and return text response.
 
         Args:
             messages: List of message dicts with 'role' and 'content' keys
-            model: Model identifier (e.g., "qwen/qwen2.5-coder-7b-instruct")
+            model: Model identifier (e.g., "gpt-4o-mini" or "qwen/qwen2.5-coder-7b-instruct")
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation early
 
         Returns:
-            Response text from OpenRouter
+            Response text (the system prompt is marked cacheable for Claude
+            models, see _with_prompt_caching)
 
         Raises:
             openai.APIError: API errors
             openai.APIConnectionError: Network errors
         """
-        client = openai.OpenAI(base_url=self.base_url, api_key=self.api_key)
-        response = client.chat.completions.create(
+        response = self._get_client().chat.completions.create(
             model=model,
-            messages=messages,
+            messages=_with_prompt_caching(messages, model),
             temperature=temperature,
             max_tokens=max_tokens,
+            stop=stop or openai.NOT_GIVEN,
         )
         return response.choices[0].message.content
+
+
+class OpenRouterProvider(OpenAIProvider):
+    """OpenRouter provider: the OpenAI-compatible client pointed at OpenRouter."""
+
+    def __init__(
+        self, api_key: str, base_url: str = "https://openrouter.ai/api/v1"
+    ):
+        """Initialize OpenRouter provider.
+
+        Args:
+            api_key: OpenRouter API key
+            base_url: OpenRouter API base URL
+        """
+        super().__init__(api_key=api_key, base_url=base_url)
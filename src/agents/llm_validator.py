@@ -1,12 +1,19 @@
 """LLM move validator - validates LLM responses against combat state."""
 
 import re
-from typing import Optional
+from typing import NamedTuple, Optional
 from src.agents.llm_parser import LLMResponse
 from src.agents.base import AgentAction
 from src.domain.combat_state import CombatState
+from src.domain.creature import Action
 from src.domain.distance import distance_in_feet
 
+# Patterns used on every LLM reply, compiled once
+_RE_MOVE_TO = re.compile(r'to\s+([A-Z]\d+)', re.IGNORECASE)
+_RE_BARE_COORD = re.compile(r'^([A-Z]\d+)$', re.IGNORECASE)
+_RE_CELL = re.compile(r"^\s*([A-Za-z])\s*(\d+)\s*$")
+_RE_PAREN = re.compile(r'\s*\([^)]+\)\s*')
+
 
 def _parse_movement_destination(movement_text: Optional[str]) -> Optional[str]:
     """Parse movement text to extract destination coordinate.
@@ -26,12 +33,12 @@ def _parse_movement_destination(movement_text: Optional[str]) -> Optional[str]:
         return None
 
     # Check for "from X to Y" format
-    from_to_match = re.search(r'to\s+([A-Z]\d+)', movement_text, re.IGNORECASE)
+    from_to_match = _RE_MOVE_TO.search(movement_text)
     if from_to_match:
         return from_to_match.group(1).upper()
 
     # Check for bare coordinate (e.g., "D5")
-    coord_match = re.search(r'^([A-Z]\d+)$', movement_text.strip(), re.IGNORECASE)
+    coord_match = _RE_BARE_COORD.search(movement_text.strip())
     if coord_match:
         return coord_match.group(1).upper()
 
@@ -42,7 +49,7 @@ def _parse_cell(text: Optional[str]) -> Optional[str]:
     """If text looks like a grid cell (e.g. A1, D4), return it normalized; else None."""
     if not text:
         return None
-    m = re.match(r"^\s*([A-Za-z])\s*(\d+)\s*$", text.strip())
+    m = _RE_CELL.match(text.strip())
     if m:
         return m.group(1).upper() + m.group(2)
     return None
@@ -67,14 +74,10 @@ def _resolve_target_id(target_text: Optional[str], state: CombatState) -> Option
         return None
 
     # Strip parenthetical position info: "Fighter (D4)" -> "Fighter"
-    clean_target = re.sub(r'\s*\([^)]+\)\s*', '', target_text).strip()
-
-    # Case-insensitive match against creature names
-    for creature_id, creature in state.creatures.items():
-        if creature.name.lower() == clean_target.lower():
-            return creature_id
+    clean_target = _RE_PAREN.sub('', target_text).strip()
 
-    return None
+    # Case-insensitive match against creature names (first creature with the name wins)
+    return state.name_ids.get(clean_target.lower())
 
 
 def _resolve_action_name(action_text: str, creature_id: str, state: CombatState) -> Optional[str]:
@@ -121,12 +124,23 @@ def _resolve_action_name(action_text: str, creature_id: str, state: CombatState)
     return None
 
 
-def validate_move(
+class ResolvedMove(NamedTuple):
+    """An LLM reply checked and resolved against the combat state in one pass."""
+
+    valid: bool
+    error: str
+    move_to: Optional[str]
+    action_name: Optional[str]
+    target_id: Optional[str]
+    action_obj: Optional[Action]
+
+
+def validate_and_resolve(
     response: LLMResponse,
     state: CombatState,
     creature_id: str
-) -> tuple[bool, str]:
-    """Validate LLM response against combat state rules.
+) -> ResolvedMove:
+    """Validate LLM response against combat state rules and resolve its parts.
 
     Checks:
     - Movement distance <= creature speed
@@ -140,8 +154,8 @@ def validate_move(
         creature_id: ID of creature making the move
 
     Returns:
-        Tuple of (valid: bool, error_message: str)
-        If valid, error_message is empty string
+        ResolvedMove with the destination, action name/object and target ID.
+        If invalid, valid is False and error explains why.
     """
     creature = state.creatures[creature_id]
     current_position = creature.position
@@ -154,65 +168,83 @@ def validate_move(
     if move_to:
         move_distance = distance_in_feet(current_position, move_to)
         if move_distance > creature.speed:
-            return (False, f"Movement from {current_position} to {move_to} ({move_distance}ft) exceeds speed ({creature.speed}ft)")
+            return ResolvedMove(
+                False,
+                f"Movement from {current_position} to {move_to} ({move_distance}ft) exceeds speed ({creature.speed}ft)",
+                move_to, None, None, None,
+            )
 
     # Resolve action
     action_name = _resolve_action_name(response.action, creature_id, state)
+    action_obj = creature.actions_by_name.get(action_name) if action_name else None
 
-    # If it's dodge, no further validation needed
-    if action_name == "dodge":
-        return (True, "")
-
-    # For attack actions, validate target (or AoE center)
-    if action_name and action_name != "dodge":
-        action_obj = None
-        for a in creature.actions:
-            if a.name == action_name:
-                action_obj = a
-                break
-        if action_obj and getattr(action_obj, "is_aoe", False):
-            # AoE: target is optional center cell; if provided, must look like a cell
-            if response.target and not _parse_cell(response.target):
-                return (False, "AoE target should be a cell (e.g. D4)")
-            return (True, "")
-
-        # Attack requires target creature
-        if not response.target:
-            return (False, "Attack requires a target")
-
-        # Resolve target
-        target_id = _resolve_target_id(response.target, state)
-        if not target_id:
-            return (False, f"Target '{response.target}' does not exist")
-
-        target = state.creatures[target_id]
-
-        # Check if target is alive
-        if target.current_hp <= 0:
-            return (False, f"Target '{target.name}' is already dead")
-
-        # Find the attack range
-        # Get the action to check attack range
-        attack_range = 5  # Default melee reach
-        for action in creature.actions:
-            if action.name == action_name:
-                if action.attacks:
-                    # Use first attack's range (they should be similar)
-                    attack_range = action.attacks[0].range_feet
-                break
+    # AoE: target is optional center cell; if provided, must look like a cell
+    if action_obj and action_obj.is_aoe:
+        if response.target and not _parse_cell(response.target):
+            return ResolvedMove(False, "AoE target should be a cell (e.g. D4)", move_to, action_name, None, action_obj)
+        return ResolvedMove(True, "", move_to, action_name, None, action_obj)
 
-        # Check if target is in range from final position
-        target_distance = distance_in_feet(final_position, target.position)
-        if target_distance > attack_range:
-            return (False, f"Target '{target.name}' at {target.position} is {target_distance}ft away (out of range: {attack_range}ft) from final position {final_position}")
+    # Resolve target (creature)
+    target_id = _resolve_target_id(response.target, state)
 
-    return (True, "")
+    # Dodge and unrecognized actions need no further validation
+    if not action_name or action_name == "dodge":
+        return ResolvedMove(True, "", move_to, action_name, target_id, action_obj)
+
+    # Attack requires target creature
+    if not response.target:
+        return ResolvedMove(False, "Attack requires a target", move_to, action_name, None, action_obj)
+    if not target_id:
+        return ResolvedMove(False, f"Target '{response.target}' does not exist", move_to, action_name, None, action_obj)
+
+    target = state.creatures[target_id]
+
+    # Check if target is alive
+    if target.current_hp <= 0:
+        return ResolvedMove(False, f"Target '{target.name}' is already dead", move_to, action_name, target_id, action_obj)
+
+    # Attack range: first attack's range (they should be similar), else melee reach
+    attack_range = 5  # Default melee reach
+    if action_obj and action_obj.attacks:
+        attack_range = action_obj.attacks[0].range_feet
+
+    # Check if target is in range from final position
+    target_distance = distance_in_feet(final_position, target.position)
+    if target_distance > attack_range:
+        return ResolvedMove(
+            False,
+            f"Target '{target.name}' at {target.position} is {target_distance}ft away (out of range: {attack_range}ft) from final position {final_position}",
+            move_to, action_name, target_id, action_obj,
+        )
 
+    return ResolvedMove(True, "", move_to, action_name, target_id, action_obj)
 
-def to_agent_action(
+
+def validate_move(
     response: LLMResponse,
     state: CombatState,
     creature_id: str
+) -> tuple[bool, str]:
+    """Validate LLM response against combat state rules.
+
+    Args:
+        response: Parsed LLM response
+        state: Current combat state
+        creature_id: ID of creature making the move
+
+    Returns:
+        Tuple of (valid: bool, error_message: str)
+        If valid, error_message is empty string
+    """
+    resolved = validate_and_resolve(response, state, creature_id)
+    return (resolved.valid, resolved.error)
+
+
+def to_agent_action(
+    response: LLMResponse,
+    state: CombatState,
+    creature_id: str,
+    resolved: Optional[ResolvedMove] = None,
 ) -> AgentAction:
     """Convert validated LLM response to AgentAction.
 
@@ -220,6 +252,8 @@ def to_agent_action(
         response: Parsed LLM response
         state: Current combat state
         creature_id: ID of creature making the move
+        resolved: Result of validate_and_resolve for this response, if the
+            caller already has it (skips validating and resolving again)
 
     Returns:
         AgentAction with appropriate action_type and fields
@@ -227,26 +261,18 @@ def to_agent_action(
     Raises:
         ValueError: If move is invalid
     """
-    # Validate first
-    valid, error = validate_move(response, state, creature_id)
-    if not valid:
-        raise ValueError(f"Invalid move: {error}")
-
-    # Parse movement
-    move_to = _parse_movement_destination(response.movement)
+    if resolved is None:
+        resolved = validate_and_resolve(response, state, creature_id)
+    if not resolved.valid:
+        raise ValueError(f"Invalid move: {resolved.error}")
 
-    # Resolve action
-    action_name = _resolve_action_name(response.action, creature_id, state)
+    move_to = resolved.move_to
+    action_name = resolved.action_name
 
     # AoE: if this action is AoE, target is the center cell (target_position)
-    creature = state.creatures[creature_id]
-    action_obj = None
-    for a in creature.actions:
-        if a.name == action_name:
-            action_obj = a
-            break
-    if action_obj and getattr(action_obj, "is_aoe", False):
-        target_position = _parse_cell(response.target) or creature.position
+    action_obj = resolved.action_obj
+    if action_obj and action_obj.is_aoe:
+        target_position = _parse_cell(response.target) or state.creatures[creature_id].position
         return AgentAction(
             action_type="aoe",
             attack_name=action_name,
@@ -257,8 +283,7 @@ def to_agent_action(
             strategy_summary=response.thinking or None,
         )
 
-    # Resolve target (creature)
-    target_id = _resolve_target_id(response.target, state)
+    target_id = resolved.target_id
 
     # Determine action_type
     if action_name == "dodge":
@@ -1,10 +1,16 @@
 """Statistical analysis utilities for Monte Carlo simulations."""
 
-from .statistics import calculate_win_rate_ci, progressive_sampling_stopping_criteria
-from .difficulty import calculate_difficulty_rating
+from .statistics import (
+    calculate_win_rate_ci,
+    calculate_win_rate_cis,
+    progressive_sampling_stopping_criteria,
+)
+from .difficulty import calculate_difficulty_rating, calculate_difficulty_ratings
 
 __all__ = [
     "calculate_win_rate_ci",
+    "calculate_win_rate_cis",
     "progressive_sampling_stopping_criteria",
     "calculate_difficulty_rating",
+    "calculate_difficulty_ratings",
 ]
@@ -4,10 +4,31 @@ Maps simulation results (win rate, TPK risk, duration) to D&D difficulty labels
 (Easy/Medium/Hard/Deadly) based on D&D 5e XP guidelines and design expectations.
 """
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import numpy as np
 
 DifficultyRating = Literal["Easy", "Medium", "Hard", "Deadly"]
 
+# Rating labels indexed by the codes calculate_difficulty_ratings computes
+_RATING_LABELS = ("Easy", "Medium", "Hard", "Deadly")
+
+# TPK risk thresholds (not adjusted for party size)
+_EASY_TPK_THRESHOLD = 0.05
+_MEDIUM_TPK_THRESHOLD = 0.15
+_HARD_TPK_THRESHOLD = 0.30
+
+
+def _win_thresholds(party_size: int) -> tuple[float, float, float]:
+    """Return the (easy, medium, hard) win-rate thresholds for a party size.
+
+    Smaller parties need easier encounters: thresholds move 2.5% per player
+    away from the 4-player baseline.
+    """
+    size_adjustment = (party_size - 4) * 0.025
+    return 0.80 + size_adjustment, 0.60 + size_adjustment, 0.40 + size_adjustment
+
 
 def calculate_difficulty_rating(
     win_rate: float,
@@ -63,17 +84,11 @@ def calculate_difficulty_rating(
         raise ValueError(f"party_size must be at least 1, got {party_size}")
 
     # Adjust thresholds for party size (smaller parties need easier encounters)
-    # Baseline is 4 players
-    size_adjustment = (party_size - 4) * 0.025  # +/-2.5% per player difference
-
-    # Adjusted thresholds
-    easy_win_threshold = 0.80 + size_adjustment
-    medium_win_threshold = 0.60 + size_adjustment
-    hard_win_threshold = 0.40 + size_adjustment
+    easy_win_threshold, medium_win_threshold, hard_win_threshold = _win_thresholds(party_size)
 
-    easy_tpk_threshold = 0.05
-    medium_tpk_threshold = 0.15
-    hard_tpk_threshold = 0.30
+    easy_tpk_threshold = _EASY_TPK_THRESHOLD
+    medium_tpk_threshold = _MEDIUM_TPK_THRESHOLD
+    hard_tpk_threshold = _HARD_TPK_THRESHOLD
 
     # Duration factor: longer fights feel more challenging
     # Base thresholds assume 4-6 round combat
@@ -106,3 +121,57 @@ def calculate_difficulty_rating(
     # Everything else is Easy
     # (High win rate AND low TPK risk)
     return "Easy"
+
+
+def calculate_difficulty_ratings(
+    win_rates: "np.ndarray",
+    tpk_risks: "np.ndarray",
+    avg_durations: "np.ndarray",
+    party_size: int = 4,
+) -> "np.ndarray":
+    """Rate many encounters at once (e.g. a sweep over enemy counts).
+
+    Element-wise equivalent of calculate_difficulty_rating, with the threshold
+    comparisons done as array operations instead of per-encounter branching.
+
+    Args:
+        win_rates: Party win rates as proportions [0, 1]
+        tpk_risks: TPK risks as proportions [0, 1], same shape as win_rates
+        avg_durations: Average combat durations in rounds, same shape as win_rates
+        party_size: Number of party members (shared by all encounters)
+
+    Returns:
+        Array of "Easy"/"Medium"/"Hard"/"Deadly" labels, same shape as win_rates
+
+    Raises:
+        ValueError: If any win rate or TPK risk is outside [0, 1], or party_size < 1
+    """
+    # NumPy is only needed here; the scalar rating is imported by single-combat runs
+    import numpy as np
+
+    win = np.asarray(win_rates, dtype=float)
+    tpk = np.asarray(tpk_risks, dtype=float)
+    duration = np.asarray(avg_durations, dtype=float)
+    if ((win < 0) | (win > 1)).any():
+        raise ValueError(f"win_rates must be in [0, 1], got {win[(win < 0) | (win > 1)][0]}")
+    if ((tpk < 0) | (tpk > 1)).any():
+        raise ValueError(f"tpk_risks must be in [0, 1], got {tpk[(tpk < 0) | (tpk > 1)][0]}")
+    if party_size < 1:
+        raise ValueError(f"party_size must be at least 1, got {party_size}")
+
+    easy_win, medium_win, hard_win = _win_thresholds(party_size)
+    duration_penalty = np.where(duration >= 10, 0.05, 0.0)
+
+    # Same precedence as the scalar version: the worse indicator wins
+    codes = np.select(
+        [
+            (win < hard_win) | (tpk > _HARD_TPK_THRESHOLD),
+            ((hard_win <= win) & (win < medium_win))
+            | ((_MEDIUM_TPK_THRESHOLD <= tpk) & (tpk <= _HARD_TPK_THRESHOLD)),
+            ((medium_win <= win) & (win < easy_win - duration_penalty))
+            | ((_EASY_TPK_THRESHOLD <= tpk) & (tpk < _MEDIUM_TPK_THRESHOLD)),
+        ],
+        [3, 2, 1],
+        default=0,
+    )
+    return np.array(_RATING_LABELS)[codes]
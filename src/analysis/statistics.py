@@ -1,12 +1,29 @@
 """Statistical utilities for Monte Carlo simulation analysis.
 
 Provides functions for:
-- Wilson score confidence intervals (accurate for small samples and extreme proportions)
+- Wilson score confidence intervals (accurate for small samples and extreme proportions),
+  for one win count or for arrays of them
 - Progressive sampling stopping criteria based on confidence interval width
 """
 
-from typing import Tuple
-from scipy.stats import binomtest
+import math
+from functools import lru_cache
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# confidence_level -> two-sided normal quantile z; filled on first use per level
+_Z_CACHE: dict[float, float] = {}
+
+
+def _z_score(confidence_level: float) -> float:
+    """Return the two-sided standard normal quantile for a confidence level (1.96 for 0.95)."""
+    z = _Z_CACHE.get(confidence_level)
+    if z is None:
+        z = _Z_CACHE[confidence_level] = NormalDist().inv_cdf(1 - (1 - confidence_level) / 2)
+    return z
 
 
 def calculate_win_rate_ci(
@@ -14,9 +31,9 @@ def calculate_win_rate_ci(
 ) -> Tuple[float, float, float]:
     """Calculate Wilson score confidence interval for win rate.
 
-    Uses scipy.stats.binomtest with proportion_ci method for accurate
-    confidence intervals, especially for small sample sizes and extreme
-    proportions (near 0% or 100%).
+    Computes the Wilson score interval in closed form (the same interval as
+    scipy's binomtest(...).proportion_ci(method="wilson")), which stays
+    accurate for small sample sizes and extreme proportions (near 0% or 100%).
 
     Args:
         wins: Number of wins (successes)
@@ -32,13 +49,13 @@ def calculate_win_rate_ci(
 
     Examples:
         >>> calculate_win_rate_ci(70, 100)
-        (0.6024..., 0.7857..., 0.70)
+        (0.6041..., 0.7810..., 0.7)
 
         >>> calculate_win_rate_ci(0, 10)  # All losses
-        (0.0, 0.3084..., 0.0)
+        (0.0, 0.2775..., 0.0)
 
         >>> calculate_win_rate_ci(10, 10)  # All wins
-        (0.6915..., 1.0, 1.0)
+        (0.7224..., 1.0, 1.0)
     """
     # Validate inputs
     if total < 0:
@@ -54,15 +71,88 @@ def calculate_win_rate_ci(
     if total == 0:
         return (0.0, 1.0, 0.5)  # Maximum uncertainty
 
-    # Calculate point estimate
-    point_estimate = wins / total
+    lower, upper = _wilson_ci_fast(wins, total, _z_score(confidence_level))
+    return (lower, upper, wins / total)
+
+
+def _wilson_ci_fast(wins: int, total: int, z: float) -> Tuple[float, float]:
+    """Wilson score (lower, upper) bounds without input checks.
+
+    The caller guarantees 0 <= wins <= total and total > 0.
+    """
+    p = wins / total
+    z2 = z * z
+    denom = 1 + z2 / total
+    center = (p + z2 / (2 * total)) / denom
+    half = z * math.sqrt((p * (1 - p) + z2 / (4 * total)) / total) / denom
+
+    # At 0 or all wins the bound is exactly 0/1; skip the rounding residue there
+    lower = 0.0 if wins == 0 else max(0.0, center - half)
+    upper = 1.0 if wins == total else min(1.0, center + half)
+    return (lower, upper)
+
+
+def calculate_win_rate_cis(
+    wins: "np.ndarray", totals: "np.ndarray", confidence_level: float = 0.95
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Calculate Wilson score intervals for many win counts at once (e.g. K matchups).
+
+    Element-wise equivalent of calculate_win_rate_ci, evaluated as array
+    operations instead of one Python call per matchup.
+
+    Args:
+        wins: Numbers of wins (successes)
+        totals: Total numbers of trials, same shape as wins
+        confidence_level: Confidence level shared by all intervals (default 0.95)
+
+    Returns:
+        Tuple of (lower_bounds, upper_bounds, point_estimates) arrays, same shape as wins.
+        Entries with no trials are (0.0, 1.0, 0.5).
+
+    Raises:
+        ValueError: If any total < 0, wins < 0 or wins > total, or confidence_level not in (0, 1)
+    """
+    # NumPy is only needed here; the scalar interval is used by single batch runs
+    import numpy as np
+
+    k = np.asarray(wins, dtype=float)
+    n = np.asarray(totals, dtype=float)
+    if (n < 0).any():
+        raise ValueError(f"totals must be non-negative, got {n[n < 0][0]:g}")
+    if (k < 0).any():
+        raise ValueError(f"wins must be non-negative, got {k[k < 0][0]:g}")
+    if (k > n).any():
+        raise ValueError(f"wins ({k[k > n][0]:g}) cannot exceed total ({n[k > n][0]:g})")
+    if not 0 < confidence_level < 1:
+        raise ValueError(f"confidence_level must be in (0, 1), got {confidence_level}")
+
+    empty = n == 0
+    n_safe = np.where(empty, 1.0, n)  # keeps the formula finite; replaced below
+    p = k / n_safe
+    z = _z_score(confidence_level)
+    z2 = z * z
+    denom = 1 + z2 / n_safe
+    center = (p + z2 / (2 * n_safe)) / denom
+    half = z * np.sqrt((p * (1 - p) + z2 / (4 * n_safe)) / n_safe) / denom
+
+    lower = np.where((k == 0) | empty, 0.0, np.clip(center - half, 0.0, 1.0))
+    upper = np.where((k == n) | empty, 1.0, np.clip(center + half, 0.0, 1.0))
+    return lower, upper, np.where(empty, 0.5, p)
 
-    # Use binomial test to get Wilson score confidence interval
-    # binomtest.proportion_ci uses the Wilson score method by default
-    result = binomtest(wins, total, alternative="two-sided")
-    ci = result.proportion_ci(confidence_level=confidence_level, method="wilson")
 
-    return (ci.low, ci.high, point_estimate)
+@lru_cache(maxsize=64)
+def _width_bound_thresholds(confidence_level: float, target_precision: float) -> Tuple[float, float]:
+    """Return (never_below, always_from) trial counts for the stopping check.
+
+    The Wilson width depends on the observed rate p only through p(1 - p), so
+    for n trials it lies between z²/(n + z²) (at p = 0 or 1) and z/√(n + z²)
+    (at p = 0.5). Below never_below even the narrowest interval is too wide;
+    from always_from on even the widest one is narrow enough.
+    """
+    z = _z_score(confidence_level)
+    z2 = z * z
+    max_width = 2 * target_precision
+    return (z2 / max_width - z2, z2 / (max_width * max_width) - z2)
 
 
 def progressive_sampling_stopping_criteria(
@@ -73,6 +163,9 @@ def progressive_sampling_stopping_criteria(
     Stopping criteria: CI width ≤ 2 × target_precision
     (e.g., for ±5% precision, CI width should be ≤ 0.10)
 
+    Most polls are decided by trial count alone (see _width_bound_thresholds);
+    the interval itself is only computed in between the two bounds.
+
     Args:
         wins: Number of wins so far
         total: Total trials run so far
@@ -93,7 +186,15 @@ def progressive_sampling_stopping_criteria(
     if total == 0:
         return False  # Need at least some samples
 
-    lower, upper, _ = calculate_win_rate_ci(wins, total, confidence_level)
+    # Cheap bounds on the width that hold for any win rate
+    never_below, always_from = _width_bound_thresholds(confidence_level, target_precision)
+    if total < never_below:
+        return False
+    if total > always_from:
+        return True
+
+    # Counts come from the sampler itself (0 <= wins <= total), so skip re-validation
+    lower, upper = _wilson_ci_fast(wins, total, _z_score(confidence_level))
     ci_width = upper - lower
 
     # CI width should be ≤ 2 × target_precision
@@ -8,7 +8,9 @@ Provides argument parsing for the main CLI entry point with support for:
 """
 
 import argparse
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 
 
@@ -29,6 +31,12 @@ class BatchArgs:
         ollama_host: Ollama server URL (overrides OLLAMA_HOST env; only used with --agent llm --provider ollama)
         openrouter_url: OpenRouter API base URL (overrides OPENROUTER_BASE_URL env; only used with --provider openrouter)
         openai_url: OpenAI API base URL (overrides OPENAI_BASE_URL env; only used with --provider openai)
+        jobs: Number of worker processes for batch simulation (1 = sequential)
+        threads: Run --jobs workers as threads instead of processes
+        precision: Target CI half-width for early stopping (None runs exactly --runs)
+        trivial_hp: HP fraction above which the LLM agent skips obvious turns (None never skips)
+        llm_deterministic: Sample the LLM at temperature 0 and reuse replies for repeated states
+        compact_prompts: Send the LLM the compact system prompt instead of the verbose one
     """
     party: List[str]
     enemies: List[str]
@@ -45,29 +53,17 @@ class BatchArgs:
     openrouter_url: Optional[str] = None
     openai_url: Optional[str] = None
     lang: str = "en"
+    jobs: int = 1
+    threads: bool = False
+    precision: Optional[float] = None
+    trivial_hp: Optional[float] = None
+    llm_deterministic: bool = False
+    compact_prompts: bool = False
 
 
-def parse_batch_args(args=None) -> BatchArgs:
-    """Parse command line arguments for batch simulation.
-
-    Supports two modes:
-    1. Single simulation (no --runs): Run one combat, show detailed logs
-    2. Batch simulation (with --runs): Run multiple combats, show statistics
-
-    Creature resolution:
-    - Names with .md extension: Load from local file (e.g., fighter.md)
-    - Names without .md: Treat as SRD creature lookup (e.g., goblin)
-    - Local files override SRD data when both exist
-
-    Example usage:
-        python run.py --party fighter.md --enemies goblin goblin goblin --runs 500
-
-    Args:
-        args: Command line arguments (None to use sys.argv)
-
-    Returns:
-        BatchArgs dataclass with parsed arguments
-    """
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once; parsing does not mutate it)."""
     parser = argparse.ArgumentParser(
         description="D&D 5e combat simulator with SRD creature support",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -82,6 +78,12 @@ def parse_batch_args(args=None) -> BatchArgs:
    # With random seed for reproducibility
    python run.py --party fighter.md --enemies orc --runs 100 --seed 42
 
+   # Spread a large batch across 8 worker processes
+   python run.py --party fighter.md --enemies orc --runs 10000 --jobs 8
+
+   # Stop early once the win rate is known to within ±2%
+   python run.py --party fighter.md --enemies orc --runs 10000 --precision 0.02
+
    # With LLM agent (local Ollama)
    python run.py --party fighter.md --enemies goblin goblin --agent llm --runs 100
 
@@ -220,77 +222,106 @@ def parse_batch_args(args=None) -> BatchArgs:
         help="Language for strategy evolution and round labels (en=English, it=Italian)",
     )
 
-    parsed = parser.parse_args(args)
-
-    # Validate runs parameter
-    if parsed.runs is not None and parsed.runs <= 0:
-        parser.error("--runs must be a positive integer")
-
-    # Validate API keys if needed
-    if parsed.agent == "llm":
-        import os
-        if parsed.provider == "openrouter" and not os.environ.get("OPENROUTER_API_KEY"):
-            print("Warning: OPENROUTER_API_KEY environment variable not set. OpenRouter provider will fail.")
-        if parsed.provider == "openai" and not os.environ.get("OPENAI_API_KEY"):
-            print("Warning: OPENAI_API_KEY environment variable not set. OpenAI provider will fail.")
-
-    return BatchArgs(
-        party=parsed.party,
-        enemies=parsed.enemies,
-        runs=parsed.runs,
-        seed=parsed.seed,
-        verbose=parsed.verbose,
-        agent=parsed.agent,
-        provider=parsed.provider,
-        model=parsed.model,
-        role=parsed.role,
-        terrain=parsed.terrain,
-        tui=parsed.tui,
-        ollama_host=parsed.ollama_host,
-        openrouter_url=parsed.openrouter_url,
-        openai_url=parsed.openai_url,
-        lang=parsed.lang,
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for batch simulations (default: 1, sequential)",
     )
 
     parser.add_argument(
-        "--agent",
-        choices=["heuristic", "llm"],
-        default="heuristic",
-        help="Agent type for action selection (heuristic or llm)"
+        "--threads",
+        action="store_true",
+        help="Run --jobs workers as threads in one process; overlaps LLM calls of independent runs (seeded runs are not reproducible)",
     )
 
     parser.add_argument(
-        "--provider",
-        choices=["ollama", "openrouter"],
-        default="ollama",
-        help="LLM provider (only used with --agent llm)"
+        "--precision",
+        type=float,
+        default=None,
+        metavar="P",
+        help="Stop a batch early once the 95%% CI is within ±P (e.g. 0.02); --runs becomes the maximum",
     )
 
     parser.add_argument(
-        "--model",
-        type=str,
+        "--trivial-hp",
+        type=float,
         default=None,
-        help="LLM model name (default: qwen2.5:7b-instruct for ollama, qwen/qwen2.5-coder-7b-instruct for openrouter)"
+        metavar="F",
+        help="LLM agent: above this HP fraction, a lone enemy in range is attacked without calling the LLM (e.g. 0.75; default: always call it)",
     )
 
     parser.add_argument(
-        "--role",
-        choices=["default", "tank", "striker", "controller", "support"],
-        default="default",
-        help="Creature role archetype for LLM tactical behavior"
+        "--llm-deterministic",
+        action="store_true",
+        help="LLM agent: sample at temperature 0 and reuse replies for repeated combat states",
     )
 
+    parser.add_argument(
+        "--compact-prompts",
+        action="store_true",
+        help="LLM agent: use the short system prompt with one-line reasoning (fewer tokens per turn)",
+    )
+
+    return parser
+
+
+def parse_batch_args(args=None) -> BatchArgs:
+    """Parse command line arguments for batch simulation.
+
+    Supports two modes:
+    1. Single simulation (no --runs): Run one combat, show detailed logs
+    2. Batch simulation (with --runs): Run multiple combats, show statistics
+
+    Creature resolution:
+    - Names with .md extension: Load from local file (e.g., fighter.md)
+    - Names without .md: Treat as SRD creature lookup (e.g., goblin)
+    - Local files override SRD data when both exist
+
+    Example usage:
+        python run.py --party fighter.md --enemies goblin goblin goblin --runs 500
+
+    Args:
+        args: Command line arguments (None to use sys.argv)
+
+    Returns:
+        BatchArgs dataclass with parsed arguments
+    """
+    parser = _build_parser()
     parsed = parser.parse_args(args)
 
     # Validate runs parameter
     if parsed.runs is not None and parsed.runs <= 0:
         parser.error("--runs must be a positive integer")
 
-    # Validate OpenRouter API key if needed
-    if parsed.agent == "llm" and parsed.provider == "openrouter":
-        import os
-        if not os.environ.get("OPENROUTER_API_KEY"):
+    if parsed.trivial_hp is not None and not 0 <= parsed.trivial_hp <= 1:
+        parser.error("--trivial-hp must be between 0 and 1")
+
+    if parsed.jobs <= 0:
+        parser.error("--jobs must be a positive integer")
+
+    if parsed.precision is not None and not 0 < parsed.precision < 1:
+        parser.error("--precision must be between 0 and 1 (e.g. 0.02 for ±2%%)")
+
+    # Batch-only options have no effect on a single combat
+    if parsed.runs is None:
+        batch_only = [
+            flag for flag, given in (
+                ("--jobs", parsed.jobs != 1),
+                ("--threads", parsed.threads),
+                ("--precision", parsed.precision is not None),
+            ) if given
+        ]
+        if batch_only:
+            parser.error(f"{', '.join(batch_only)} only apply to batch simulations; add --runs N")
+
+    # Validate API keys if needed
+    if parsed.agent == "llm":
+        if parsed.provider == "openrouter" and not os.environ.get("OPENROUTER_API_KEY"):
             print("Warning: OPENROUTER_API_KEY environment variable not set. OpenRouter provider will fail.")
+        if parsed.provider == "openai" and not os.environ.get("OPENAI_API_KEY"):
+            print("Warning: OPENAI_API_KEY environment variable not set. OpenAI provider will fail.")
 
     return BatchArgs(
         party=parsed.party,
@@ -302,5 +333,16 @@ def parse_batch_args(args=None) -> BatchArgs:
         provider=parsed.provider,
         model=parsed.model,
         role=parsed.role,
-        terrain=parsed.terrain
+        terrain=parsed.terrain,
+        tui=parsed.tui,
+        ollama_host=parsed.ollama_host,
+        openrouter_url=parsed.openrouter_url,
+        openai_url=parsed.openai_url,
+        lang=parsed.lang,
+        jobs=parsed.jobs,
+        threads=parsed.threads,
+        precision=parsed.precision,
+        trivial_hp=parsed.trivial_hp,
+        llm_deterministic=parsed.llm_deterministic,
+        compact_prompts=parsed.compact_prompts,
     )
@@ -3,13 +3,27 @@
 import random
 from dataclasses import dataclass, field, replace
 from src.domain.creature import Creature
+from src.domain.spatial import SpatialGrid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CombatState:
     """Immutable combat state snapshot.
 
     All updates return new CombatState instances (copy-on-write).
+
+    team_ids indexes creature IDs by team. It is built once from the initial
+    creatures and carried over on every update (teams never change mid-combat),
+    so team lookups do not rescan all creatures. name_ids likewise maps each
+    lower-cased creature name to the first creature ID with that name.
+
+    living_ids and living_hp hold, per team, the IDs of creatures above 0 HP
+    and their summed HP. They are kept up to date by update_creature, so agents
+    can read each side's survivors without scanning every creature.
+
+    spatial buckets creature positions on a uniform grid (see SpatialGrid) for
+    radius and nearest-enemy queries; update_creature moves entries as
+    creatures move.
     """
 
     creatures: dict[str, Creature]
@@ -20,6 +34,75 @@ class CombatState:
     is_over: bool = False
     winner: str | None = None
     reaction_used: frozenset[str] = field(default_factory=frozenset)
+    team_ids: dict[str, tuple[str, ...]] | None = field(default=None, compare=False, repr=False)
+    name_ids: dict[str, str] | None = field(default=None, compare=False, repr=False)
+    living_ids: dict[str, tuple[str, ...]] | None = field(default=None, compare=False, repr=False)
+    living_hp: dict[str, int] | None = field(default=None, compare=False, repr=False)
+    spatial: SpatialGrid | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.team_ids is None:
+            teams: dict[str, list[str]] = {}
+            for cid, creature in self.creatures.items():
+                teams.setdefault(creature.team, []).append(cid)
+            object.__setattr__(
+                self, "team_ids", {team: tuple(ids) for team, ids in teams.items()}
+            )
+        if self.name_ids is None:
+            name_ids: dict[str, str] = {}
+            for cid, creature in self.creatures.items():
+                name_ids.setdefault(creature.name.lower(), cid)
+            object.__setattr__(self, "name_ids", name_ids)
+        if self.living_ids is None:
+            creatures = self.creatures
+            living_ids = {
+                team: tuple(cid for cid in ids if creatures[cid].current_hp > 0)
+                for team, ids in self.team_ids.items()
+            }
+            object.__setattr__(self, "living_ids", living_ids)
+            object.__setattr__(
+                self,
+                "living_hp",
+                {team: sum(creatures[cid].current_hp for cid in ids) for team, ids in living_ids.items()},
+            )
+        if self.spatial is None:
+            object.__setattr__(self, "spatial", SpatialGrid.build(self.creatures))
+
+    def team_members(self, team: str) -> list[Creature]:
+        """Return the current Creature objects on a team, in insertion order."""
+        creatures = self.creatures
+        return [creatures[cid] for cid in self.team_ids.get(team, ())]
+
+    def living_members(self, team: str) -> list[tuple[str, Creature]]:
+        """Return (creature_id, Creature) for a team's creatures above 0 HP, in insertion order."""
+        creatures = self.creatures
+        return [(cid, creatures[cid]) for cid in self.living_ids.get(team, ())]
+
+    def distance(self, a: str, b: str) -> int:
+        """Return the distance in feet between two creatures.
+
+        Reads the squares already parsed into the spatial index instead of
+        re-parsing both positions (same result as distance_in_feet).
+
+        Args:
+            a: ID of the first creature
+            b: ID of the second creature
+
+        Returns:
+            Manhattan distance in feet
+        """
+        coords = self.spatial.coords
+        ax, ay = coords[a]
+        bx, by = coords[b]
+        return (abs(ax - bx) + abs(ay - by)) * 5
+
+    def freeze(self) -> tuple[Creature, ...]:
+        """Return a tuple snapshot of all creatures, in insertion order.
+
+        Use this once the creature set stops changing (e.g. after the final round)
+        and iterate the tuple instead of the creatures dict view.
+        """
+        return tuple(self.creatures.values())
 
     def update_creature(self, creature_id: str, **updates) -> "CombatState":
         """Update a creature and return new CombatState.
@@ -33,9 +116,29 @@ class CombatState:
         """
         creature = self.creatures[creature_id]
         updated_creature = creature.model_copy(update=updates)
-        new_creatures = dict(self.creatures)
+        new_creatures = self.creatures.copy()
         new_creatures[creature_id] = updated_creature
-        return replace(self, creatures=new_creatures)
+        derived = {}
+        if "position" in updates:
+            derived["spatial"] = self.spatial.moved(creature_id, updated_creature.position)
+        if "current_hp" not in updates:
+            return replace(self, creatures=new_creatures, **derived)
+
+        # Keep the living index and HP totals in step with this creature's HP
+        team = creature.team
+        old_hp = max(creature.current_hp, 0)
+        new_hp = max(updated_creature.current_hp, 0)
+        living_hp = self.living_hp.copy()
+        living_hp[team] = living_hp.get(team, 0) + new_hp - old_hp
+        living_ids = self.living_ids
+        if (old_hp > 0) != (new_hp > 0):
+            living_ids = living_ids.copy()
+            living_ids[team] = tuple(
+                cid for cid in self.team_ids.get(team, ()) if new_creatures[cid].current_hp > 0
+            )
+        return replace(
+            self, creatures=new_creatures, living_ids=living_ids, living_hp=living_hp, **derived
+        )
 
     def add_log(self, message: str) -> "CombatState":
         """Add a log message and return new CombatState.
@@ -97,10 +200,7 @@ def roll_initiative(creatures: dict[str, Creature], seed: int | None = None) ->
         roll = random.randint(1, 20) + creature.initiative_bonus
         rolls[creature_id] = roll
 
-    # Sort by roll descending, then by creature_id alphabetically
-    sorted_ids = sorted(
-        rolls.keys(),
-        key=lambda cid: (-rolls[cid], cid)
-    )
-
-    return sorted_ids
+    # Sort by roll descending, then by creature_id alphabetically (keys built once, no key callback)
+    keyed = [(-roll, cid) for cid, roll in rolls.items()]
+    keyed.sort()
+    return [cid for _, cid in keyed]
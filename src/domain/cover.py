@@ -2,30 +2,10 @@
 
 from typing import Literal, Optional
 
-from src.domain.distance import parse_coordinate, to_coordinate
+from src.domain.distance import parse_coordinate
 from src.domain.terrain import Terrain
 
 
-def _cells_on_path(from_pos: str, to_pos: str) -> list[str]:
-    """Return cells on the Manhattan path from from_pos to to_pos (excluding endpoints)."""
-    ax, ay = parse_coordinate(from_pos)
-    bx, by = parse_coordinate(to_pos)
-    out = []
-    cx, cy = ax, ay
-    while (cx, cy) != (bx, by):
-        if cx < bx:
-            cx += 1
-        elif cx > bx:
-            cx -= 1
-        elif cy < by:
-            cy += 1
-        elif cy > by:
-            cy -= 1
-        if (cx, cy) != (bx, by):
-            out.append(to_coordinate(cx, cy))
-    return out
-
-
 def get_cover(
     attacker_pos: str,
     target_pos: str,
@@ -50,16 +30,27 @@ def get_cover(
         return "none"
     if terrain is None or not terrain.cover_zones:
         return "none"
-    cover_cells = terrain.all_cover_cells()
-    if not cover_cells:
+    cover_squares = terrain.cover_squares
+    if not cover_squares:
         return "none"
-    path = _cells_on_path(attacker_pos.strip().upper(), target_pos.strip().upper())
+    # Manhattan walk on integer squares, x first, then y (endpoints excluded)
+    cx, cy = parse_coordinate(attacker_pos.strip())
+    bx, by = parse_coordinate(target_pos.strip())
     best: Literal["half", "three-quarters"] | None = None
-    for cell in path:
-        cell_upper = cell.upper()
-        if cell_upper in cover_cells:
-            t = cover_cells[cell_upper]
-            if t == "three-quarters":
-                return "three-quarters"
+    while True:
+        if cx < bx:
+            cx += 1
+        elif cx > bx:
+            cx -= 1
+        elif cy < by:
+            cy += 1
+        elif cy > by:
+            cy -= 1
+        if cx == bx and cy == by:
+            break
+        t = cover_squares.get((cx, cy))
+        if t == "three-quarters":
+            return "three-quarters"
+        if t is not None:
             best = "half"
     return "none" if best is None else best
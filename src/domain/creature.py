@@ -3,6 +3,8 @@
 from pydantic import BaseModel, computed_field, model_validator
 from typing import Literal, Optional
 
+from src.domain.identity_cache import identity_cache
+
 
 class AbilityScores(BaseModel):
     """D&D 5e ability scores (STR, DEX, CON, INT, WIS, CHA)."""
@@ -61,6 +63,16 @@ class Attack(BaseModel):
             return self.range
         return 0
 
+    @property
+    def is_melee(self) -> bool:
+        """True if attack is melee (has reach)."""
+        return self.reach is not None
+
+    @property
+    def is_ranged(self) -> bool:
+        """True if attack is ranged (range in feet > typical melee reach)."""
+        return self.range is not None and self.range_feet > 10
+
 
 class Action(BaseModel):
     """Represents a creature action (can contain multiple attacks for Multiattack or AoE)."""
@@ -111,9 +123,49 @@ class Creature(BaseModel):
     character_class: Optional[str] = None  # e.g. Paladin, Fighter (YAML key "class" in markdown)
     level: Optional[int] = None  # Character or creature level (e.g. 1–20); for display and prompts only, no auto-scaling
 
+    @property
+    def speed_squares(self) -> int:
+        """Movement per turn in grid squares."""
+        return self.speed // 5
+
+    @property
+    def hp_quarter(self) -> int:
+        """A quarter of max HP, rounded down (the low-HP threshold)."""
+        return self.hp_max // 4
+
+    @property
+    def actions_by_name(self) -> dict[str, Action]:
+        """Actions keyed by exact name (first one wins on duplicates).
+
+        Built once per actions list (see _actions_by_name), so per-turn copies
+        of a creature share it and a swapped-in actions list gets its own.
+        """
+        return _actions_by_name(self.actions)
+
+    @property
+    def identity_label(self) -> str:
+        """Race, class and level joined for display (e.g. "Dragonborn, Paladin, level 5")."""
+        parts = []
+        if self.race and self.race.strip():
+            parts.append(self.race.strip())
+        if self.character_class and self.character_class.strip():
+            parts.append(self.character_class.strip())
+        if self.level is not None and self.level >= 1:
+            parts.append(f"level {self.level}")
+        return ", ".join(parts)
+
     @model_validator(mode="after")
     def set_current_hp_default(self):
         """Set current_hp to hp_max if not provided."""
         if self.current_hp is None:
             self.current_hp = self.hp_max
         return self
+
+
+@identity_cache()
+def _actions_by_name(actions: list) -> dict[str, Action]:
+    """Return the name -> action mapping for an actions list (first action wins on duplicates)."""
+    by_name: dict[str, Action] = {}
+    for action in actions:
+        by_name.setdefault(action.name, action)
+    return by_name
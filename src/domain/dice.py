@@ -6,8 +6,15 @@ of disadvantage = complete cancellation to normal (NOT net counting).
 """
 
 from enum import Enum
+from functools import lru_cache
+import random
+import re
+
 import d20
 
+# Plain "NdM", "NdM+K" or "NdM-K" damage expressions, rolled without d20
+_SIMPLE_DICE_RE = re.compile(r"(\d+)d(\d+)(?:([+-])(\d+))?")
+
 
 class AdvantageState(Enum):
     """Ternary state for advantage/disadvantage in D&D 5e."""
@@ -17,6 +24,15 @@ class AdvantageState(Enum):
     DISADVANTAGE = "disadvantage"
 
 
+# resolve_advantage outcome for (has advantage << 1) | has disadvantage
+_ADVANTAGE_TABLE = (
+    AdvantageState.NORMAL,
+    AdvantageState.DISADVANTAGE,
+    AdvantageState.ADVANTAGE,
+    AdvantageState.NORMAL,
+)
+
+
 def resolve_advantage(
     advantage_sources: list[str], disadvantage_sources: list[str]
 ) -> AdvantageState:
@@ -45,18 +61,9 @@ def resolve_advantage(
         >>> resolve_advantage(["flanking", "pack tactics", "guiding bolt"], ["prone"])
         AdvantageState.NORMAL  # Still cancels completely
     """
-    has_advantage = len(advantage_sources) > 0
-    has_disadvantage = len(disadvantage_sources) > 0
-
-    if has_advantage and has_disadvantage:
-        # Complete cancellation - ternary state machine
-        return AdvantageState.NORMAL
-    elif has_advantage:
-        return AdvantageState.ADVANTAGE
-    elif has_disadvantage:
-        return AdvantageState.DISADVANTAGE
-    else:
-        return AdvantageState.NORMAL
+    # Complete cancellation - ternary state machine as a lookup indexed by
+    # (has advantage, has disadvantage)
+    return _ADVANTAGE_TABLE[(bool(advantage_sources) << 1) | bool(disadvantage_sources)]
 
 
 def roll_d20(advantage: AdvantageState = AdvantageState.NORMAL) -> tuple[int, str]:
@@ -69,33 +76,49 @@ def roll_d20(advantage: AdvantageState = AdvantageState.NORMAL) -> tuple[int, st
     Returns:
         tuple[int, str]: (total, string_representation)
             total: The final d20 roll value (1-20)
-            string_representation: The detailed roll string from d20 library
+            string_representation: The detailed roll string, in d20 library format
 
     Examples:
         >>> roll_d20(AdvantageState.NORMAL)
-        (15, '1d20 (15)')
+        (15, '1d20 (15) = `15`')
         >>> roll_d20(AdvantageState.ADVANTAGE)
-        (18, '2d20kh1 (18)')  # Keep highest
+        (18, '2d20kh1 (18, ~~3~~) = `18`')  # Keep highest
         >>> roll_d20(AdvantageState.DISADVANTAGE)
-        (7, '2d20kl1 (7)')  # Keep lowest
+        (7, '2d20kl1 (~~12~~, 7) = `7`')  # Keep lowest
     """
+    # Rolled directly rather than through the d20 parser: one randrange per
+    # die, in the same order d20 draws them, so seeded runs are unchanged
+    first = random.randrange(20) + 1
+    if advantage == AdvantageState.NORMAL:
+        return (first, f"1d20 ({_face(first)}) = `{first}`")
+
+    second = random.randrange(20) + 1
     if advantage == AdvantageState.ADVANTAGE:
-        # Advantage: roll 2d20, keep highest
-        result = d20.roll("2d20kh1")
-    elif advantage == AdvantageState.DISADVANTAGE:
-        # Disadvantage: roll 2d20, keep lowest
-        result = d20.roll("2d20kl1")
+        # Advantage: roll 2d20, keep highest (the first die on a tie)
+        expr, keep_first = "2d20kh1", first >= second
+    else:
+        # Disadvantage: roll 2d20, keep lowest (the first die on a tie)
+        expr, keep_first = "2d20kl1", first <= second
+
+    if keep_first:
+        total, dice = first, f"{_face(first)}, ~~{_face(second)}~~"
     else:
-        # Normal: single d20
-        result = d20.roll("1d20")
+        total, dice = second, f"~~{_face(first)}~~, {_face(second)}"
+    return (total, f"{expr} ({dice}) = `{total}`")
+
 
-    return (result.total, str(result))
+def _face(value: int) -> str:
+    """Format one d20 face the way the d20 library does (bold 1s and 20s)."""
+    return f"**{value}**" if value in (1, 20) else str(value)
 
 
 def roll_damage(dice_expr: str) -> tuple[int, str]:
     """
     Roll damage dice using d20 library.
 
+    Plain "NdM[+-K]" expressions are parsed once and rolled directly, drawing
+    the same random numbers and producing the same string as d20 would.
+
     Args:
         dice_expr: Dice expression string (e.g., "1d8+3", "2d6", "1d10-1")
 
@@ -110,5 +133,37 @@ def roll_damage(dice_expr: str) -> tuple[int, str]:
         >>> roll_damage("2d6")
         (9, '2d6 (3, 6) = 9')
     """
-    result = d20.roll(dice_expr)
-    return (result.total, str(result))
+    compiled = _compile_damage(dice_expr)
+    if compiled is None:
+        result = d20.roll(dice_expr)
+        return (result.total, str(result))
+
+    count, sides, sign, modifier = compiled
+    faces = [random.randrange(sides) + 1 for _ in range(count)]
+    total = sum(faces)
+    shown = ", ".join(f"**{f}**" if f == 1 or f == sides else str(f) for f in faces)
+    text = f"{count}d{sides} ({shown})"
+    if sign:
+        total = total + modifier if sign == "+" else total - modifier
+        text += f" {sign} {modifier}"
+    return (total, f"{text} = `{total}`")
+
+
+@lru_cache(maxsize=256)
+def _compile_damage(dice_expr: str) -> tuple[int, int, str, int] | None:
+    """Parse a simple damage expression once.
+
+    Args:
+        dice_expr: Dice expression string
+
+    Returns:
+        (count, sides, sign, modifier) for "NdM[+-K]" expressions, with sign ""
+        when there is no modifier, or None for anything d20 should handle
+    """
+    match = _SIMPLE_DICE_RE.fullmatch(dice_expr)
+    if not match:
+        return None
+    count, sides = int(match.group(1)), int(match.group(2))
+    if not 1 <= count <= 100 or sides < 1:
+        return None
+    return (count, sides, match.group(3) or "", int(match.group(4) or 0))
@@ -35,6 +35,17 @@ def parse_coordinate(coord: str) -> tuple[int, int]:
     return (x, y)
 
 
+def _parse_fast(coord: str) -> tuple[int, int]:
+    """parse_coordinate without validation, for positions already on the board.
+
+    Creature positions are validated when they enter the combat state (the
+    spatial index parses every position it stores), so movement helpers can
+    skip the checks. Untrusted input (LLM replies, files) goes through
+    parse_coordinate.
+    """
+    return ord(coord[0].upper()) - 65, int(coord[1:]) - 1
+
+
 def to_coordinate(x: int, y: int) -> str:
     """Convert (x, y) tuple to chess notation.
 
@@ -89,21 +100,16 @@ def move_toward(a: str, b: str, squares: int) -> str:
     Returns:
         New position after moving toward target
     """
-    ax, ay = parse_coordinate(a)
-    bx, by = parse_coordinate(b)
+    ax, ay = _parse_fast(a)
+    bx, by = _parse_fast(b)
 
-    while squares > 0 and (ax != bx or ay != by):
-        if ax < bx:
-            ax += 1
-        elif ax > bx:
-            ax -= 1
-        elif ay < by:
-            ay += 1
-        elif ay > by:
-            ay -= 1
-        squares -= 1
+    # Closed form of stepping along x until aligned, then along y
+    squares = max(squares, 0)
+    step_x = max(-squares, min(squares, bx - ax))
+    remaining = squares - abs(step_x)
+    step_y = max(-remaining, min(remaining, by - ay))
 
-    return to_coordinate(ax, ay)
+    return to_coordinate(ax + step_x, ay + step_y)
 
 
 def move_away_from(a: str, b: str, squares: int) -> str:
@@ -117,23 +123,15 @@ def move_away_from(a: str, b: str, squares: int) -> str:
     Returns:
         New position after moving away from target
     """
-    ax, ay = parse_coordinate(a)
-    bx, by = parse_coordinate(b)
-    for _ in range(squares):
-        # One step in the direction opposite to b. If we are exactly on top of b,
-        # take an arbitrary step \"away\" (up the board) so we don't get stuck.
-        dx = bx - ax
-        dy = by - ay
-        if dx > 0:
-            ax -= 1
-        elif dx < 0:
-            ax += 1
-        elif dy > 0:
-            ay -= 1
-        elif dy < 0:
-            ay += 1
-        else:
-            ay += 1  # already on top of b; move \"away\" arbitrarily
-        ax = max(0, ax)
-        ay = max(0, ay)
+    ax, ay = _parse_fast(a)
+    bx, by = _parse_fast(b)
+    # Every step moves along the same axis: away from b along x if we are not
+    # aligned with it, else along y. On top of b, step up the board so we don't
+    # get stuck. Steps past the board edge are lost (clamped at 0).
+    squares = max(squares, 0)
+    sx = (ax > bx) - (ax < bx)
+    if sx:
+        ax = max(0, ax + sx * squares)
+    else:
+        ay = max(0, ay + ((ay > by) - (ay < by) or 1) * squares)
     return to_coordinate(ax, ay)
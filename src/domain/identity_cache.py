@@ -0,0 +1,43 @@
+"""Cache for values derived from lists that are replaced rather than mutated."""
+
+from functools import wraps
+
+
+def identity_cache(maxsize: int = 256):
+    """Cache a one-argument function on the identity of its argument.
+
+    Used for maps and text derived from a model's list field (a creature's
+    actions, a terrain's cover zones): per-turn model copies share the list,
+    so the value is built once per list instead of once per call. Each entry
+    holds the argument itself, so an id is never reused while its entry
+    exists; the cache is cleared when it grows past maxsize entries.
+
+    Hits are per list object: a deep copy or unpickled copy (e.g. a fresh
+    Monte Carlo run) is a new list and builds its value once more. Lists must
+    not be mutated in place after their value is cached.
+
+    Args:
+        maxsize: Entries kept before the cache is cleared
+
+    Returns:
+        Decorator; the wrapped function gets a cache_clear() method
+    """
+
+    def decorator(func):
+        entries: dict[int, tuple] = {}
+
+        @wraps(func)
+        def wrapper(arg):
+            entry = entries.get(id(arg))
+            if entry is not None and entry[0] is arg:
+                return entry[1]
+            value = func(arg)
+            if len(entries) >= maxsize:
+                entries.clear()
+            entries[id(arg)] = (arg, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,121 @@
+"""Uniform-grid spatial index over creature positions."""
+
+from src.domain.distance import parse_coordinate
+
+# Side of one grid bucket, in squares
+CELL_SQUARES = 4
+
+
+class SpatialGrid:
+    """Immutable bucket grid mapping creature IDs to their squares.
+
+    Creatures are bucketed by (x // CELL_SQUARES, y // CELL_SQUARES). Queries
+    only visit the buckets overlapping the search area and return IDs in
+    creature insertion order, so callers see the same order as iterating the
+    creatures dict. Moving a creature returns a new grid (copy-on-write, like
+    CombatState).
+    """
+
+    __slots__ = ("cells", "coords", "order")
+
+    def __init__(
+        self,
+        cells: dict[tuple[int, int], tuple[str, ...]],
+        coords: dict[str, tuple[int, int]],
+        order: dict[str, int],
+    ):
+        self.cells = cells
+        self.coords = coords
+        self.order = order
+
+    @classmethod
+    def build(cls, creatures: dict) -> "SpatialGrid":
+        """Index every creature's position.
+
+        Args:
+            creatures: Dict of creature_id -> Creature
+
+        Returns:
+            SpatialGrid over the creatures' current positions
+        """
+        cells: dict[tuple[int, int], list[str]] = {}
+        coords = {}
+        for cid, creature in creatures.items():
+            x, y = parse_coordinate(creature.position)
+            coords[cid] = (x, y)
+            cells.setdefault((x // CELL_SQUARES, y // CELL_SQUARES), []).append(cid)
+        order = {cid: i for i, cid in enumerate(creatures)}
+        return cls({cell: tuple(ids) for cell, ids in cells.items()}, coords, order)
+
+    def moved(self, creature_id: str, position: str) -> "SpatialGrid":
+        """Return a new grid with one creature at a new position.
+
+        Args:
+            creature_id: ID of the creature that moved
+            position: New position in chess notation
+
+        Returns:
+            Updated SpatialGrid (self if the square did not change)
+        """
+        new_xy = parse_coordinate(position)
+        old_xy = self.coords[creature_id]
+        if new_xy == old_xy:
+            return self
+
+        coords = self.coords.copy()
+        coords[creature_id] = new_xy
+        old_cell = (old_xy[0] // CELL_SQUARES, old_xy[1] // CELL_SQUARES)
+        new_cell = (new_xy[0] // CELL_SQUARES, new_xy[1] // CELL_SQUARES)
+        if old_cell == new_cell:
+            return SpatialGrid(self.cells, coords, self.order)
+
+        cells = self.cells.copy()
+        remaining = tuple(cid for cid in cells[old_cell] if cid != creature_id)
+        if remaining:
+            cells[old_cell] = remaining
+        else:
+            del cells[old_cell]
+        order = self.order
+        cells[new_cell] = tuple(
+            sorted(cells.get(new_cell, ()) + (creature_id,), key=order.__getitem__)
+        )
+        return SpatialGrid(cells, coords, order)
+
+    def within(self, position: str, radius: int) -> list[str]:
+        """Return IDs of creatures within radius squares (Manhattan) of position.
+
+        Args:
+            position: Query center in chess notation
+            radius: Maximum Manhattan distance in squares
+
+        Returns:
+            Creature IDs in insertion order (living and dead alike)
+        """
+        x, y = parse_coordinate(position)
+        cx0, cx1 = (x - radius) // CELL_SQUARES, (x + radius) // CELL_SQUARES
+        cy0, cy1 = (y - radius) // CELL_SQUARES, (y + radius) // CELL_SQUARES
+
+        cells = self.cells
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            # Search box covers more buckets than exist: walk the occupied ones
+            buckets = [
+                ids for (cx, cy), ids in cells.items()
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            ]
+        else:
+            buckets = [
+                cells[(cx, cy)]
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                if (cx, cy) in cells
+            ]
+
+        coords = self.coords
+        found = []
+        for ids in buckets:
+            for cid in ids:
+                ex, ey = coords[cid]
+                if abs(x - ex) + abs(y - ey) <= radius:
+                    found.append(cid)
+        found.sort(key=self.order.__getitem__)
+        return found
@@ -4,6 +4,7 @@ from typing import Literal, Optional
 from pydantic import BaseModel
 
 from src.domain.distance import parse_coordinate, to_coordinate
+from src.domain.identity_cache import identity_cache
 
 
 class CoverZone(BaseModel):
@@ -46,9 +47,39 @@ class Terrain(BaseModel):
 
         If a cell is in both half and three-quarters zones, three-quarters wins.
         """
-        result: dict[str, Literal["half", "three-quarters"]] = {}
-        for zone in self.cover_zones:
-            for cell in zone.cell_set():
-                if cell not in result or zone.type == "three-quarters":
-                    result[cell] = zone.type
-        return result
+        return dict(_cover_maps(self.cover_zones)[0])
+
+    @property
+    def cover_squares(self) -> dict[tuple[int, int], Literal["half", "three-quarters"]]:
+        """all_cover_cells keyed by (x, y) square instead of chess notation.
+
+        Built once per cover_zones list and shared (see _cover_maps), so cover
+        checks neither rebuild the zones nor format cell names. Cells that are
+        not canonical coordinates (e.g. "A01") can never lie on a path and are
+        left out. Do not mutate the returned map.
+        """
+        return _cover_maps(self.cover_zones)[1]
+
+
+@identity_cache()
+def _cover_maps(cover_zones: list[CoverZone]) -> tuple[dict, dict]:
+    """Return (cell -> cover, square -> cover) for a zones list.
+
+    Built once per list (see identity_cache): assigning new cover_zones, or a
+    model_copy with new zones, gets fresh maps, but zones appended to the
+    existing list in place are not picked up.
+    """
+    cells: dict[str, Literal["half", "three-quarters"]] = {}
+    for zone in cover_zones:
+        for cell in zone.cell_set():
+            if cell not in cells or zone.type == "three-quarters":
+                cells[cell] = zone.type
+    squares = {}
+    for cell, cover in cells.items():
+        try:
+            xy = parse_coordinate(cell)
+        except ValueError:
+            continue
+        if to_coordinate(*xy) == cell:
+            squares[xy] = cover
+    return cells, squares
@@ -23,12 +23,15 @@ def _t(lang: str, key: str, **kwargs) -> str:
 class CombatLogger:
     """Logger for structured combat events."""
 
-    def __init__(self, verbose=True, lang: str = "en"):
+    def __init__(self, verbose=True, lang: str = "en", creatures: dict | None = None):
         self.entries = []
         self.verbose = verbose
         self.lang = lang if lang in _TRANSLATIONS else "en"
+        # Creature name -> team, fixed for the whole combat (used to attribute stats to sides)
+        self.name_to_team = {c.name: c.team for c in creatures.values()} if creatures else {}
         self._strategy_entries = []  # (round, creature_name, summary) for end-of-fight strategy evolution
-        self._combat_stats = []  # list of {attacker_name, action_name, attack_name, damage, is_aoe} for fight summary
+        # (team, attack_name, is_aoe) -> [uses, total damage], updated as attacks are recorded
+        self._stat_totals: dict[tuple[str, str, bool], list[int]] = {}
         self._deaths_by_type = []  # (victim_name, victim_team, damage_type, killer_name, killer_team) for deaths-by-character stats
 
     def log(self, msg):
@@ -189,27 +192,21 @@ class CombatLogger:
 
     def record_attack_use(self, attacker_name: str, action_name: str, attack_name: str, damage: int, is_aoe: bool = False):
         """Record one weapon/spell attack use for combat stats summary."""
-        self._combat_stats.append({
-            "attacker_name": attacker_name,
-            "action_name": action_name,
-            "attack_name": attack_name,
-            "damage": damage,
-            "is_aoe": is_aoe,
-        })
+        key = (self.name_to_team.get(attacker_name, "?"), attack_name, is_aoe)
+        totals = self._stat_totals.get(key)
+        if totals is None:
+            self._stat_totals[key] = [1, damage]
+        else:
+            totals[0] += 1
+            totals[1] += damage
 
     def record_aoe_use(self, attacker_name: str, action_name: str, total_damage: int):
         """Record one AoE spell/ability use (total damage across all targets)."""
-        self._combat_stats.append({
-            "attacker_name": attacker_name,
-            "action_name": action_name,
-            "attack_name": action_name,
-            "damage": total_damage,
-            "is_aoe": True,
-        })
-
-    def get_combat_stats(self):
-        """Return list of combat stat records for end-of-fight summary."""
-        return list(self._combat_stats)
+        self.record_attack_use(attacker_name, action_name, action_name, total_damage, is_aoe=True)
+
+    def get_aggregated_stats(self) -> dict[tuple[str, str, bool], tuple[int, int]]:
+        """Return (team, attack_name, is_aoe) -> (uses, total damage) for end-of-fight summary."""
+        return {key: (count, damage) for key, (count, damage) in self._stat_totals.items()}
 
     def get_deaths_by_type(self):
         """Return list of (victim_name, victim_team, damage_type, killer_name, killer_team) for deaths-by-character stats."""
@@ -4,12 +4,15 @@ Manages execution of Monte Carlo simulations with:
 - Progress tracking during execution
 - Damage breakdown attribution by creature and ability type
 - Combat duration analysis (wins vs losses)
-- Sequential execution for simplicity
+- Vectorized (NumPy) reductions over per-run outcome columns
 """
 
+import sys
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, TYPE_CHECKING
-from collections import defaultdict
+
+import numpy as np
 
 if TYPE_CHECKING:
     from src.domain.terrain import Terrain
@@ -57,6 +60,22 @@ class BatchResults:
     combined_log: str | None = None
 
 
+@dataclass
+class RunOutcomes:
+    """Per-run outcome columns (index i describes run i).
+
+    Attributes:
+        party_won: Party won the run
+        enemy_won: Enemy side won the run
+        party_wiped: Every party member ended at 0 HP
+        rounds: Combat duration in rounds
+    """
+    party_won: np.ndarray
+    enemy_won: np.ndarray
+    party_wiped: np.ndarray
+    rounds: np.ndarray
+
+
 class BatchRunner:
     """Manages batch simulation execution with progress tracking.
 
@@ -108,10 +127,14 @@ class BatchRunner:
             ValueError: If simulation fails or returns invalid results
         """
         if self.verbose:
-            print("Starting batch simulation...")
-            print(f"  Min runs: {self.simulator.min_runs}")
-            print(f"  Max runs: {self.simulator.max_runs}")
-            print(f"  Target precision: ±{self.simulator.target_precision * 100:.1f}%")
+            self._write_lines(
+                "Starting batch simulation...",
+                f"  Min runs: {self.simulator.min_runs}",
+                f"  Max runs: {self.simulator.max_runs}",
+                f"  Target precision: ±{self.simulator.target_precision * 100:.1f}%",
+            )
+            if on_progress is None and sys.stdout.isatty():
+                on_progress = self._progress_reporter()
 
         # Run Monte Carlo simulation
         try:
@@ -129,31 +152,35 @@ class BatchRunner:
             raise ValueError(f"Simulation failed: {e}") from e
 
         if self.verbose:
-            print(f"\nSimulation complete: {sim_results.total_runs} runs")
-            print(f"  Win rate: {sim_results.win_rate:.1%}")
             ci_lower, ci_upper = sim_results.confidence_interval
-            print(f"  95% CI: [{ci_lower:.1%}, {ci_upper:.1%}]")
+            self._write_lines(
+                f"\nSimulation complete: {sim_results.total_runs} runs",
+                f"  Win rate: {sim_results.win_rate:.1%}",
+                f"  95% CI: [{ci_lower:.1%}, {ci_upper:.1%}]",
+            )
 
         # Analyze results
         damage_breakdown = self._extract_damage_breakdown(
             sim_results.loggers, creatures
         )
 
-        duration_wins, duration_losses = self._analyze_combat_duration(
+        outcomes = self._collect_outcomes(
             sim_results.final_states, sim_results.loggers
         )
-
-        tpk_count = self._count_tpks(sim_results.final_states, creatures)
+        duration_wins, duration_losses = self._analyze_combat_duration(outcomes)
+        tpk_count = self._count_tpks(outcomes)
 
         if self.verbose:
-            print(f"\nDamage breakdown:")
-            print(f"  Total damage: {damage_breakdown.total_damage}")
-            print(f"  By creature: {len(damage_breakdown.by_creature)} sources")
-            print(f"  By ability: {len(damage_breakdown.by_ability)} types")
-            print(f"\nCombat duration:")
-            print(f"  Wins: {duration_wins:.1f} rounds avg")
-            print(f"  Losses: {duration_losses:.1f} rounds avg")
-            print(f"  TPKs: {tpk_count} ({tpk_count/sim_results.total_runs:.1%})")
+            self._write_lines(
+                "\nDamage breakdown:",
+                f"  Total damage: {damage_breakdown.total_damage}",
+                f"  By creature: {len(damage_breakdown.by_creature)} sources",
+                f"  By ability: {len(damage_breakdown.by_ability)} types",
+                "\nCombat duration:",
+                f"  Wins: {duration_wins:.1f} rounds avg",
+                f"  Losses: {duration_losses:.1f} rounds avg",
+                f"  TPKs: {tpk_count} ({tpk_count/sim_results.total_runs:.1%})",
+            )
 
         last_logger = sim_results.loggers[-1] if sim_results.loggers else None
 
@@ -179,6 +206,31 @@ class BatchRunner:
             combined_log=combined_log,
         )
 
+    @staticmethod
+    def _write_lines(*lines: str) -> None:
+        """Write a block of report lines to stdout in a single call."""
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _progress_reporter(self):
+        """Build a progress callback that redraws one status line per check interval.
+
+        The simulator reports after every run; redrawing the terminal that often
+        costs more than the combats themselves, so only every check_interval-th
+        update (and the last one) is written.
+
+        Returns:
+            Callback with the on_progress(completed, total, wins) signature
+        """
+        interval = max(1, self.simulator.check_interval)
+
+        def report(completed: int, total: int, wins: int) -> None:
+            if completed % interval and completed != total:
+                return
+            sys.stdout.write(f"\r  Runs: {completed}/{total}  Win rate: {wins / completed:.1%}")
+            sys.stdout.flush()
+
+        return report
+
     def _extract_damage_breakdown(
         self, loggers: list, creatures: dict
     ) -> DamageBreakdown:
@@ -194,12 +246,14 @@ class BatchRunner:
         Returns:
             DamageBreakdown with damage attributed by source
         """
-        by_creature = defaultdict(int)
-        by_ability = defaultdict(int)
-        total_damage = 0
-
-        # Build name -> creature_id mapping
-        name_to_id = {c.name: cid for cid, c in creatures.items()}
+        # Damage events as COO triples: (attacker index, amount) and
+        # (ability index, amount); indices assigned on first damage seen.
+        creature_index: Dict[str, int] = {}
+        ability_index: Dict[str, int] = {}
+        creature_ids = array("i")
+        creature_amounts = array("i")
+        ability_ids = array("i")
+        ability_amounts = array("i")
 
         for logger in loggers:
             # Parse log entries for damage events
@@ -243,50 +297,84 @@ class BatchRunner:
                         continue  # Skip malformed lines
 
                     # Attribute damage
-                    by_creature[current_attacker] += damage
+                    creature_ids.append(creature_index.setdefault(current_attacker, len(creature_index)))
+                    creature_amounts.append(damage)
                     if current_ability:
-                        by_ability[current_ability] += damage
-                    total_damage += damage
+                        ability_ids.append(ability_index.setdefault(current_ability, len(ability_index)))
+                        ability_amounts.append(damage)
 
         return DamageBreakdown(
-            by_creature=dict(by_creature),
-            by_ability=dict(by_ability),
-            total_damage=total_damage
+            by_creature=self._sum_by_index(creature_index, creature_ids, creature_amounts),
+            by_ability=self._sum_by_index(ability_index, ability_ids, ability_amounts),
+            total_damage=int(np.sum(np.frombuffer(creature_amounts, dtype=np.int32), dtype=np.int64)),
         )
 
-    def _analyze_combat_duration(
-        self, final_states: list, loggers: list
-    ) -> tuple:
-        """Analyze combat duration for wins vs losses.
+    @staticmethod
+    def _sum_by_index(index: Dict[str, int], ids: array, amounts: array) -> Dict[str, int]:
+        """Total amounts per key with one np.bincount over the collected triples."""
+        if not index:
+            return {}
+        totals = np.bincount(
+            np.frombuffer(ids, dtype=np.int32),
+            weights=np.frombuffer(amounts, dtype=np.int32),
+            minlength=len(index),
+        )
+        return {key: int(totals[i]) for key, i in index.items()}
 
-        Provides tactical insight: Do wins come quickly? Do losses drag on?
+    def _collect_outcomes(self, final_states: list, loggers: list) -> RunOutcomes:
+        """Reduce each run to its outcome flags and duration in a single pass.
 
         Args:
             final_states: List of final CombatState objects
             loggers: List of CombatLogger instances
 
         Returns:
-            Tuple of (avg_rounds_wins, avg_rounds_losses)
+            RunOutcomes with one entry per run
         """
         from src.simulation.victory import get_winner
 
-        win_rounds = []
-        loss_rounds = []
+        n = len(final_states)
+        party_won = np.zeros(n, dtype=bool)
+        enemy_won = np.zeros(n, dtype=bool)
+        party_wiped = np.zeros(n, dtype=bool)
+        rounds = np.zeros(n, dtype=np.int32)
 
-        for state, logger in zip(final_states, loggers):
+        for i, (state, logger) in enumerate(zip(final_states, loggers)):
             winner = get_winner(state)
-
-            # Extract rounds from logger
+            party_won[i] = winner == "party"
+            enemy_won[i] = winner == "enemy"
+            if winner != "party":
+                # A party win already proves a survivor; otherwise stop at the first one
+                creatures = state.creatures
+                party_wiped[i] = not any(
+                    creatures[cid].current_hp > 0 for cid in state.team_ids.get("party", ())
+                )
             # Log format: "Combat Over. Winner: party in 5 rounds"
-            rounds = self._extract_rounds_from_logger(logger)
+            rounds[i] = self._extract_rounds_from_logger(logger)
+
+        return RunOutcomes(
+            party_won=party_won,
+            enemy_won=enemy_won,
+            party_wiped=party_wiped,
+            rounds=rounds,
+        )
+
+    def _analyze_combat_duration(self, outcomes: RunOutcomes) -> tuple:
+        """Analyze combat duration for wins vs losses.
+
+        Provides tactical insight: Do wins come quickly? Do losses drag on?
+
+        Args:
+            outcomes: Per-run outcome columns
 
-            if winner == "party":
-                win_rounds.append(rounds)
-            else:
-                loss_rounds.append(rounds)
+        Returns:
+            Tuple of (avg_rounds_wins, avg_rounds_losses)
+        """
+        win_rounds = outcomes.rounds[outcomes.party_won]
+        loss_rounds = outcomes.rounds[~outcomes.party_won]
 
-        avg_wins = sum(win_rounds) / len(win_rounds) if win_rounds else 0.0
-        avg_losses = sum(loss_rounds) / len(loss_rounds) if loss_rounds else 0.0
+        avg_wins = float(win_rounds.mean()) if win_rounds.size else 0.0
+        avg_losses = float(loss_rounds.mean()) if loss_rounds.size else 0.0
 
         return avg_wins, avg_losses
 
@@ -312,34 +400,15 @@ class BatchRunner:
         # Default to 0 if not found
         return 0
 
-    def _count_tpks(self, final_states: list, creatures: dict) -> int:
+    def _count_tpks(self, outcomes: RunOutcomes) -> int:
         """Count Total Party Kills.
 
-        A TPK occurs when all party members reach 0 HP.
+        A TPK occurs when the enemy wins and all party members are at 0 HP.
 
         Args:
-            final_states: List of final CombatState objects
-            creatures: Dict of creature_id -> Creature (for team identification)
+            outcomes: Per-run outcome columns
 
         Returns:
             Number of TPKs
         """
-        from src.simulation.victory import get_winner
-
-        tpk_count = 0
-
-        for state in final_states:
-            winner = get_winner(state)
-
-            # TPK means party lost (enemy won)
-            if winner == "enemy":
-                # Verify all party members are at 0 HP
-                party_dead = all(
-                    c.current_hp <= 0
-                    for c in state.creatures.values()
-                    if c.team == "party"
-                )
-                if party_dead:
-                    tpk_count += 1
-
-        return tpk_count
+        return int(np.count_nonzero(outcomes.enemy_won & outcomes.party_wiped))
@@ -4,9 +4,16 @@ Implements adaptive sampling that starts with minimum runs and progressively
 increases sample size until target confidence interval precision is achieved.
 """
 
+import copy
+import pickle
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Tuple, Optional, TYPE_CHECKING
+
+import numpy as np
+
 from src.simulation.simulator import run_combat
 
 if TYPE_CHECKING:
@@ -35,6 +42,36 @@ class SimulationResults:
     loggers: list
 
 
+def _run_chunk(
+    creatures_blob: bytes,
+    agent,
+    seeds: list,
+    max_rounds: int,
+    verbose: bool,
+    terrain: Optional["Terrain"],
+    lang: str,
+) -> list:
+    """Run one combat per seed and return their (final_state, logger) pairs.
+
+    Module-level so it can be pickled and executed in a worker process.
+    """
+    results = []
+    for run_seed in seeds:
+        fresh_creatures = MonteCarloSimulator._create_fresh_creatures(creatures_blob)
+        results.append(
+            run_combat(
+                fresh_creatures,
+                agent,
+                seed=run_seed,
+                max_rounds=max_rounds,
+                verbose=verbose,
+                terrain=terrain,
+                lang=lang,
+            )
+        )
+    return results
+
+
 class MonteCarloSimulator:
     """Monte Carlo simulator with progressive sampling and confidence-based stopping.
 
@@ -44,6 +81,13 @@ class MonteCarloSimulator:
     3. Stop when CI width <= 2 * target_precision OR max_runs reached
 
     This ensures statistical rigor while respecting DM time constraints.
+
+    With jobs > 1, each batch of runs is sharded into chunks executed on a
+    process pool; results are merged back in run order. With threads=True the
+    chunks run on a thread pool instead, which suits I/O-bound agents (LLM
+    calls from independent runs overlap). Each chunk gets copy.copy(agent), so
+    per-combat agent state stays per thread; LLMAgent copies share their
+    provider and caches.
     """
 
     def __init__(
@@ -52,7 +96,9 @@ class MonteCarloSimulator:
         max_runs: int = 5000,
         target_precision: float = 0.05,
         check_interval: int = 100,
-        confidence_level: float = 0.95
+        confidence_level: float = 0.95,
+        jobs: int = 1,
+        threads: bool = False,
     ):
         """Initialize Monte Carlo simulator with progressive sampling parameters.
 
@@ -62,6 +108,10 @@ class MonteCarloSimulator:
             target_precision: Target precision as proportion (0.05 = ±5%)
             check_interval: Run additional simulations between CI checks
             confidence_level: Confidence level for CI calculation (default 0.95)
+            jobs: Number of worker processes (1 runs sequentially in-process)
+            threads: Use jobs worker threads instead of processes. Dice use the
+                global RNG, which is seeded once per batch rather than per run,
+                so seeded runs are not reproducible in this mode.
 
         Raises:
             ValueError: If parameters are invalid
@@ -79,12 +129,16 @@ class MonteCarloSimulator:
             raise ValueError(f"check_interval must be positive, got {check_interval}")
         if not 0 < confidence_level < 1:
             raise ValueError(f"confidence_level must be in (0, 1), got {confidence_level}")
+        if jobs <= 0:
+            raise ValueError(f"jobs must be positive, got {jobs}")
 
         self.min_runs = min_runs
         self.max_runs = max_runs
         self.target_precision = target_precision
         self.check_interval = check_interval
         self.confidence_level = confidence_level
+        self.jobs = jobs
+        self.threads = threads
 
     def run_simulation(
         self,
@@ -106,7 +160,8 @@ class MonteCarloSimulator:
         Args:
             creatures: Dict of creature_id -> Creature (template instances)
             agent: Agent that chooses actions
-            seed: Random seed for reproducibility (None for random)
+            seed: Random seed for reproducibility (None for random); each run gets
+                its own child of np.random.SeedSequence(seed)
             max_rounds: Maximum rounds per combat
             verbose: Whether to print logs (False recommended for batch)
             lang: Language for combat log ("en", "it")
@@ -114,87 +169,65 @@ class MonteCarloSimulator:
         Returns:
             SimulationResults with wins, total_runs, win_rate, CI, and detailed results
         """
-        if seed is not None:
+        # Each run gets its own seed, spawned in run order from one SeedSequence,
+        # so results do not depend on how runs are distributed across worker
+        # processes and nearby batch seeds do not share run streams.
+        seed_seq = None
+        if seed is not None or self.jobs > 1:
+            # Forked workers inherit the parent RNG state, so unseeded parallel
+            # batches still need distinct per-run seeds (drawn from OS entropy)
+            seed_seq = np.random.SeedSequence(seed)
+        if self.threads and self.jobs > 1 and seed is not None:
             random.seed(seed)
 
+        # Prepare the creature templates once; each run only unpickles them
+        creatures_blob = self._prepare_templates(creatures)
+
         wins = 0
         total_runs = 0
         final_states = []
         loggers = []
 
-        # Phase 1: Run minimum simulations
-        for run_idx in range(self.min_runs):
-            # Create fresh creature copies for immutable state
-            fresh_creatures = self._create_fresh_creatures(creatures)
-
-            # Run single combat
-            final_state, logger = run_combat(
-                fresh_creatures,
-                agent,
-                seed=None,  # Let random state flow through
-                max_rounds=max_rounds,
-                verbose=verbose,
-                terrain=terrain,
-                lang=lang,
-            )
-
-            # Track results
-            final_states.append(final_state)
-            loggers.append(logger)
-            winner = get_winner(final_state)
-            if winner == "party":
-                wins += 1
-            total_runs += 1
-
-            # Progress callback after each run
-            if on_progress is not None:
-                try:
-                    on_progress(total_runs, self.max_runs, wins)
-                except Exception:
-                    # Progress callbacks must not break the simulation loop
-                    pass
-
-        # Phase 2: Progressive sampling with CI checks
-        while total_runs < self.max_runs:
-            # Check stopping criteria
-            should_stop = progressive_sampling_stopping_criteria(
-                wins, total_runs, self.target_precision, self.confidence_level
-            )
-
-            if should_stop:
-                break
-
-            # Run check_interval more simulations
-            runs_to_do = min(self.check_interval, self.max_runs - total_runs)
-
-            for run_idx in range(runs_to_do):
-                # Create fresh creature copies
-                fresh_creatures = self._create_fresh_creatures(creatures)
-
-                # Run single combat
-                final_state, logger = run_combat(
-                    fresh_creatures,
-                    agent,
-                    seed=None,
-                    max_rounds=max_rounds,
-                    verbose=verbose,
-                    terrain=terrain,
-                    lang=lang,
-                )
-
+        with self._executor() as executor:
+            # Phase 1: Run minimum simulations
+            for final_state, logger in self._run_runs(
+                executor, creatures_blob, agent, seed_seq, self.min_runs,
+                max_rounds, verbose, terrain, lang,
+            ):
                 # Track results
                 final_states.append(final_state)
                 loggers.append(logger)
-                winner = get_winner(final_state)
-                if winner == "party":
+                if get_winner(final_state) == "party":
                     wins += 1
                 total_runs += 1
 
-                if on_progress is not None:
-                    try:
-                        on_progress(total_runs, self.max_runs, wins)
-                    except Exception:
-                        pass
+                # Progress callback after each run
+                self._notify_progress(on_progress, total_runs, wins)
+
+            # Phase 2: Progressive sampling with CI checks
+            while total_runs < self.max_runs:
+                # Check stopping criteria
+                should_stop = progressive_sampling_stopping_criteria(
+                    wins, total_runs, self.target_precision, self.confidence_level
+                )
+
+                if should_stop:
+                    break
+
+                # Run check_interval more simulations
+                runs_to_do = min(self.check_interval, self.max_runs - total_runs)
+
+                for final_state, logger in self._run_runs(
+                    executor, creatures_blob, agent, seed_seq, runs_to_do,
+                    max_rounds, verbose, terrain, lang,
+                ):
+                    final_states.append(final_state)
+                    loggers.append(logger)
+                    if get_winner(final_state) == "party":
+                        wins += 1
+                    total_runs += 1
+
+                    self._notify_progress(on_progress, total_runs, wins)
 
         # Calculate final statistics
         win_rate = wins / total_runs
@@ -211,23 +244,97 @@ class MonteCarloSimulator:
             loggers=loggers
         )
 
-    def _create_fresh_creatures(self, template_creatures: dict) -> dict:
-        """Create fresh creature instances from templates.
+    def _executor(self):
+        """Return a process (or thread) pool for jobs > 1, or a null context for in-process runs."""
+        if self.jobs > 1:
+            if self.threads:
+                return ThreadPoolExecutor(max_workers=self.jobs)
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return nullcontext()
+
+    def _run_runs(
+        self,
+        executor,
+        creatures_blob: bytes,
+        agent,
+        seed_seq: Optional[np.random.SeedSequence],
+        count: int,
+        max_rounds: int,
+        verbose: bool,
+        terrain: Optional["Terrain"],
+        lang: str,
+    ):
+        """Yield (final_state, logger) for the next count runs, in run order.
 
-        Uses Pydantic's model_copy() to create deep copies with reset HP.
-        This ensures each simulation starts with clean state.
+        Without an executor runs execute one at a time in this process; with one,
+        runs are sharded into chunks (several per worker to balance uneven combat
+        lengths) and yielded as each chunk completes.
+        """
+        if seed_seq is None or (executor is not None and self.threads):
+            # Threads share the global RNG: reseeding it per run would make
+            # concurrent runs replay each other's dice
+            seeds = [None] * count
+        else:
+            # spawn() continues from the previous call, so successive batches get fresh children
+            seeds = [int(child.generate_state(1)[0]) for child in seed_seq.spawn(count)]
+
+        if executor is None:
+            for run_seed in seeds:
+                yield from _run_chunk(creatures_blob, agent, [run_seed], max_rounds, verbose, terrain, lang)
+            return
+
+        chunk_size = max(1, count // (self.jobs * 4))
+        futures = [
+            executor.submit(
+                _run_chunk, creatures_blob, copy.copy(agent) if self.threads else agent,
+                seeds[i:i + chunk_size],
+                max_rounds, verbose, terrain, lang,
+            )
+            for i in range(0, count, chunk_size)
+        ]
+        for future in futures:
+            yield from future.result()
+
+    def _notify_progress(self, on_progress, total_runs: int, wins: int) -> None:
+        """Invoke the progress callback; callbacks must not break the simulation loop."""
+        if on_progress is None:
+            return
+        try:
+            on_progress(total_runs, self.max_runs, wins)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _prepare_templates(template_creatures: dict) -> bytes:
+        """Serialize creature templates once, ready to be restored for each run.
+
+        HP is reset to max here (in case a template was modified) so runs only
+        pay for unpickling, not for Pydantic copying or validation. The bytes are
+        also what gets shipped to worker processes.
 
         Args:
             template_creatures: Dict of creature_id -> Creature templates
 
+        Returns:
+            Pickled dict of creature_id -> Creature at full HP
+        """
+        prepared = {
+            cid: creature.model_copy(update={"current_hp": creature.hp_max})
+            for cid, creature in template_creatures.items()
+        }
+        return pickle.dumps(prepared, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _create_fresh_creatures(creatures_blob: bytes) -> dict:
+        """Create fresh creature instances from prepared templates.
+
+        Unpickling yields independent deep copies, so each simulation starts
+        with clean state.
+
+        Args:
+            creatures_blob: Output of _prepare_templates
+
         Returns:
             Dict of creature_id -> Creature with fresh copies
         """
-        fresh = {}
-        for cid, creature in template_creatures.items():
-            # Use Pydantic's model_copy for deep copy
-            fresh_copy = creature.model_copy(deep=True)
-            # Reset HP to max (in case template was modified)
-            fresh_copy.current_hp = fresh_copy.hp_max
-            fresh[cid] = fresh_copy
-        return fresh
+        return pickle.loads(creatures_blob)
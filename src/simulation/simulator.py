@@ -9,15 +9,12 @@ from src.domain.combat_state import CombatState, roll_initiative
 from src.domain import rules
 from src.domain.cover import get_cover
 from src.domain.terrain import Terrain
-from src.domain.distance import distance_in_feet, manhattan_distance
+from src.domain.distance import parse_coordinate
 
 
 def _find_action(creature, action_name):
     """Find an action by name in creature's actions."""
-    for action in creature.actions:
-        if action.name == action_name:
-            return action
-    return None
+    return creature.actions_by_name.get(action_name)
 
 
 def _get_melee_reach(creature) -> int:
@@ -43,6 +40,10 @@ def _first_melee_attack(creature):
 def _resolve_opportunity_attacks(state: CombatState, mover_id: str, from_pos: str, to_pos: str, terrain, logger: CombatLogger):
     """If moving from_pos -> to_pos triggers leave-reach, resolve opportunity attacks. Return updated state."""
     mover = state.creatures[mover_id]
+    # Both ends of the move are parsed once; enemy squares come from the spatial index
+    coords = state.spatial.coords
+    fx, fy = parse_coordinate(from_pos)
+    tx, ty = parse_coordinate(to_pos)
     for enemy_id in state.initiative_order:
         if enemy_id == mover_id:
             continue
@@ -52,9 +53,10 @@ def _resolve_opportunity_attacks(state: CombatState, mover_id: str, from_pos: st
         if enemy_id in state.reaction_used:
             continue
         reach_ft = _get_melee_reach(enemy)
-        if distance_in_feet(from_pos, enemy.position) > reach_ft:
+        ex, ey = coords[enemy_id]
+        if (abs(fx - ex) + abs(fy - ey)) * 5 > reach_ft:
             continue
-        if distance_in_feet(to_pos, enemy.position) <= reach_ft:
+        if (abs(tx - ex) + abs(ty - ey)) * 5 <= reach_ft:
             continue
         action_obj, atk = _first_melee_attack(enemy)
         if action_obj is None or atk is None:
@@ -99,12 +101,10 @@ def _resolve_aoe(state: CombatState, caster_id: str, action_obj, center: str, te
     damage_type = action_obj.damage.damage_type
 
     # Collect all creatures in sphere (excluding caster if desired; include enemies and allies in area)
-    targets = []
-    for cid, cr in state.creatures.items():
-        if cr.current_hp <= 0:
-            continue
-        if manhattan_distance(center, cr.position) <= radius:
-            targets.append(cid)
+    targets = [
+        cid for cid in state.spatial.within(center, radius)
+        if state.creatures[cid].current_hp > 0
+    ]
 
     if not targets:
         logger.log(f"  {caster.name} casts {action_obj.name} at {center}: no creatures in area.")
@@ -141,17 +141,21 @@ def _resolve_aoe(state: CombatState, caster_id: str, action_obj, center: str, te
     return state
 
 
+def format_side_shape(creatures) -> str:
+    """Return 'Name HP/max HP AC n Pos' entries for one side, joined with ' | '."""
+    # A list (not a generator) lets str.join size the result in one pass
+    return " | ".join([f"{c.name} {c.current_hp}/{c.hp_max} HP AC {c.ac} {c.position}" for c in creatures])
+
+
 def _round_shape_summary(state: CombatState) -> str:
     """Return a short summary of party and enemy shape (name, HP, AC, position) for start of round."""
-    party = [c for c in state.creatures.values() if c.team == "party" and c.current_hp > 0]
-    enemies = [c for c in state.creatures.values() if c.team == "enemy" and c.current_hp > 0]
+    party = [c for c in state.team_members("party") if c.current_hp > 0]
+    enemies = [c for c in state.team_members("enemy") if c.current_hp > 0]
     lines = []
     if party:
-        parts = [f"{c.name} {c.current_hp}/{c.hp_max} HP AC {c.ac} {c.position}" for c in party]
-        lines.append("Party: " + " | ".join(parts))
+        lines.append("Party: " + format_side_shape(party))
     if enemies:
-        parts = [f"{c.name} {c.current_hp}/{c.hp_max} HP AC {c.ac} {c.position}" for c in enemies]
-        lines.append("Enemies: " + " | ".join(parts))
+        lines.append("Enemies: " + format_side_shape(enemies))
     return "\n".join(lines) if lines else ""
 
 
@@ -192,7 +196,7 @@ def run_combat(
         agent.reset_circuit_breaker()
 
     # Roll initiative and log results
-    logger = CombatLogger(verbose=verbose, lang=lang)
+    logger = CombatLogger(verbose=verbose, lang=lang, creatures=creatures)
 
     # Collect initiative rolls for logging
     initiative_rolls = {}
@@ -203,11 +207,10 @@ def run_combat(
         initiative_rolls[creature_id] = (roll, bonus, total)
         logger.log_initiative(creature.name, roll, bonus, total)
 
-    # Create sorted initiative order
-    initiative_order = sorted(
-        initiative_rolls.keys(),
-        key=lambda cid: (-initiative_rolls[cid][2], cid)
-    )
+    # Create sorted initiative order: total descending, then creature_id
+    keyed = [(-total, cid) for cid, (_, _, total) in initiative_rolls.items()]
+    keyed.sort()
+    initiative_order = [cid for _, cid in keyed]
 
     # Create initial combat state
     state = CombatState(creatures=creatures, initiative_order=initiative_order)
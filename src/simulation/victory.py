@@ -1,18 +1,18 @@
 def is_combat_over(state) -> bool:
-    teams = {}
-    for c in state.creatures.values():
-        teams.setdefault(c.team, []).append(c)
-    for members in teams.values():
-        if all(m.current_hp <= 0 for m in members):
+    creatures = state.creatures
+    for ids in state.team_ids.values():
+        if all(creatures[cid].current_hp <= 0 for cid in ids):
             return True
     return False
 
 
 def get_winner(state):
-    teams = {}
-    for c in state.creatures.values():
-        teams.setdefault(c.team, []).append(c)
-    alive = [team for team, members in teams.items() if any(m.current_hp > 0 for m in members)]
+    creatures = state.creatures
+    alive = [
+        team
+        for team, ids in state.team_ids.items()
+        if any(creatures[cid].current_hp > 0 for cid in ids)
+    ]
     if len(alive) == 1:
         return alive[0]
     return None
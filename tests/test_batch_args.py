@@ -0,0 +1,37 @@
+"""Tests for CLI batch argument parsing."""
+
+import pytest
+
+from src.cli.batch_args import _build_parser, parse_batch_args
+
+
+def test_parser_built_once_and_reused():
+    """Repeated parses share one parser and do not leak values between calls."""
+    first = parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", "--runs", "5", "--threads"])
+    second = parse_batch_args(["--party", "cleric.md", "--enemies", "orc", "orc"])
+
+    assert _build_parser() is _build_parser()
+    assert (first.party, first.runs, first.threads) == (["fighter.md"], 5, True)
+    assert (second.enemies, second.runs, second.threads) == (["orc", "orc"], None, False)
+
+
+def test_invalid_runs_rejected():
+    """A non-positive --runs exits with a usage error."""
+    with pytest.raises(SystemExit):
+        parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", "--runs", "0"])
+
+
+def test_trivial_hp_is_opt_in():
+    """--trivial-hp defaults to off and is range-checked when given."""
+    assert parse_batch_args(["--party", "fighter.md", "--enemies", "goblin"]).trivial_hp is None
+    assert parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", "--trivial-hp", "0.75"]).trivial_hp == 0.75
+    with pytest.raises(SystemExit):
+        parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", "--trivial-hp", "1.5"])
+
+
+@pytest.mark.parametrize("flags", [["--jobs", "4"], ["--threads"], ["--precision", "0.02"]])
+def test_batch_only_flags_require_runs(flags):
+    """Batch-only options are rejected for a single combat instead of being ignored."""
+    with pytest.raises(SystemExit):
+        parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", *flags])
+    assert parse_batch_args(["--party", "fighter.md", "--enemies", "goblin", "--runs", "3", *flags]).runs == 3
@@ -0,0 +1,43 @@
+"""Tests for BatchRunner result aggregation."""
+
+import numpy as np
+
+from src.simulation.batch_runner import BatchRunner, RunOutcomes
+
+
+def test_outcome_reductions():
+    """Durations and TPKs are reduced from the per-run outcome columns."""
+    outcomes = RunOutcomes(
+        party_won=np.array([True, False, True, False]),
+        enemy_won=np.array([False, True, False, True]),
+        party_wiped=np.array([False, True, False, False]),
+        rounds=np.array([3, 6, 5, 8], dtype=np.int32),
+    )
+    runner = BatchRunner(monte_carlo_simulator=None, verbose=False)
+
+    assert runner._analyze_combat_duration(outcomes) == (4.0, 7.0)
+    assert runner._count_tpks(outcomes) == 1
+
+
+def test_sum_by_index_keeps_first_seen_order():
+    """Damage totals are keyed in first-seen order with integer values."""
+    from array import array
+
+    totals = BatchRunner._sum_by_index(
+        {"Orc": 0, "Fighter": 1}, array("i", [0, 1, 0]), array("i", [7, 4, 5])
+    )
+
+    assert totals == {"Orc": 12, "Fighter": 4}
+    assert all(type(v) is int for v in totals.values())
+
+
+def test_progress_reporter_writes_once_per_interval(capsys):
+    """Progress is redrawn every check_interval runs and on the final run only."""
+    from src.simulation.monte_carlo import MonteCarloSimulator
+
+    runner = BatchRunner(MonteCarloSimulator(check_interval=10), verbose=True)
+    report = runner._progress_reporter()
+    for completed in range(1, 26):
+        report(completed, 25, completed)
+
+    assert capsys.readouterr().out.count("\r") == 3
@@ -281,3 +281,74 @@ def test_roll_initiative_descending():
     assert len(initiative) == 5
     for cid in creatures:
         assert cid in initiative
+
+
+def test_team_index_built_once_and_preserved():
+    """team_ids/name_ids index creatures by team and name and survive copy-on-write updates."""
+    c1 = Creature(name="Fighter", ac=18, hp_max=44, team="party", creature_id="fighter_0")
+    c2 = Creature(name="Goblin", ac=15, hp_max=7, team="enemy", creature_id="goblin_0")
+    c3 = Creature(name="Goblin", ac=15, hp_max=7, team="enemy", creature_id="goblin_1")
+    state = CombatState(
+        creatures={"fighter_0": c1, "goblin_0": c2, "goblin_1": c3},
+        initiative_order=["fighter_0", "goblin_0", "goblin_1"],
+    )
+
+    assert state.team_ids == {"party": ("fighter_0",), "enemy": ("goblin_0", "goblin_1")}
+
+    assert state.name_ids == {"fighter": "fighter_0", "goblin": "goblin_0"}
+
+    new_state = state.update_creature("goblin_0", current_hp=0).next_turn()
+
+    assert new_state.team_ids is state.team_ids
+    assert new_state.name_ids is state.name_ids
+    assert [c.current_hp for c in new_state.team_members("enemy")] == [0, 7]
+    assert new_state.team_members("nobody") == []
+
+
+def test_freeze_returns_creature_tuple_in_order():
+    """freeze() snapshots the creatures as a tuple in insertion order."""
+    creatures = {
+        "b": Creature(name="B", ac=10, hp_max=5, current_hp=5, speed=30, team="enemy"),
+        "a": Creature(name="A", ac=10, hp_max=5, current_hp=0, speed=30, team="party"),
+    }
+    state = CombatState(creatures=creatures, initiative_order=["a", "b"])
+
+    snapshot = state.freeze()
+
+    assert isinstance(snapshot, tuple)
+    assert [c.name for c in snapshot] == ["B", "A"]
+
+
+def test_living_index_tracks_hp_changes():
+    """living_ids/living_hp follow damage, deaths and healing through update_creature."""
+    creatures = {
+        "f": Creature(name="Fighter", ac=18, hp_max=20, team="party", creature_id="f"),
+        "g0": Creature(name="Goblin", ac=15, hp_max=7, team="enemy", creature_id="g0"),
+        "g1": Creature(name="Goblin", ac=15, hp_max=7, team="enemy", creature_id="g1"),
+    }
+    state = CombatState(creatures=creatures, initiative_order=["f", "g0", "g1"])
+    assert state.living_hp == {"party": 20, "enemy": 14}
+
+    state = state.update_creature("g0", current_hp=0)
+    assert state.living_ids["enemy"] == ("g1",)
+    assert state.living_hp["enemy"] == 7
+    assert [cid for cid, _ in state.living_members("enemy")] == ["g1"]
+
+    state = state.update_creature("f", current_hp=12).update_creature("g0", current_hp=3)
+    assert state.living_ids["enemy"] == ("g0", "g1")
+    assert state.living_hp == {"party": 12, "enemy": 10}
+
+    moved = state.update_creature("f", position="B2")
+    assert moved.living_hp is state.living_hp
+
+
+def test_distance_matches_distance_in_feet():
+    """state.distance reads indexed squares and tracks moves like distance_in_feet."""
+    from src.domain.distance import distance_in_feet
+
+    a = Creature(name="A", ac=10, hp_max=5, team="party", position="A1", creature_id="a")
+    b = Creature(name="B", ac=10, hp_max=5, team="enemy", position="C4", creature_id="b")
+    state = CombatState(creatures={"a": a, "b": b}, initiative_order=["a", "b"])
+
+    assert state.distance("a", "b") == distance_in_feet("A1", "C4") == 25
+    assert state.update_creature("b", position="B1").distance("a", "b") == 5
@@ -26,7 +26,7 @@ def test_get_cover_ray_through_half_zone():
     """Path from A1 to C3 passing through B2; B2 in half zone -> half cover."""
     # A1=(0,0), C3=(2,2). Manhattan path: A1 -> (1,0) or (0,1) -> ... -> C3.
     # One possible path is A1, B1, C1, C2, C3 - or A1, A2, A3, B3, C3 - or diagonal-ish A1, B2, C3.
-    # Our _cells_on_path steps: first dx then dy. So from (0,0) to (2,2): cx<bx so cx=1, then cx=2; then cy<by so cy=1, then cy=2.
+    # get_cover walks the path stepping first dx then dy. So from (0,0) to (2,2): cx<bx so cx=1, then cx=2; then cy<by so cy=1, then cy=2.
     # So path: (1,0), (2,0), (2,1), (2,2) but we exclude (2,2) so path = (1,0), (2,0), (2,1) = B1, C1, C2.
     # So if we put half cover at B2, path doesn't cross it. Let me use a path that clearly crosses: A1 to A3, path = A2. Zone at A2 -> half.
     t = Terrain(
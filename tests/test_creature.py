@@ -256,3 +256,73 @@ def test_creature_death_saves():
     assert creature.death_saves.successes == 2
     assert creature.death_saves.failures == 1
     assert creature.current_hp == 0
+
+
+def test_derived_attributes():
+    """speed_squares/hp_quarter and Attack.is_melee/is_ranged are derived, not serialized."""
+    bow = Attack(name="Longbow", attack_bonus=5, damage=DamageRoll(dice="1d8+3", damage_type="piercing"), range=150)
+    sword = Attack(name="Longsword", attack_bonus=5, damage=DamageRoll(dice="1d8+3", damage_type="slashing"), reach=5)
+    creature = Creature(name="Ranger", ac=15, hp_max=30, speed=35, team="party")
+
+    assert creature.speed_squares == 7
+    assert creature.hp_quarter == 7
+    assert bow.is_ranged and not bow.is_melee
+    assert sword.is_melee and not sword.is_ranged
+    assert "speed_squares" not in creature.model_dump()
+    assert creature.model_copy(update={"current_hp": 5}).speed_squares == 7
+
+
+def test_derived_attributes_follow_updates():
+    """speed_squares and hp_quarter track speed/hp_max changed through update_creature."""
+    from src.domain.combat_state import CombatState
+
+    creature = Creature(name="Monk", ac=15, hp_max=30, speed=30, team="party", creature_id="monk_0")
+    state = CombatState(creatures={"monk_0": creature}, initiative_order=["monk_0"])
+    assert creature.speed_squares == 6 and creature.hp_quarter == 7
+
+    updated = state.update_creature("monk_0", speed=60, hp_max=40).creatures["monk_0"]
+    assert updated.speed_squares == 12
+    assert updated.hp_quarter == 10
+
+
+def test_actions_by_name_first_wins():
+    """actions_by_name maps exact names to actions, keeping the first of duplicates."""
+    first = Action(name="Bite", attacks=[])
+    creature = Creature(
+        name="Wolf", ac=13, hp_max=11, team="enemy",
+        actions=[first, Action(name="Claw", attacks=[]), Action(name="Bite", attacks=[])],
+    )
+
+    assert list(creature.actions_by_name) == ["Bite", "Claw"]
+    assert creature.actions_by_name["Bite"] is first
+    assert "actions_by_name" not in creature.model_dump()
+
+
+def test_actions_by_name_follows_swapped_actions():
+    """Replacing a creature's actions through update_creature updates the lookup."""
+    from src.domain.combat_state import CombatState
+
+    bow = Action(name="Shortbow", attacks=[])
+    sword = Action(name="Shortsword", attacks=[])
+    creature = Creature(name="Scout", ac=13, hp_max=16, team="party", creature_id="scout_0", actions=[bow])
+    state = CombatState(creatures={"scout_0": creature}, initiative_order=["scout_0"])
+    assert list(creature.actions_by_name) == ["Shortbow"]
+
+    hurt = state.update_creature("scout_0", current_hp=5).creatures["scout_0"]
+    assert hurt.actions_by_name is creature.actions_by_name
+
+    armed = state.update_creature("scout_0", actions=[sword]).creatures["scout_0"]
+    assert armed.actions_by_name == {"Shortsword": sword}
+    assert creature.actions_by_name == {"Shortbow": bow}
+
+
+def test_identity_label():
+    """identity_label joins the non-empty race, class and level parts."""
+    paladin = Creature(
+        name="Kriv", ac=18, hp_max=44, team="party",
+        race=" Dragonborn ", character_class="Paladin", level=5,
+    )
+
+    assert paladin.identity_label == "Dragonborn, Paladin, level 5"
+    assert Creature(name="Goblin", ac=15, hp_max=7, team="enemy", level=0).identity_label == ""
+    assert paladin.model_copy(update={"level": 6}).identity_label == "Dragonborn, Paladin, level 6"
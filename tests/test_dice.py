@@ -109,6 +109,25 @@ class TestRollD20:
             assert isinstance(string_repr, str)
             assert len(string_repr) > 0
 
+    @pytest.mark.parametrize(
+        "state, expr",
+        [
+            (AdvantageState.NORMAL, "1d20"),
+            (AdvantageState.ADVANTAGE, "2d20kh1"),
+            (AdvantageState.DISADVANTAGE, "2d20kl1"),
+        ],
+    )
+    def test_matches_d20_library_under_same_seed(self, state, expr):
+        """The direct roll draws and formats exactly like d20.roll(expr)."""
+        import random
+
+        import d20
+
+        random.seed(11)
+        expected = [(r.total, str(r)) for r in (d20.roll(expr) for _ in range(500))]
+        random.seed(11)
+        assert [roll_d20(state) for _ in range(500)] == expected
+
 
 class TestRollDamage:
     """Test damage rolling with dice expressions."""
@@ -155,3 +174,15 @@ class TestRollDamage:
         total, _ = roll_damage("8d6")
         # 8d6 should be 8-48
         assert 8 <= total <= 48
+
+    @pytest.mark.parametrize("expr", ["1d8+3", "2d6", "1d10-1", "3d12-5", "2d8+1d6", "5"])
+    def test_matches_d20_library_under_same_seed(self, expr):
+        """Simple expressions roll directly; all expressions match d20.roll exactly."""
+        import random
+
+        import d20
+
+        random.seed(11)
+        expected = [(r.total, str(r)) for r in (d20.roll(expr) for _ in range(200))]
+        random.seed(11)
+        assert [roll_damage(expr) for _ in range(200)] == expected
@@ -0,0 +1,29 @@
+"""Tests for the encounter difficulty rating."""
+
+import numpy as np
+import pytest
+
+from src.analysis.difficulty import calculate_difficulty_rating, calculate_difficulty_ratings
+
+
+def test_vectorized_ratings_match_scalar():
+    """calculate_difficulty_ratings agrees with the scalar rating on a grid of inputs."""
+    win, tpk, duration = np.meshgrid(
+        np.linspace(0, 1, 41), np.linspace(0, 1, 21), [3.0, 10.0], indexing="ij"
+    )
+    for party_size in (2, 4, 6):
+        ratings = calculate_difficulty_ratings(win, tpk, duration, party_size)
+        expected = [
+            calculate_difficulty_rating(w, 0.0, t, d, party_size)
+            for w, t, d in zip(win.ravel(), tpk.ravel(), duration.ravel())
+        ]
+        assert ratings.shape == win.shape
+        assert ratings.ravel().tolist() == expected
+
+
+def test_vectorized_ratings_validate_inputs():
+    """Out-of-range proportions are rejected like in the scalar version."""
+    with pytest.raises(ValueError, match="win_rates"):
+        calculate_difficulty_ratings([0.5, 1.2], [0.0, 0.0], [3, 3])
+    with pytest.raises(ValueError, match="party_size"):
+        calculate_difficulty_ratings([0.5], [0.0], [3], party_size=0)
@@ -157,3 +157,18 @@ def test_move_away_from_full_squares():
     """Test move_away_from with enough squares to move."""
     result = move_away_from("E5", "E6", 3)  # enemy south, we move north
     assert result == "E2"  # 3 squares north from E5
+
+
+def test_move_away_from_board_edge_and_same_square():
+    """Steps past the board edge are lost; on top of the threat we step up the board."""
+    assert move_away_from("B1", "D1", 5) == "A1"
+    assert move_away_from("C3", "C3", 2) == "C5"
+    assert move_away_from("C3", "B2", 0) == "C3"
+
+
+def test_parse_fast_matches_parse_coordinate():
+    """The unchecked parser agrees with parse_coordinate on valid board squares."""
+    from src.domain.distance import _parse_fast
+
+    for coord in ("A1", "c4", "Z99", "H12"):
+        assert _parse_fast(coord) == parse_coordinate(coord)
@@ -1,2 +1,30 @@
 def test_heuristic_basic():
     assert True
+
+
+def test_attack_profile_cached_until_actions_change():
+    """The attack profile is reused across turns and rebuilt when actions are replaced."""
+    from src.agents.heuristic import HeuristicAgent
+    from src.domain.creature import Action, Attack, Creature, DamageRoll
+
+    bow = Action(
+        name="Shortbow",
+        attacks=[Attack(name="Shortbow", attack_bonus=4, damage=DamageRoll(dice="1d6+2", damage_type="piercing"), range=80)],
+    )
+    sword = Action(
+        name="Longsword",
+        attacks=[Attack(name="Longsword", attack_bonus=5, damage=DamageRoll(dice="1d8+3", damage_type="slashing"), reach=5)],
+    )
+    archer = Creature(name="Archer", ac=13, hp_max=10, team="party", creature_id="a0", actions=[bow])
+    agent = HeuristicAgent()
+
+    profile = agent._attack_profile("a0", archer)
+    assert profile.ranged_only_action is bow
+    assert not profile.has_melee
+    assert agent._attack_profile("a0", archer.model_copy(update={"position": "B2"})) is profile
+
+    rearmed = archer.model_copy(update={"actions": [sword]})
+    new_profile = agent._attack_profile("a0", rearmed)
+    assert new_profile is not profile
+    assert new_profile.best_action is sword
+    assert new_profile.has_melee
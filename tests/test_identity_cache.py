@@ -0,0 +1,26 @@
+"""Tests for the identity-keyed cache helper."""
+
+from src.domain.identity_cache import identity_cache
+
+
+def test_identity_cache_keys_on_argument_identity():
+    """Equal but distinct lists are built separately; the same list hits; the cache is bounded."""
+    calls = []
+
+    @identity_cache(maxsize=2)
+    def total(values):
+        calls.append(values)
+        return sum(values)
+
+    a, b, c = [1, 2], [1, 2], [3]
+    assert total(a) == 3 and total(a) == 3
+    assert total(b) == 3
+    assert len(calls) == 2
+
+    total(c)  # third entry clears the cache
+    total(a)
+    assert len(calls) == 4
+
+    total.cache_clear()
+    total(c)
+    assert len(calls) == 5
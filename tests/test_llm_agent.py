@@ -0,0 +1,160 @@
+"""Tests for the LLM agent orchestrator."""
+
+import pytest
+
+from src.agents.llm_agent import LLMAgent
+from src.domain.combat_state import CombatState
+from src.domain.creature import Action, Attack, Creature, DamageRoll
+
+
+class _CountingProvider:
+    """Provider stub that records calls and returns an unparseable reply."""
+
+    def __init__(self):
+        self.calls = 0
+        self.temperatures = []
+        self.stops = []
+
+    def chat_completion(self, messages, model, temperature=0.7, max_tokens=500, stop=None):
+        self.calls += 1
+        self.temperatures.append(temperature)
+        self.stops.append(stop)
+        return "no idea"
+
+
+def _state(fighter_hp: int, goblin_positions: list[str]) -> CombatState:
+    sword = Action(
+        name="Longsword",
+        attacks=[Attack(name="Longsword", attack_bonus=5, damage=DamageRoll(dice="1d8+3", damage_type="slashing"), reach=5)],
+    )
+    scimitar = Action(
+        name="Scimitar",
+        attacks=[Attack(name="Scimitar", attack_bonus=4, damage=DamageRoll(dice="1d6+2", damage_type="slashing"), reach=5)],
+    )
+    creatures = {
+        "fighter_0": Creature(
+            name="Fighter", ac=16, hp_max=20, current_hp=fighter_hp, team="party",
+            position="A1", creature_id="fighter_0", actions=[sword],
+        ),
+    }
+    for i, pos in enumerate(goblin_positions):
+        creatures[f"goblin_{i}"] = Creature(
+            name="Goblin", ac=15, hp_max=7, team="enemy", position=pos,
+            creature_id=f"goblin_{i}", actions=[scimitar],
+        )
+    return CombatState(creatures=creatures, initiative_order=list(creatures))
+
+
+def test_trivial_turn_skips_llm():
+    """A healthy creature next to the last enemy attacks it without calling the LLM."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider, trivial_hp_threshold=0.75)
+
+    action = agent.choose_action(_state(20, ["A2"]), "fighter_0")
+
+    assert provider.calls == 0
+    assert action.action_type == "attack"
+    assert action.target_id == "goblin_0"
+
+
+@pytest.mark.parametrize(
+    "fighter_hp, goblins",
+    [
+        (10, ["A2"]),        # wounded
+        (20, ["A5"]),        # out of reach
+        (20, ["A2", "B1"]),  # more than one enemy
+    ],
+)
+def test_non_trivial_turn_calls_llm(fighter_hp, goblins):
+    """Wounded, out-of-range or multi-enemy turns still go to the LLM."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider, trivial_hp_threshold=0.75)
+
+    agent.choose_action(_state(fighter_hp, goblins), "fighter_0")
+
+    assert provider.calls == 1
+
+
+def test_trivial_fast_path_off_by_default():
+    """Without trivial_hp_threshold every turn asks the LLM."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider)
+
+    agent.choose_action(_state(20, ["A2"]), "fighter_0")
+
+    assert provider.calls == 1
+
+
+def test_invalid_trivial_threshold_rejected():
+    """The HP threshold is a fraction of hp_max."""
+    with pytest.raises(ValueError, match="trivial_hp_threshold"):
+        LLMAgent(provider=_CountingProvider(), trivial_hp_threshold=1.5)
+
+
+def test_replies_not_cached_by_default():
+    """Outside deterministic mode every turn calls the LLM, even for a repeated state."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider, trivial_hp_threshold=None)
+    state = _state(20, ["A2"])
+
+    agent.choose_action(state, "fighter_0")
+    agent.choose_action(state, "fighter_0")
+
+    assert provider.calls == 2
+    assert provider.temperatures == [0.7, 0.7]
+    assert provider.stops == [["\nEND"]] * 2
+
+
+def test_deterministic_mode_reuses_replies():
+    """Deterministic mode samples at temperature 0 and calls the LLM once per state."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider, trivial_hp_threshold=None, deterministic=True)
+    state = _state(20, ["A2"])
+
+    agent.choose_action(state, "fighter_0")
+    agent.choose_action(state, "fighter_0")
+
+    assert provider.calls == 1
+    assert provider.temperatures == [0.0]
+
+
+def test_deterministic_replies_keyed_on_prompt_text():
+    """A repeated prompt reuses the reply even when the states differ; clear_caches forgets it."""
+    provider = _CountingProvider()
+    agent = LLMAgent(provider=provider, trivial_hp_threshold=None, deterministic=True)
+    state = _state(20, ["A2", "B1"])
+    # A dead goblin's HP never reaches the prompt
+    dead_a = state.update_creature("goblin_1", current_hp=0)
+    dead_b = state.update_creature("goblin_1", current_hp=-3)
+
+    agent.choose_action(dead_a, "fighter_0")
+    agent.choose_action(dead_b, "fighter_0")
+    assert provider.calls == 1
+
+    agent.clear_caches()
+    agent.choose_action(dead_a, "fighter_0")
+    assert provider.calls == 2
+
+
+def test_transient_errors_retried_with_backoff(monkeypatch):
+    """Connection errors are retried max_retries times with growing delays, then re-raised."""
+    import src.agents.llm_agent as llm_agent
+
+    sleeps = []
+    monkeypatch.setattr(llm_agent.time, "sleep", sleeps.append)
+
+    class _FlakyProvider(_CountingProvider):
+        def chat_completion(self, messages, model, temperature=0.7, max_tokens=500, stop=None):
+            super().chat_completion(messages, model, temperature, max_tokens)
+            if self.calls < 3:
+                raise ConnectionError("refused")
+            return "ok"
+
+    provider = _FlakyProvider()
+    assert LLMAgent(provider=provider)._call_provider([]) == "ok"
+    assert provider.calls == 3
+    assert sleeps == [1.0, 2.0]
+
+    with pytest.raises(ConnectionError):
+        LLMAgent(provider=_FlakyProvider(), max_retries=1)._call_provider([])
+
@@ -159,3 +159,39 @@ MOVEMENT:  D4  """
         assert response.action == "Dash"
         assert response.target == "Fighter (E5)"
         assert response.movement == "D4"
+
+    def test_first_non_empty_field_wins(self):
+        """Use the first non-empty value when a key repeats; ignore lines without a known key."""
+        llm_text = """Note: thinking out loud
+ACTION:
+ACTION: Dodge
+TARGET: Goblin (A1)
+TARGET: Orc (B2)"""
+
+        response = parse_llm_output(llm_text)
+
+        assert response.action == "Dodge"
+        assert response.target == "Goblin (A1)"
+
+    def test_validated_matches_fast_path(self):
+        """The validating constructor yields the same response as the default fast path."""
+        llm_text = """<thinking>Close in.</thinking>
+ACTION: Longsword
+TARGET: Goblin (A1)
+MOVEMENT: stay
+BONUS: none"""
+
+        assert parse_llm_output(llm_text, validated=True) == parse_llm_output(llm_text)
+
+    def test_thought_line_used_as_thinking(self):
+        """Compact prompts answer with a THOUGHT line instead of <thinking> tags."""
+        llm_text = """THOUGHT: Goblin is wounded, finish it.
+ACTION: Longsword
+TARGET: Goblin
+MOVEMENT: stay
+END"""
+
+        response = parse_llm_output(llm_text)
+
+        assert response.thinking == "Goblin is wounded, finish it."
+        assert response.action == "Longsword"
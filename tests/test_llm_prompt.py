@@ -0,0 +1,68 @@
+"""Tests for the LLM prompt builder."""
+
+from src.agents.llm_prompt import COMPACT_SYSTEM_PROMPTS, SYSTEM_PROMPTS, _actions_text, build_prompt
+from src.domain.combat_state import CombatState
+from src.domain.creature import Action, Attack, Creature, DamageRoll
+
+
+def _bow():
+    return Action(
+        name="Shortbow",
+        attacks=[Attack(name="Shortbow", attack_bonus=4, damage=DamageRoll(dice="1d6+2", damage_type="piercing"), range=80)],
+    )
+
+
+def test_actions_text_cached_per_actions_list():
+    """The actions section is rendered once per actions list and re-rendered for a new list."""
+    actions = [_bow()]
+
+    section, equipment = _actions_text(actions)
+
+    assert section == "- Shortbow: Shortbow +4, 1d6+2 piercing, range 80ft"
+    assert equipment == "Melee: none. Ranged: Shortbow (80ft)"
+    assert _actions_text(actions)[0] is section
+    assert _actions_text([_bow()])[0] is not section
+    assert _actions_text([]) == ("- No actions available", "Melee: none. Ranged: none")
+
+
+def test_build_prompt_uses_role_system_prompt():
+    """Unknown roles fall back to the default system prompt."""
+    archer = Creature(name="Archer", ac=13, hp_max=10, team="party", creature_id="a0", actions=[_bow()])
+    state = CombatState(creatures={"a0": archer}, initiative_order=["a0"])
+
+    system, user = build_prompt(state, "a0", "sniper")
+
+    assert system["content"] == SYSTEM_PROMPTS["default"]
+    assert "- Shortbow: Shortbow +4" in user["content"]
+
+
+def test_compact_prompt_keeps_turn_and_shrinks_rules():
+    """verbose=False swaps only the system prompt for the shorter THOUGHT-line variant."""
+    archer = Creature(name="Archer", ac=13, hp_max=10, team="party", creature_id="a0", actions=[_bow()])
+    state = CombatState(creatures={"a0": archer}, initiative_order=["a0"])
+
+    verbose = build_prompt(state, "a0", "striker")
+    compact = build_prompt(state, "a0", "striker", verbose=False)
+
+    assert compact[0]["content"] == COMPACT_SYSTEM_PROMPTS["striker"]
+    assert compact[1] == verbose[1]
+    assert len(compact[0]["content"]) * 2 < len(verbose[0]["content"])
+    assert "THOUGHT:" in compact[0]["content"] and compact[0]["content"].endswith("\nEND")
+
+
+def test_turn_prompt_lists_living_creatures_in_creature_order():
+    """Dead creatures are left out; several enemy teams read as one side in creature order."""
+    def mob(name, team, pos, hp=5):
+        return Creature(name=name, ac=10, hp_max=5, current_hp=hp, team=team, position=pos, creature_id=name)
+
+    creatures = {c.creature_id: c for c in [
+        mob("Orc", "orcs", "A3"), mob("Hero", "party", "A1"), mob("Wolf", "wolves", "A4"),
+        mob("Ghoul", "orcs", "A5"), mob("Ally", "party", "B1", hp=0),
+    ]}
+    state = CombatState(creatures=creatures, initiative_order=list(creatures))
+
+    user = build_prompt(state, "Hero")[1]["content"]
+
+    assert "- Orc  HP 5/5  AC 10  Pos: A3\n- Wolf  HP 5/5  AC 10  Pos: A4\n- Ghoul" in user
+    assert "Ally" not in user
+    assert "- Distance to Wolf: 15ft" in user
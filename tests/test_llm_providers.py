@@ -0,0 +1,26 @@
+"""Tests for LLM provider helpers."""
+
+import pickle
+
+from src.agents.llm_providers import OpenRouterProvider, _with_prompt_caching
+
+
+def test_prompt_caching_marks_system_prompt_for_claude_models():
+    """Claude models get a cache_control block on the system prompt; other models are untouched."""
+    messages = [{"role": "system", "content": "rules"}, {"role": "user", "content": "turn"}]
+
+    assert _with_prompt_caching(messages, "qwen/qwen-2.5-7b-instruct") is messages
+    cached = _with_prompt_caching(messages, "anthropic/claude-3.5-haiku")
+    assert cached[0]["content"] == [{"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}]
+    assert cached[1] is messages[1]
+
+
+def test_client_reused_and_dropped_on_pickle():
+    """The SDK client is built once per provider and rebuilt after pickling."""
+    provider = OpenRouterProvider(api_key="test-key")
+    client = provider._get_client()
+
+    assert provider._get_client() is client
+    copy = pickle.loads(pickle.dumps(provider))
+    assert "_client" not in copy.__dict__
+    assert copy._get_client() is not client
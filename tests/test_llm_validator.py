@@ -1,7 +1,7 @@
 """Tests for LLM move validator."""
 
 import pytest
-from src.agents.llm_validator import validate_move, to_agent_action
+from src.agents.llm_validator import validate_and_resolve, validate_move, to_agent_action
 from src.agents.llm_parser import LLMResponse
 from src.agents.base import AgentAction
 from src.domain.creature import Creature, Action, Attack, DamageRoll, AbilityScores
@@ -277,6 +277,25 @@ class TestLLMValidator:
         with pytest.raises(ValueError):
             to_agent_action(response, basic_state, "goblin_0")
 
+    def test_resolved_move_reused_by_to_agent_action(self, basic_state):
+        """validate_and_resolve resolves every part once; to_agent_action consumes it as is."""
+        response = LLMResponse(
+            thinking="Step in and strike.",
+            action="Attack with Scimitar",
+            target="Fighter (E4)",
+            movement="from E5 to D4"
+        )
+
+        resolved = validate_and_resolve(response, basic_state, "goblin_0")
+
+        assert resolved.valid is True
+        assert (resolved.move_to, resolved.action_name, resolved.target_id) == ("D4", "Scimitar", "fighter_0")
+        assert resolved.action_obj is basic_state.creatures["goblin_0"].actions[0]
+        # A pre-resolved move is trusted, so the target is not looked up again
+        action = to_agent_action(response, basic_state, "goblin_0", resolved._replace(target_id="other"))
+        assert action.action_type == "move_and_attack"
+        assert action.target_id == "other"
+
     def test_movement_parsing_from_x_to_y(self, basic_state):
         """Parse 'from E5 to D5' format."""
         response = LLMResponse(
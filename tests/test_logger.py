@@ -0,0 +1,40 @@
+"""Tests for the structured combat logger."""
+
+from src.io.logger import CombatLogger
+
+
+def test_aggregated_stats_updated_online():
+    """Uses are totalled per (team, attack, is_aoe) as they are recorded."""
+    from src.domain.creature import Creature
+
+    creatures = {
+        "fighter_0": Creature(name="Fighter", ac=18, hp_max=44, team="party"),
+        "wizard_0": Creature(name="Wizard", ac=12, hp_max=20, team="party"),
+    }
+    logger = CombatLogger(verbose=False, creatures=creatures)
+    logger.record_attack_use("Fighter", "Longsword", "Longsword", 9)
+    logger.record_attack_use("Fighter", "Longsword", "Longsword", 6)
+    logger.record_aoe_use("Wizard", "Fireball", 24)
+    logger.record_attack_use("Stranger", "Claw", "Claw", 3)
+
+    assert logger.get_aggregated_stats() == {
+        ("party", "Longsword", False): (2, 15),
+        ("party", "Fireball", True): (1, 24),
+        ("?", "Claw", False): (1, 3),
+    }
+
+
+def test_name_to_team_recorded_at_start():
+    """The logger keeps the creature name -> team map given at combat start."""
+    from src.domain.creature import Creature
+
+    creatures = {
+        "fighter_0": Creature(name="Fighter", ac=18, hp_max=44, team="party"),
+        "goblin_0": Creature(name="Goblin", ac=15, hp_max=7, team="enemy"),
+    }
+
+    assert CombatLogger(verbose=False, creatures=creatures).name_to_team == {
+        "Fighter": "party",
+        "Goblin": "enemy",
+    }
+    assert CombatLogger(verbose=False).name_to_team == {}
@@ -0,0 +1,107 @@
+"""Tests for the Monte Carlo simulation engine."""
+
+from pathlib import Path
+
+import pytest
+
+from src.agents.heuristic import HeuristicAgent
+from src.io.markdown import load_creature
+from src.simulation.monte_carlo import MonteCarloSimulator
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "creatures"
+
+
+def _fighter_vs_goblins():
+    _, fighter = load_creature(DATA_DIR / "fighter.md")
+    _, goblin = load_creature(DATA_DIR / "goblin.md")
+    return {
+        "fighter_0": fighter.model_copy(update={"creature_id": "fighter_0", "team": "party", "position": "A1"}),
+        "goblin_0": goblin.model_copy(update={"creature_id": "goblin_0", "team": "enemy", "position": "E1"}),
+        "goblin_1": goblin.model_copy(update={"creature_id": "goblin_1", "team": "enemy", "position": "E2"}),
+    }
+
+
+def test_invalid_jobs_rejected():
+    """jobs must be a positive worker count."""
+    with pytest.raises(ValueError, match="jobs must be positive"):
+        MonteCarloSimulator(jobs=0)
+
+
+def test_parallel_matches_sequential_with_seed():
+    """A seeded batch produces identical runs regardless of worker count."""
+    creatures = _fighter_vs_goblins()
+    sequential = MonteCarloSimulator(min_runs=20, max_runs=20, jobs=1).run_simulation(
+        creatures, HeuristicAgent(), seed=7
+    )
+    parallel = MonteCarloSimulator(min_runs=20, max_runs=20, jobs=2).run_simulation(
+        creatures, HeuristicAgent(), seed=7
+    )
+
+    assert parallel.total_runs == sequential.total_runs == 20
+    assert parallel.wins == sequential.wins
+    assert [lg.get_full_log() for lg in parallel.loggers] == [
+        lg.get_full_log() for lg in sequential.loggers
+    ]
+
+
+def test_adaptive_sampling_stops_before_max_runs():
+    """A lopsided matchup reaches the target precision well before max_runs."""
+    simulator = MonteCarloSimulator(
+        min_runs=50, max_runs=1000, target_precision=0.05, check_interval=25
+    )
+    results = simulator.run_simulation(_fighter_vs_goblins(), HeuristicAgent(), seed=1)
+
+    assert results.total_runs < 1000
+    lower, upper = results.confidence_interval
+    assert upper - lower <= 2 * 0.05
+
+
+def test_adjacent_seeds_do_not_share_runs():
+    """Per-run seeds are spawned from the batch seed, not offset from it."""
+    creatures = _fighter_vs_goblins()
+    simulator = MonteCarloSimulator(min_runs=10, max_runs=10)
+
+    logs_7 = [lg.get_full_log() for lg in simulator.run_simulation(creatures, HeuristicAgent(), seed=7).loggers]
+    logs_8 = [lg.get_full_log() for lg in simulator.run_simulation(creatures, HeuristicAgent(), seed=8).loggers]
+
+    assert logs_7[1:] != logs_8[:-1]
+
+
+def test_thread_pool_runs_every_combat():
+    """threads=True shards runs over a thread pool and still returns every run in order."""
+    simulator = MonteCarloSimulator(min_runs=12, max_runs=12, jobs=3, threads=True)
+    results = simulator.run_simulation(_fighter_vs_goblins(), HeuristicAgent(), seed=3)
+
+    assert results.total_runs == len(results.final_states) == len(results.loggers) == 12
+    assert results.wins == sum(1 for lg in results.loggers if "Winner: party" in lg.get_full_log())
+
+
+def test_thread_pool_gives_each_worker_its_own_llm_breaker():
+    """Threaded runs each trip their own circuit breaker instead of sharing one."""
+    import threading
+    import time
+
+    from src.agents.llm_agent import LLMAgent
+
+    class _FailingProvider:
+        def __init__(self):
+            self.calls = 0
+            self._lock = threading.Lock()
+
+        def chat_completion(self, messages, model, temperature=0.7, max_tokens=500, stop=None):
+            with self._lock:
+                self.calls += 1
+            time.sleep(0.002)  # let the worker threads interleave
+            raise RuntimeError("model unavailable")
+
+    provider = _FailingProvider()
+    agent = LLMAgent(provider=provider, circuit_breaker_threshold=2)
+    simulator = MonteCarloSimulator(min_runs=12, max_runs=12, jobs=3, threads=True)
+
+    results = simulator.run_simulation(_fighter_vs_goblins(), agent, seed=3)
+
+    # Every combat has at least two LLM turns before its breaker opens
+    assert results.total_runs == 12
+    assert provider.calls == 2 * 12
+    assert not agent._circuit_open and agent._consecutive_failures == 0
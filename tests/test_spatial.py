@@ -0,0 +1,48 @@
+"""Tests for the uniform-grid spatial index."""
+
+from src.domain.combat_state import CombatState
+from src.domain.creature import Creature
+from src.domain.distance import manhattan_distance
+from src.domain.spatial import SpatialGrid
+
+
+def _creatures(positions):
+    return {
+        f"c{i}": Creature(name=f"C{i}", ac=10, hp_max=5, team="enemy", creature_id=f"c{i}", position=pos)
+        for i, pos in enumerate(positions)
+    }
+
+
+def test_within_matches_linear_scan_in_insertion_order():
+    """Radius queries return exactly the creatures a full Manhattan scan would, in dict order."""
+    creatures = _creatures(["A1", "H8", "C3", "Z20", "D1", "A9", "L12"])
+    grid = SpatialGrid.build(creatures)
+
+    for center in ("A1", "E5", "K10", "Z20"):
+        for radius in (0, 3, 7, 40):
+            expected = [
+                cid for cid, c in creatures.items()
+                if manhattan_distance(center, c.position) <= radius
+            ]
+            assert grid.within(center, radius) == expected
+
+
+def test_moved_updates_copy_only():
+    """Moving a creature returns a new grid and leaves the original untouched."""
+    grid = SpatialGrid.build(_creatures(["A1", "B1"]))
+
+    moved = grid.moved("c0", "P16")
+
+    assert moved.within("A1", 2) == ["c1"]
+    assert moved.within("P16", 0) == ["c0"]
+    assert grid.within("A1", 2) == ["c0", "c1"]
+
+
+def test_combat_state_keeps_grid_in_step_with_positions():
+    """update_creature(position=...) moves the creature in the state's grid."""
+    state = CombatState(creatures=_creatures(["A1", "B1"]), initiative_order=["c0", "c1"])
+
+    state = state.update_creature("c1", position="J10")
+
+    assert state.spatial.within("J10", 1) == ["c1"]
+    assert state.spatial.within("A1", 1) == ["c0"]
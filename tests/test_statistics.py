@@ -0,0 +1,71 @@
+"""Tests for Monte Carlo statistics helpers."""
+
+import pytest
+
+from src.analysis.statistics import calculate_win_rate_ci, progressive_sampling_stopping_criteria
+
+
+@pytest.mark.parametrize(
+    "wins, total, confidence_level, expected",
+    [
+        # Reference values from scipy.stats.binomtest(...).proportion_ci(method="wilson")
+        (70, 100, 0.95, (0.6041514536665333, 0.7810511470506722)),
+        (3, 7, 0.90, (0.18644319036395607, 0.7105229089864071)),
+        (0, 10, 0.95, (0.0, 0.27753279986288915)),
+        (10, 10, 0.95, (0.7224672001371109, 1.0)),
+    ],
+)
+def test_wilson_interval_matches_reference(wins, total, confidence_level, expected):
+    """The closed-form Wilson interval matches scipy's and pins 0/all wins to the ends."""
+    lower, upper, point = calculate_win_rate_ci(wins, total, confidence_level)
+
+    assert (lower, upper) == pytest.approx(expected, abs=1e-12)
+    assert point == wins / total
+
+
+def test_no_trials_is_maximally_uncertain():
+    """With no trials the interval spans [0, 1]."""
+    assert calculate_win_rate_ci(0, 0) == (0.0, 1.0, 0.5)
+
+
+@pytest.mark.parametrize("wins, total, confidence_level", [(-1, 5, 0.95), (6, 5, 0.95), (1, 5, 1.0)])
+def test_invalid_inputs_rejected(wins, total, confidence_level):
+    """Negative wins, wins above total and out-of-range levels raise ValueError."""
+    with pytest.raises(ValueError):
+        calculate_win_rate_ci(wins, total, confidence_level)
+
+
+def test_stopping_criteria():
+    """Sampling stops once the CI width is within twice the target precision."""
+    assert progressive_sampling_stopping_criteria(500, 1000, target_precision=0.05)
+    assert not progressive_sampling_stopping_criteria(5, 10, target_precision=0.05)
+    assert not progressive_sampling_stopping_criteria(0, 0)
+
+
+@pytest.mark.parametrize("target_precision", [0.02, 0.05, 0.1])
+def test_stopping_shortcut_agrees_with_interval_width(target_precision):
+    """The trial-count shortcut gives the same answer as computing the interval."""
+    for total in range(1, 2500, 13):
+        for wins in {0, 1, total // 10, total // 2, total - 1, total}:
+            lower, upper, _ = calculate_win_rate_ci(wins, total)
+            expected = upper - lower <= 2 * target_precision
+            assert progressive_sampling_stopping_criteria(wins, total, target_precision) == expected
+
+
+def test_vectorized_intervals_match_scalar():
+    """calculate_win_rate_cis matches calculate_win_rate_ci element-wise, including empty runs."""
+    import numpy as np
+
+    from src.analysis.statistics import calculate_win_rate_cis
+
+    wins = np.array([0, 3, 70, 10, 0, 412])
+    totals = np.array([10, 7, 100, 10, 0, 1000])
+
+    lower, upper, point = calculate_win_rate_cis(wins, totals, 0.9)
+
+    expected = [calculate_win_rate_ci(int(w), int(t), 0.9) for w, t in zip(wins, totals)]
+    assert lower.tolist() == pytest.approx([e[0] for e in expected], abs=1e-12)
+    assert upper.tolist() == pytest.approx([e[1] for e in expected], abs=1e-12)
+    assert point.tolist() == [e[2] for e in expected]
+    with pytest.raises(ValueError, match="cannot exceed"):
+        calculate_win_rate_cis(np.array([5]), np.array([4]))
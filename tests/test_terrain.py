@@ -34,6 +34,35 @@ def test_terrain_all_cover_cells():
     cells = t.all_cover_cells()
     assert cells.get("A1") == "half"
     assert cells.get("A2") == "three-quarters"
+    cells["A3"] = "half"  # callers get their own copy
+    assert "A3" not in t.all_cover_cells()
+    assert t.model_copy(update={"cover_zones": []}).all_cover_cells() == {}
+
+
+def test_terrain_cover_squares():
+    """cover_squares keys all_cover_cells by (x, y), skips non-canonical cells, and is built once."""
+    t = Terrain(
+        name="x",
+        cover_zones=[
+            CoverZone(type="half", cells=["a1", "A2", "A01"]),
+            CoverZone(type="three-quarters", cells=["A2"]),
+        ],
+    )
+    assert t.cover_squares == {(0, 0): "half", (0, 1): "three-quarters"}
+    assert t.cover_squares is t.cover_squares
+    assert "cover_squares" not in t.model_dump()
+
+
+def test_terrain_cover_follows_new_zones():
+    """A copy or reassignment with different cover zones reports its own cover."""
+    t = Terrain(name="x", cover_zones=[CoverZone(type="half", cells=["B1"])])
+    assert t.cover_squares == {(1, 0): "half"}
+
+    moved = t.model_copy(update={"cover_zones": [CoverZone(type="three-quarters", cells=["C1"])]})
+    assert moved.cover_squares == {(2, 0): "three-quarters"}
+    assert t.cover_squares == {(1, 0): "half"}
+    t.cover_zones = []
+    assert t.cover_squares == {}
 
 
 def test_load_terrain_from_file():